@@ -21,6 +21,7 @@ import traceback
 from flask import Flask, render_template, jsonify, request
 from datetime import datetime
 from dotenv import load_dotenv
+from kr_market._snapshot import yahoo_session
 
 # Load environment variables explicitly
 load_dotenv()
@@ -313,7 +314,7 @@ def get_sector(ticker: str) -> str:
     
     # Fetch from yfinance and cache
     try:
-        stock = yf.Ticker(ticker)
+        stock = yf.Ticker(ticker, session=yahoo_session())
         info = stock.info
         sector = info.get('sector', '')
         
@@ -395,6 +396,26 @@ def kr_market_status():
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 
+def _read_signals_log(csv_path: str) -> pd.DataFrame:
+    """
+    signals_log 읽기 - signal_tracker 가 함께 쓰는 Parquet 사본(zstd, strategy_mode 파티션)이
+    CSV 보다 새로우면 그쪽을 읽고 (타입 보존, 파싱 없음), 아니면 CSV
+    """
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    if os.path.isdir(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+        try:
+            df = pd.read_parquet(parquet_path)
+            df['strategy_mode'] = df['strategy_mode'].astype(str)
+            # 파티션 순으로 읽힌 행을 CSV 기록 순서로 복원
+            if '_row' in df.columns:
+                df = df.sort_values('_row', kind='stable').drop(columns='_row').reset_index(drop=True)
+            return df
+        except Exception as e:
+            # pyarrow 미설치 / 사본 손상 -> CSV
+            print(f"⚠️ Parquet 시그널 로그 읽기 실패, CSV 사용: {e}")
+    return pd.read_csv(csv_path, encoding='utf-8-sig')
+
+
 @app.route('/api/kr/signals')
 def get_kr_signals():
     """오늘의 VCP + 외인매집 시그널 (Top 20 순위)"""
@@ -408,7 +429,7 @@ def get_kr_signals():
                 'message': '시그널 로그가 없습니다. 먼저 스캔을 실행하세요.'
             })
         
-        df = pd.read_csv(signals_path, encoding='utf-8-sig')
+        df = _read_signals_log(signals_path)
         df['ticker'] = df['ticker'].astype(str).str.zfill(6)
         
         # 종목명 및 시장 정보 로드
@@ -570,7 +591,7 @@ def get_kr_signals():
             # 현재가 조회
             current_prices = {}
             try:
-                data = yf.download(yahoo_tickers, period='1d', progress=False)
+                data = yf.download(yahoo_tickers, period='1d', progress=False, session=yahoo_session())
                 if not data.empty and 'Close' in data.columns:
                     closes = data['Close']
                     if isinstance(closes, pd.Series):
@@ -636,10 +657,12 @@ def get_kr_history(ticker):
         if df.empty:
             try:
                 yahoo_ticker = f"{symbol}.KS"
-                df = yf.download(yahoo_ticker, start=start_date, end=end_date, progress=False)
+                df = yf.download(yahoo_ticker, start=start_date, end=end_date, progress=False,
+                                 session=yahoo_session())
                 if df.empty:
                     yahoo_ticker = f"{symbol}.KQ"  # Try KOSDAQ
-                    df = yf.download(yahoo_ticker, start=start_date, end=end_date, progress=False)
+                    df = yf.download(yahoo_ticker, start=start_date, end=end_date, progress=False,
+                                 session=yahoo_session())
             except Exception as yf_err:
                 print(f"YFinance fetch failed for {ticker}: {yf_err}")
         
@@ -864,7 +887,7 @@ def get_kr_cumulative_return():
         if not os.path.exists(signals_path):
             return jsonify({'error': 'No signals file'}), 404
         
-        df = pd.read_csv(signals_path, encoding='utf-8-sig')
+        df = _read_signals_log(signals_path)
         df['ticker'] = df['ticker'].astype(str).str.zfill(6)
         
         # Get OPEN signals
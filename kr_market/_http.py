@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Naver Finance HTTP Session
+수집 스크립트들이 함께 쓰는 프로세스 단위 requests 세션 - keep-alive 연결과 쿠키를 실행 내내 유지한다.
+FinanceDataReader 도 모듈 단위 requests.get/post 를 세션으로 돌려 종목마다 TLS 핸드셰이크를 반복하지 않게 한다.
+"""
+import os
+import sys
+import threading
+from datetime import datetime, timedelta
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from kr_market._util import KST, next_market_close
+
+# requests-cache - 네이버 HTML 디스크 캐시 (Optional)
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# 캐시 유지 시간 상한 - 실제 만료는 min(상한, 다음 장 마감) (_naver_expire_after)
+NAVER_CACHE_TTL = timedelta(hours=4)
+NAVER_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', '.naver_cache')
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+# 네이버 금융 페이지 인코딩 - 파서에 바이트를 그대로 넘기면서 알려줌 (문자열 디코딩/인코딩 추정 생략)
+NAVER_ENCODING = 'euc-kr'
+
+# 일시 장애/차단(429, 5xx) 시 0.5s, 1s, 2s 간격 재시도 - Retry-After 헤더가 있으면 그 값을 따름
+RETRY = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+              allowed_methods=['GET'], respect_retry_after_header=True)
+
+_session = None
+_fdr_session = None
+_session_lock = threading.Lock()
+
+
+def _naver_expire_after() -> timedelta:
+    """
+    지금 받는 응답의 캐시 유지 시간 - NAVER_CACHE_TTL, 단 다음 15:30 KST 장 마감을 넘기지 않음
+    장중에 캐시된 외국인/기관 잠정 수급 페이지가 마감 후 수집(16:10)에 재사용되지 않도록
+    """
+    now = datetime.now(KST)
+    return min(NAVER_CACHE_TTL, next_market_close(now) - now)
+
+
+if REQUESTS_CACHE_AVAILABLE:
+    class _NaverCachedSession(requests_cache.CachedSession):
+        """요청마다 만료 시각을 계산해 넘기는 CachedSession (세션이 장 마감을 넘겨 살아 있어도 같은 규칙)"""
+
+        def request(self, method, url, *args, expire_after=None, **kwargs):
+            if expire_after is None:
+                expire_after = _naver_expire_after()
+            return super().request(method, url, *args, expire_after=expire_after, **kwargs)
+
+
+def _build_session() -> requests.Session:
+    if REQUESTS_CACHE_AVAILABLE:
+        # 같은 날 재실행 시 종목 HTML 을 디스크 캐시에서 읽음 (네이버 장애 시 만료된 캐시라도 사용)
+        session = _NaverCachedSession(
+            cache_name=NAVER_CACHE_PATH, backend='sqlite',
+            expire_after=NAVER_CACHE_TTL, stale_if_error=True)
+    else:
+        session = requests.Session()
+    # Accept-Encoding 은 requests 기본값 (gzip, deflate / brotli 설치 시 br) 그대로 - 응답은 자동 해제
+    session.headers.update({'User-Agent': USER_AGENT})
+    # 요청이 전부 같은 호스트 - 연결 풀을 동시 요청 수보다 넉넉하게
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=RETRY))
+    return session
+
+
+def get_session() -> requests.Session:
+    """Process-wide Naver session (created on first use)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+class _SessionRequests:
+    """FinanceDataReader 모듈의 `requests` 자리에 넣는 대리 객체 - 호출은 공유 세션으로, 나머지(예외 등)는 requests 그대로"""
+
+    def __init__(self, session: requests.Session):
+        self._session = session
+
+    def get(self, url, **kwargs):
+        return self._session.get(url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._session.post(url, **kwargs)
+
+    def request(self, method, url, **kwargs):
+        return self._session.request(method, url, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+def install_fdr_session(pool_maxsize: int = 32) -> int:
+    """
+    Route FinanceDataReader's module-level requests calls through one keep-alive session.
+    Idempotent; returns the number of FDR modules patched.
+    """
+    global _fdr_session
+    with _session_lock:
+        if _fdr_session is None:
+            # FDR 응답은 캐시하지 않음 (가격 캐시는 signal_tracker 가 따로 관리) - 연결 재사용만
+            _fdr_session = requests.Session()
+            _fdr_session.headers.update({'User-Agent': USER_AGENT})
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=RETRY)
+            _fdr_session.mount('https://', adapter)
+            _fdr_session.mount('http://', adapter)
+
+        proxy = _SessionRequests(_fdr_session)
+        patched = 0
+        for name, module in list(sys.modules.items()):
+            if name.split('.')[0] == 'FinanceDataReader' and getattr(module, 'requests', None) is requests:
+                module.requests = proxy
+                patched += 1
+        return patched
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Signals Log Binary Mirror
+signals_log.csv 의 분석용 컬럼을 고정폭 레코드(16 bytes/row)로 저장하고 np.memmap 으로 읽는다.
+문자열 컬럼(mode/sector/status)은 정수 코드로, 코드표는 옆의 JSON 파일에 둔다.
+"""
+import json
+import os
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+SIGNAL_RECORD_DTYPE = np.dtype([
+    ('date', '<i4'),     # days since epoch
+    ('mode', 'i1'),
+    ('sector', '<i2'),
+    ('score', '<f4'),
+    ('ret', '<f4'),
+    ('status', 'i1'),
+])
+
+# 레코드 필드 -> signals_log 컬럼
+_CODED_FIELDS = {'mode': 'strategy_mode', 'sector': 'sector', 'status': 'status'}
+_FLOAT_FIELDS = {'score': 'score', 'ret': 'return_pct'}
+_NAT_DAYS = np.iinfo(np.int32).min
+
+
+def codes_path(bin_path: str) -> str:
+    return f"{bin_path}.json"
+
+
+def write_signal_binlog(df: pd.DataFrame, bin_path: str):
+    """Write df as fixed-width records; temp files are swapped in so readers never see a partial log."""
+    records = np.zeros(len(df), dtype=SIGNAL_RECORD_DTYPE)
+    meta = {'columns': [], 'codes': {}}
+
+    if 'signal_date' in df.columns:
+        days = pd.to_datetime(df['signal_date'], errors='coerce').to_numpy(dtype='datetime64[D]')
+        records['date'] = np.where(np.isnat(days), _NAT_DAYS, days.astype(np.int64))
+        meta['columns'].append('signal_date')
+
+    for field, col in _CODED_FIELDS.items():
+        if col in df.columns:
+            cat = pd.Categorical(df[col].astype('string'))
+            if len(cat.categories) > np.iinfo(SIGNAL_RECORD_DTYPE[field]).max:
+                raise ValueError(f"too many distinct {col} values for a {SIGNAL_RECORD_DTYPE[field]} code")
+            records[field] = cat.codes
+            meta['codes'][col] = [str(c) for c in cat.categories]
+            meta['columns'].append(col)
+
+    for field, col in _FLOAT_FIELDS.items():
+        if col in df.columns:
+            records[field] = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64)
+            meta['columns'].append(col)
+
+    # 코드표 먼저, 레코드 파일을 나중에 교체 (레코드 mtime 이 CSV 보다 새로울 때만 읽힘)
+    for path, write in ((codes_path(bin_path), lambda f: f.write(json.dumps(meta, ensure_ascii=False).encode('utf-8'))),
+                        (bin_path, records.tofile)):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
+
+
+def read_signal_binlog(bin_path: str, columns: Optional[list] = None) -> pd.DataFrame:
+    """memmap the record file (no text parsing) and expose the logged columns as a DataFrame."""
+    with open(codes_path(bin_path), 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+
+    n_rows = os.path.getsize(bin_path) // SIGNAL_RECORD_DTYPE.itemsize
+    records = (np.memmap(bin_path, dtype=SIGNAL_RECORD_DTYPE, mode='r', shape=(n_rows,))
+               if n_rows else np.zeros(0, dtype=SIGNAL_RECORD_DTYPE))
+    wanted = [c for c in meta['columns'] if columns is None or c in columns]
+
+    data = {}
+    if 'signal_date' in wanted:
+        days = records['date']
+        dates = days.astype('datetime64[D]').astype('datetime64[ns]')
+        dates[days == _NAT_DAYS] = np.datetime64('NaT')
+        data['signal_date'] = dates
+    for field, col in _CODED_FIELDS.items():
+        if col in wanted:
+            data[col] = pd.Categorical.from_codes(records[field], meta['codes'][col])
+    for field, col in _FLOAT_FIELDS.items():
+        if col in wanted:
+            data[col] = records[field]
+
+    return pd.DataFrame(data)[wanted]
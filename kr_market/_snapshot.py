@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yahoo Finance Snapshot Layer
+market_gate / macro_indicators 가 공유하는 Yahoo 세션·crumb 과 시세 스냅샷 캐시.
+같은 심볼(예: USDKRW=X)을 두 모듈이 따로 조회하지 않도록 심볼 단위로 캐시한다.
+"""
+import functools
+import json
+import logging
+import threading
+import time
+from typing import Dict, Iterable, List
+
+import requests
+
+# orjson - 빠른 JSON 파싱 (Optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# curl_cffi (yfinance 의존성) - 브라우저 TLS 지문으로 Yahoo 차단 회피 (Optional)
+try:
+    from curl_cffi import requests as curl_requests
+    CURL_CFFI_AVAILABLE = True
+except ImportError:
+    curl_requests = None
+    CURL_CFFI_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 (일시적 네트워크 오류)
+TRANSIENT_ERRORS = (requests.Timeout, requests.ConnectionError)
+# 조회 실패로 취급할 오류 (HTTP / 응답 파싱) - 그 외 예외는 버그로 보고 전파
+FETCH_ERRORS = (requests.RequestException, KeyError, ValueError, IndexError)
+if CURL_CFFI_AVAILABLE:
+    TRANSIENT_ERRORS += (curl_requests.exceptions.Timeout, curl_requests.exceptions.ConnectionError)
+    FETCH_ERRORS += (curl_requests.exceptions.RequestException,)
+
+
+def retry(tries: int = 3, backoff: float = 0.5, exceptions: tuple = TRANSIENT_ERRORS):
+    """일시적 오류 시 지수 백오프(backoff, 2*backoff, ...)로 재시도"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(tries):
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as e:
+                    if attempt == tries - 1:
+                        raise
+                    delay = backoff * (2 ** attempt)
+                    logger.warning("%s failed (%s), retrying in %.1fs", func.__name__, e, delay)
+                    time.sleep(delay)
+        return wrapper
+    return decorator
+
+
+def _loads_json(content: bytes):
+    """orjson 으로 파싱, NaN/Infinity 등 orjson 이 거부하는 값은 표준 json 으로 재시도"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+YAHOO_QUOTE_URL = "https://query2.finance.yahoo.com/v7/finance/quote"
+YAHOO_CHART_URL = "https://query2.finance.yahoo.com/v8/finance/chart/{symbol}"
+YAHOO_CRUMB_URL = "https://query1.finance.yahoo.com/v1/test/getcrumb"
+YAHOO_COOKIE_URL = "https://fc.yahoo.com"
+
+_yahoo_session = None
+_yahoo_crumb = None
+_yahoo_lock = threading.Lock()
+
+
+def _new_yahoo_session():
+    if CURL_CFFI_AVAILABLE:
+        return curl_requests.Session(impersonate="chrome")
+    session = requests.Session()
+    session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+    return session
+
+
+def yahoo_session():
+    """
+    프로세스 공유 Yahoo 세션 - yfinance 호출에도 session= 으로 넘겨
+    쿠키/커넥션을 재사용한다 (네트워크 호출 없음)
+    """
+    global _yahoo_session
+    with _yahoo_lock:
+        if _yahoo_session is None:
+            _yahoo_session = _new_yahoo_session()
+        return _yahoo_session
+
+
+def _yahoo_auth(refresh: bool = False):
+    """Yahoo 쿠키/crumb 핸드셰이크 (프로세스당 1회, 401 시 세션 새로 발급)"""
+    global _yahoo_session, _yahoo_crumb
+    with _yahoo_lock:
+        if _yahoo_crumb is None or refresh:
+            if _yahoo_session is None or refresh:
+                _yahoo_session = _new_yahoo_session()
+            session = _yahoo_session
+            try:
+                session.get(YAHOO_COOKIE_URL, timeout=5)  # 쿠키 발급용 (404 응답이 정상)
+            except FETCH_ERRORS:
+                pass
+            resp = session.get(YAHOO_CRUMB_URL, timeout=5)
+            resp.raise_for_status()
+            _yahoo_crumb = resp.text.strip()
+        return _yahoo_session, _yahoo_crumb
+
+
+@retry()
+def _yahoo_get(url: str, params: Dict) -> Dict:
+    """crumb 을 붙여 Yahoo API 호출 (401 이면 crumb 재발급 후 1회 재시도)"""
+    session, crumb = _yahoo_auth()
+    params = {**params, "crumb": crumb}
+    resp = session.get(url, params=params, timeout=5)
+    if resp.status_code == 401:
+        session, crumb = _yahoo_auth(refresh=True)
+        params["crumb"] = crumb
+        resp = session.get(url, params=params, timeout=5)
+    resp.raise_for_status()
+    return _loads_json(resp.content)
+
+
+def yahoo_quote(symbols: List[str]) -> Dict[str, Dict]:
+    """
+    Yahoo quote 엔드포인트 일괄 조회 (심볼 여러 개를 1회 HTTP 요청으로)
+    
+    Returns:
+        {symbol: quote} - regularMarketPrice, regularMarketPreviousClose,
+        regularMarketChangePercent, regularMarketVolume 등 포함
+    """
+    data = _yahoo_get(YAHOO_QUOTE_URL, {"symbols": ",".join(symbols)})
+    results = data.get("quoteResponse", {}).get("result") or []
+    return {q["symbol"]: q for q in results if "symbol" in q}
+
+
+def yahoo_chart(symbol: str, range_: str = "5d", interval: str = "1d") -> Dict[str, List]:
+    """
+    Yahoo chart 엔드포인트로 짧은 일봉 조회 (DataFrame 변환 없이 list 반환)
+    
+    Returns:
+        {"close": [...], "volume": [...]} - 종가가 비어 있는 봉은 제외
+    """
+    data = _yahoo_get(YAHOO_CHART_URL.format(symbol=symbol), {"range": range_, "interval": interval})
+    result = (data.get("chart", {}).get("result") or [{}])[0]
+    quote = (result.get("indicators", {}).get("quote") or [{}])[0]
+    closes = quote.get("close") or []
+    volumes = quote.get("volume") or [None] * len(closes)
+    
+    bars = [(c, v) for c, v in zip(closes, volumes) if c is not None]
+    return {
+        "close": [c for c, _ in bars],
+        "volume": [v or 0 for _, v in bars]
+    }
+
+
+SNAPSHOT_TTL = 30  # 초
+
+_snapshot_cache: Dict[str, tuple] = {}   # symbol -> (expires_at, quote)
+_snapshot_lock = threading.Lock()
+
+
+def snapshot(symbols: Iterable[str]) -> Dict[str, Dict]:
+    """
+    심볼별 quote 스냅샷 (SNAPSHOT_TTL 동안 프로세스 내 공유)
+    
+    캐시에 없는 심볼만 모아 1회 yahoo_quote 호출로 채운다.
+    """
+    symbols = list(dict.fromkeys(symbols))
+    with _snapshot_lock:
+        now = time.time()
+        result = {}
+        missing = []
+        for symbol in symbols:
+            entry = _snapshot_cache.get(symbol)
+            if entry and entry[0] > now:
+                result[symbol] = entry[1]
+            else:
+                missing.append(symbol)
+        
+        if missing:
+            fetched = yahoo_quote(missing)
+            expires_at = time.time() + SNAPSHOT_TTL
+            for symbol, quote in fetched.items():
+                _snapshot_cache[symbol] = (expires_at, quote)
+            result.update(fetched)
+    
+    return result
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stock List Loader
+data/stock_list.csv 를 프로세스당 한 번만 파싱 (파일이 다시 생성되면 mtime 이 바뀌어 새로 읽음).
+ticker 는 항상 6자리 문자열 (CSV 에서 숫자로 읽혀 앞자리 0 이 빠지는 것 방지).
+"""
+import os
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+# pyarrow - C++ CSV reader (Optional, 없으면 pandas.read_csv)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+STOCK_LIST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'stock_list.csv')
+
+
+@lru_cache(maxsize=4)
+def _read_stock_list(path: str, mtime_ns: int) -> Tuple[Tuple[Tuple[str, str], ...], Dict[str, str]]:
+    if PYARROW_AVAILABLE:
+        table = pa_csv.read_csv(
+            path,
+            read_options=pa_csv.ReadOptions(encoding='utf-8-sig'),
+            convert_options=pa_csv.ConvertOptions(column_types={'ticker': pa.string(), 'name': pa.string()},
+                                                  include_columns=['ticker', 'name']))
+        tickers, names = table.column('ticker').to_pylist(), table.column('name').to_pylist()
+    else:
+        df = pd.read_csv(path, encoding='utf-8-sig', dtype={'ticker': str, 'name': str}, usecols=['ticker', 'name'])
+        tickers, names = df['ticker'].tolist(), df['name'].tolist()
+
+    pairs = tuple((str(t).zfill(6), n) for t, n in zip(tickers, names))
+    return pairs, dict(pairs)
+
+
+def load_stock_list(path: str = STOCK_LIST_PATH) -> Tuple[List[Tuple[str, str]], Dict[str, str]]:
+    """(ticker, name) 목록과 {ticker: name} 사전 - 같은 파일이면 캐시된 결과를 돌려줌"""
+    path = os.path.abspath(path)
+    pairs, name_map = _read_stock_list(path, os.stat(path).st_mtime_ns)
+    return list(pairs), name_map
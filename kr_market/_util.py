@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+KR Market Shared Helpers
+market_gate / macro_indicators 가 함께 쓰는 파일 TTL 캐시 데코레이터와 구간표(계단식 임계값) 분류.
+"""
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, time as dt_time, timedelta, timezone
+from typing import Dict
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 정규장 마감 (KST, 서머타임 없음) - 마감 전에 받은 데이터는 장중 값이라 마감 후에는 다시 받음
+KST = timezone(timedelta(hours=9))
+MARKET_CLOSE = dt_time(15, 30)
+
+
+def next_market_close(now: datetime = None) -> datetime:
+    """now(KST) 이후 처음 오는 15:30 KST - 오늘 마감 전이면 오늘, 지났으면 다음 날"""
+    now = now or datetime.now(KST)
+    close = datetime.combine(now.date(), MARKET_CLOSE, KST)
+    return close if now < close else close + timedelta(days=1)
+
+
+# Cache settings
+CACHE_DIR = os.path.join(os.path.dirname(__file__), 'data', 'cache')
+os.makedirs(CACHE_DIR, exist_ok=True)
+
+# 지표별 TTL (초) - 갱신 주기에 맞춤
+FX_RATE_TTL = 60            # 환율: 분 단위 변동
+SECTOR_TTL = 300            # 섹터 ETF
+INTEREST_TTL = 3600         # 기준금리
+FX_RESERVES_TTL = 86400     # 외환보유액: 월간 발표
+
+
+def classify(values, bounds: np.ndarray, labels, side: str = 'right'):
+    """
+    계단식 임계값 분류 - 스칼라면 라벨 1개, 배열이면 라벨 배열 반환
+    
+    예) classify(1460, _FX_RISK_BOUNDS, _FX_RISK_LABELS) -> "warning"
+    """
+    idx = np.searchsorted(bounds, values, side=side)
+    if np.ndim(idx) == 0:
+        return labels[int(idx)]
+    return np.asarray(labels, dtype=object)[idx]
+
+# 진행 중인 조회 (key -> Future) - 동시 호출자는 같은 Future 결과를 공유
+_INFLIGHT: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _read_cache(path: str):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        if time.time() < entry['expires_at']:
+            return entry['value']
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def _write_cache(path: str, value, seconds: int):
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'value': value, 'expires_at': time.time() + seconds}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError) as e:
+        print(f"Cache write error ({path}): {e}")
+
+
+def ttl_cache(seconds: int):
+    """
+    파일 기반 TTL 캐시 데코레이터 (CACHE_DIR/<함수명>.json)
+    
+    - 키: 함수명 + 인자
+    - 빈 값 / {"error": ...} 응답은 캐시하지 않음
+    - 같은 키의 동시 호출은 진행 중인 조회(Future)를 기다려 결과를 공유 (업스트림 조회 1회)
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = func.__name__
+            if args or kwargs:
+                arg_repr = repr((args, sorted(kwargs.items())))
+                key += '_' + hashlib.sha1(arg_repr.encode('utf-8')).hexdigest()[:12]
+            path = os.path.join(CACHE_DIR, f"{key}.json")
+            
+            cached = _read_cache(path)
+            if cached is not None:
+                return cached
+            
+            with _inflight_lock:
+                future = _INFLIGHT.get(key)
+                leader = future is None
+                if leader:
+                    future = _INFLIGHT[key] = Future()
+            
+            if not leader:
+                return future.result()
+            
+            try:
+                started = time.perf_counter()
+                value = func(*args, **kwargs)
+                logger.info("%s fetched in %.1fms", func.__name__, (time.perf_counter() - started) * 1000)
+                if value and not (isinstance(value, dict) and 'error' in value):
+                    _write_cache(path, value, seconds)
+                future.set_result(value)
+                return value
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with _inflight_lock:
+                    del _INFLIGHT[key]
+        return wrapper
+    return decorator
@@ -67,7 +67,7 @@ class AIPerformanceTracker:
             if 'return_pct' in action_df.columns and len(action_df) > 0:
                 stats["avg_return"] = float(action_df['return_pct'].mean())
                 stats["total_return"] = float(action_df['return_pct'].sum())
-                stats["win_rate"] = float((action_df['return_pct'] > 0).mean() * 100)
+                stats["win_rate"] = float(np.count_nonzero(action_df['return_pct'].to_numpy() > 0) / len(action_df) * 100)
                 stats["max_return"] = float(action_df['return_pct'].max())
                 stats["min_return"] = float(action_df['return_pct'].min())
             else:
@@ -120,7 +120,7 @@ class AIPerformanceTracker:
                     "range": f"{low}-{high}",
                     "count": len(range_df),
                     "avg_return": float(range_df['return_pct'].mean()),
-                    "win_rate": float((range_df['return_pct'] > 0).mean() * 100)
+                    "win_rate": float(np.count_nonzero(range_df['return_pct'].to_numpy() > 0) / len(range_df) * 100)
                 }
             else:
                 confidence_ranges[label] = {
@@ -193,7 +193,7 @@ class AIPerformanceTracker:
         if len(df) > 0 and 'return_pct' in df.columns:
             perf["total_return"] = float(df['return_pct'].sum())
             perf["avg_return"] = float(df['return_pct'].mean())
-            perf["win_rate"] = float((df['return_pct'] > 0).mean() * 100)
+            perf["win_rate"] = float(np.count_nonzero(df['return_pct'].to_numpy() > 0) / len(df) * 100)
             perf["std_return"] = float(df['return_pct'].std())
             perf["sharpe"] = perf["avg_return"] / perf["std_return"] * np.sqrt(252) if perf["std_return"] > 0 else 0
         else:
@@ -29,6 +29,39 @@ class EvidenceLedger:
         self.data_dir = data_dir or os.path.dirname(os.path.abspath(__file__))
         self.evidence_dir = os.path.join(self.data_dir, 'data', 'evidence')
         os.makedirs(self.evidence_dir, exist_ok=True)
+        # begin_batch() 이후에는 (filepath, packet) 을 모았다가 flush() 에서 기록
+        self._pending = None
+        
+    def begin_batch(self):
+        """스캔 동안 log_signal 파일 기록을 미룸 (flush() 로 한 번에 기록)"""
+        self._pending = []
+        
+    def flush(self) -> int:
+        """
+        모아 둔 evidence packet 을 기록하고 batch 모드 종료. 기록한 파일 수 반환
+        """
+        pending, self._pending = self._pending, None
+        if not pending:
+            return 0
+        
+        # 일자 디렉터리는 묶음당 한 번만 생성
+        for daily_dir in {os.path.dirname(filepath) for filepath, _ in pending}:
+            os.makedirs(daily_dir, exist_ok=True)
+        
+        written = 0
+        for filepath, packet in pending:
+            if self._write_packet(filepath, packet):
+                written += 1
+        return written
+        
+    def _write_packet(self, filepath: str, packet: dict) -> bool:
+        try:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(packet, f, ensure_ascii=False, indent=2, cls=NumpyEncoder)
+            return True
+        except Exception as e:
+            print(f"Failed to log evidence for {packet['ticker']}: {e}")
+            return False
         
     def log_signal(self, ticker: str, gate_results: Dict[str, Any], plan: Any, final_score: int):
         """
@@ -61,15 +94,14 @@ class EvidenceLedger:
         # Save to JSON (Daily partitioned)
         date_str = datetime.now().strftime("%Y%m%d")
         daily_dir = os.path.join(self.evidence_dir, date_str)
-        os.makedirs(daily_dir, exist_ok=True)
         
         filename = f"{ticker}_{datetime.now().strftime('%H%M%S')}.json"
         filepath = os.path.join(daily_dir, filename)
         
-        try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(packet, f, ensure_ascii=False, indent=2, cls=NumpyEncoder)
-        except Exception as e:
-            print(f"Failed to log evidence for {ticker}: {e}")
+        if self._pending is not None:
+            self._pending.append((filepath, packet))
+        else:
+            os.makedirs(daily_dir, exist_ok=True)
+            self._write_packet(filepath, packet)
             
         return filepath
@@ -6,6 +6,7 @@ Implements L0-L5 Gates to filter stocks rigorously.
 """
 from dataclasses import dataclass
 from typing import Dict, Optional
+import numpy as np
 import pandas as pd
 from .config import DEFAULT_TRADE_RULE, DEFAULT_GATE_WEIGHTS
 from .market_gate import get_market_status
@@ -40,10 +41,11 @@ class LiquidityGuard_L1:
             return GateResult(False, 0, "Insufficient Data", {})
             
         # Calculate trailing 20d average turnover
-        # Volume * Close approximates turnover
-        recent = df.tail(20)
-        avg_vol = recent['Volume'].mean()
-        curr_price = recent['Close'].iloc[-1]
+        # Volume * Close approximates turnover (plain NumPy slices, no intermediate frame)
+        vol = df['Volume'].to_numpy(dtype=np.float64)
+        close = df['Close'].to_numpy(dtype=np.float64)
+        avg_vol = np.nanmean(vol[-20:])
+        curr_price = close[-1]
         
         avg_turnover = avg_vol * curr_price
         min_required = DEFAULT_TRADE_RULE.min_volume_krw
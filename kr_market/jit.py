@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+KR Market JIT Helpers
+Numba is optional and imported lazily - decorating a kernel costs nothing,
+numba is loaded and the kernel compiled on its first call. Without numba the
+kernels run as plain Python.
+"""
+import functools
+import importlib.util
+import threading
+import types
+
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+# 컴파일 전/numba 미설치 시 prange 는 range 로 동작 (컴파일 시 numba.prange 로 치환)
+prange = range
+
+_compile_lock = threading.RLock()  # 커널 안에서 다른 지연 커널을 재귀 컴파일
+
+
+class _LazyKernel:
+    """numba.njit 지연 래퍼 - 첫 호출 시 numba import + 컴파일"""
+
+    def __init__(self, func, options):
+        functools.update_wrapper(self, func)
+        self.py_func = func
+        self._options = options
+        self._dispatcher = None
+
+    def _compile(self):
+        if self._dispatcher is None:
+            with _compile_lock:
+                if self._dispatcher is None:
+                    self._dispatcher = _build_dispatcher(self.py_func, self._options)
+        return self._dispatcher
+
+    def __call__(self, *args, **kwargs):
+        return (self._dispatcher or self._compile())(*args, **kwargs)
+
+
+def _build_dispatcher(func, options):
+    """numba Dispatcher 생성 (numba 미설치 시 원본 함수)"""
+    try:
+        import numba
+    except ImportError:
+        return func
+
+    # numba 는 전역 이름을 값으로 해석하므로, 참조하는 prange / 다른 지연 커널을
+    # 실제 numba 객체로 바꾼 전역 dict 로 함수를 다시 만든다 (모듈 전역은 그대로)
+    globals_ = dict(func.__globals__)
+    for name in func.__code__.co_names:
+        value = globals_.get(name)
+        if value is range and name == 'prange':
+            globals_[name] = numba.prange
+        elif isinstance(value, _LazyKernel):
+            globals_[name] = value._compile()
+
+    rebound = types.FunctionType(func.__code__, globals_, func.__name__,
+                                 func.__defaults__, func.__closure__)
+    rebound.__qualname__ = func.__qualname__
+    return numba.njit(**options)(rebound)
+
+
+def njit(*args, **kwargs):
+    """Lazy stand-in for numba.njit (supports bare and parameterized use)"""
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return _LazyKernel(args[0], {})
+
+    def decorator(func):
+        return _LazyKernel(func, kwargs)
+    return decorator
@@ -16,10 +16,17 @@ except ImportError:
 import pandas as pd
 import os
 import json
+import hashlib
+import sqlite3
+import time
+from contextlib import closing
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
-import yfinance as yf
+
+from kr_market.jit import njit
+from kr_market._snapshot import yahoo_session
+from kr_market._stock_list import load_stock_list
 
 load_dotenv()
 
@@ -27,6 +34,77 @@ OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 # Validates both GOOGLE_API_KEY and GEMINI_API_KEY for user convenience
 GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY') or os.getenv('GEMINI_API_KEY')
 
+# LLM 클라이언트는 모듈 로드 시 1회 생성 (호출마다 import/TLS 초기화 반복 방지)
+try:
+    from google import genai
+    _GEMINI_CLIENT = genai.Client(api_key=GOOGLE_API_KEY) if GOOGLE_API_KEY else None
+except ImportError:
+    _GEMINI_CLIENT = None
+
+try:
+    import openai
+    _OPENAI_CLIENT = openai.OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+except ImportError:
+    _OPENAI_CLIENT = None
+
+# LLM 응답 디스크 캐시 (ticker, signal_date, sha256(prompt)) → 동일 프롬프트 재호출 방지
+LLM_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'cache', 'llm_cache.sqlite')
+LLM_CACHE_TTL = 86400  # 1일
+
+
+def _llm_cache_key(model: str, ticker: str, signal_date: str, prompt: str) -> str:
+    prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+    return f"{model}:{ticker}:{signal_date}:{prompt_hash}"
+
+
+def _llm_cache_conn() -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(LLM_CACHE_PATH), exist_ok=True)
+    conn = sqlite3.connect(LLM_CACHE_PATH, timeout=5)
+    conn.execute("CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, value TEXT, expires_at REAL)")
+    return conn
+
+
+def _llm_cache_get(key: str) -> Optional[Dict]:
+    """캐시된 LLM 결과 조회 (만료/오류 시 None)"""
+    try:
+        with closing(_llm_cache_conn()) as conn:
+            row = conn.execute("SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+        if row and row[1] > time.time():
+            return json.loads(row[0])
+    except (sqlite3.Error, ValueError) as e:
+        print(f"LLM cache read error: {e}")
+    return None
+
+
+def _llm_cache_set(key: str, value: Dict, expire: int = LLM_CACHE_TTL):
+    try:
+        with closing(_llm_cache_conn()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), time.time() + expire)
+            )
+    except (sqlite3.Error, TypeError) as e:
+        print(f"LLM cache write error: {e}")
+
+
+def _stock_name_map() -> Dict[str, str]:
+    """
+    종목 리스트 CSV → {ticker: name} (종목 리스트가 없으면 빈 dict)
+    load_stock_list 가 mtime 으로 캐시 - 실행 중인 서버에서도 stock_list.csv 재생성 시 새로 읽음
+    """
+    try:
+        return load_stock_list()[1]
+    except FileNotFoundError:
+        return {}
+
+
+def _is_fdr_ticker(ticker: str) -> bool:
+    """알 수 없는 종목은 FDR 네트워크 호출을 건너뜀 (종목 리스트가 없으면 제한하지 않음)"""
+    if not FDR_AVAILABLE:
+        return False
+    known = _stock_name_map()
+    return not known or ticker in known
+
 
 def fetch_market_indices() -> Dict:
     """KOSPI, KOSDAQ 지수 조회 (FDR)"""
@@ -57,9 +135,10 @@ def fetch_market_indices() -> Dict:
     
     # 2. Fallback to yfinance
     try:
+        import yfinance as yf
         # KOSPI: ^KS11, KOSDAQ: ^KQ11
         for code, key in [('^KS11', 'kospi'), ('^KQ11', 'kosdaq')]:
-            ticker = yf.Ticker(code)
+            ticker = yf.Ticker(code, session=yahoo_session())
             hist = ticker.history(period="5d")
             if not hist.empty and len(hist) >= 2:
                 today = hist.iloc[-1]['Close']
@@ -77,11 +156,12 @@ def fetch_market_indices() -> Dict:
 
 def fetch_current_price(ticker: str) -> int:
     """FDR/YF를 통한 실시간 현재가 조회"""
+    import yfinance as yf
     end = datetime.now()
     start = end - timedelta(days=5)
 
     # 1. Try FDR
-    if FDR_AVAILABLE:
+    if _is_fdr_ticker(ticker):
         try:
             df = fdr.DataReader(ticker, start, end)
             if not df.empty:
@@ -93,7 +173,7 @@ def fetch_current_price(ticker: str) -> int:
     try:
         # Try .KS then .KQ
         for suffix in ['.KS', '.KQ']:
-            t = yf.Ticker(f"{ticker}{suffix}")
+            t = yf.Ticker(f"{ticker}{suffix}", session=yahoo_session())
             hist = t.history(period='1d')
             if not hist.empty:
                 return int(hist.iloc[-1]['Close'])
@@ -105,6 +185,7 @@ def fetch_current_price(ticker: str) -> int:
 
 def fetch_fundamentals(ticker: str, name: str) -> Dict:
     """FDR(Marcap) + yfinance(PER/PBR) 하이브리드 재무지표 조회"""
+    import yfinance as yf
     fundamentals = {
         'per': 'N/A', 'pbr': 'N/A', 'roe': 'N/A',
         'eps': 'N/A', 'bps': 'N/A', 'div_yield': 'N/A', 'marcap': 'N/A'
@@ -121,7 +202,7 @@ def fetch_fundamentals(ticker: str, name: str) -> Dict:
         info = {}
         for suffix in ['.KS', '.KQ']:
             try:
-                t = yf.Ticker(f"{ticker}{suffix}")
+                t = yf.Ticker(f"{ticker}{suffix}", session=yahoo_session())
                 i = t.info
                 if i and 'regularMarketPrice' in i:
                     info = i
@@ -130,7 +211,7 @@ def fetch_fundamentals(ticker: str, name: str) -> Dict:
             
         if not info:
              # Fallback
-             t = yf.Ticker(f"{ticker}.KS")
+             t = yf.Ticker(f"{ticker}.KS", session=yahoo_session())
              try: info = t.info
              except: pass
 
@@ -177,8 +258,9 @@ def analyze_with_gemini(signal_data: Dict, market_indices: Dict, news: List[Dict
         import sys
         print(f"DEBUG: Gemini API 호출 시작 - {signal_data.get('name')}", file=sys.stderr)
         
-        from google import genai
-        client = genai.Client(api_key=GOOGLE_API_KEY)
+        client = _GEMINI_CLIENT
+        if client is None:
+            raise ImportError("google-genai 패키지 없음")
         model_id = 'gemini-2.5-pro'
         
         prompt = f"""당신은 한국 주식시장 전문 애널리스트입니다. 최신 정보를 바탕으로 매수/관망/매도 추천을 해주세요.
@@ -200,6 +282,12 @@ def analyze_with_gemini(signal_data: Dict, market_indices: Dict, news: List[Dict
   "news_found": []
 }}"""
 
+        signal_date = signal_data.get('signal_date') or datetime.now().strftime('%Y-%m-%d')
+        cache_key = _llm_cache_key(model_id, str(signal_data.get('ticker')), signal_date, prompt)
+        cached = _llm_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         response = client.models.generate_content(
             model=model_id,
             contents=prompt,
@@ -227,24 +315,63 @@ def analyze_with_gemini(signal_data: Dict, market_indices: Dict, news: List[Dict
                  result_text = result_text[start:end+1]
         
         result = json.loads(result_text)
-        return {
+        gemini_result = {
             'recommendation': result.get('recommendation', {'action': 'HOLD', 'confidence': 50, 'reason': '분석 실패'}),
             'grounding_news': result.get('news_found', [])
         }
+        # recommendation 이 빠진 응답(기본값 '분석 실패')은 캐시하지 않음 - 하루 동안 고정되지 않도록 다음 호출에서 재시도
+        if 'recommendation' in result:
+            _llm_cache_set(cache_key, gemini_result)
+        return gemini_result
     except Exception as e:
         import sys
         print(f"ERROR: Gemini analysis failed: {e}", file=sys.stderr)
         return {'recommendation': {'action': 'HOLD', 'confidence': 50, 'reason': f'분석 오류: {str(e)[:50]}'}, 'grounding_news': []}
 
 
+def _read_json_stream(stream) -> str:
+    """스트리밍 응답을 누적하다 최상위 JSON 객체가 닫히는 즉시 중단"""
+    buffer = []
+    depth = 0
+    started = in_string = escaped = False
+    try:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content or ''
+            for i, ch in enumerate(delta):
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif ch == '\\':
+                        escaped = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == '"':
+                    in_string = True
+                elif ch == '{':
+                    depth += 1
+                    started = True
+                elif ch == '}':
+                    depth -= 1
+                    if started and depth == 0:
+                        buffer.append(delta[:i + 1])
+                        return ''.join(buffer)
+            buffer.append(delta)
+    finally:
+        stream.close()
+    return ''.join(buffer)
+
+
 def analyze_with_gpt(signal_data: Dict, market_indices: Dict, news: List[Dict]) -> Dict:
     """OpenAI GPT analysis"""
     if not OPENAI_API_KEY:
         return {'action': 'N/A', 'confidence': 0, 'reason': 'API 키 없음'}
     
     try:
-        import openai
-        client = openai.OpenAI(api_key=OPENAI_API_KEY)
+        client = _OPENAI_CLIENT
+        if client is None:
+            raise ImportError("openai 패키지 없음")
         
         news_text = "\n".join([
             f"- 제목: {n['title']}\n  요약: {n.get('summary', '내용 없음')}" 
@@ -276,46 +403,67 @@ def analyze_with_gpt(signal_data: Dict, market_indices: Dict, news: List[Dict])
 
 JSON만 응답하세요."""
 
-        response = client.chat.completions.create(
+        signal_date = signal_data.get('signal_date') or datetime.now().strftime('%Y-%m-%d')
+        cache_key = _llm_cache_key('gpt-4o', str(signal_data.get('ticker')), signal_date, prompt)
+        cached = _llm_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        stream = client.chat.completions.create(
             model="gpt-4o",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3,
             max_completion_tokens=200,
-            response_format={"type": "json_object"}
+            response_format={"type": "json_object"},
+            stream=True
         )
         
-        result_text = response.choices[0].message.content.strip()
+        result_text = _read_json_stream(stream).strip()
         result = json.loads(result_text)
-        return {
+        gpt_result = {
             'action': result.get('action', 'HOLD'),
             'confidence': result.get('confidence', 50),
             'reason': result.get('reason', '')
         }
+        # action 이 빠진 응답(기본값 HOLD)은 캐시하지 않음
+        if 'action' in result:
+            _llm_cache_set(cache_key, gpt_result)
+        return gpt_result
     except Exception as e:
         print(f"GPT analysis error: {e}")
         return {'action': 'HOLD', 'confidence': 50, 'reason': '분석 실패'}
 
 
-def calculate_nice_layers(signal_data: Dict, theme: str) -> Dict:
-    """NICE 5-Layer 점수 계산 - 한국주식 맞춤형"""
-    vcp_score = signal_data.get('score', 50)
-    foreign_5d = signal_data.get('foreign_5d', 0)
-    inst_5d = signal_data.get('inst_5d', 0)
-    
-    # L1: 기술적 분석 (Tracker에서 계산된 점수 사용)
-    # 기존 VCP 점수 단순 변환이 아닌, Gates에서 검증된 Technical Score 사용
-    # signal_data에 'nice_tech_score'가 있으면 사용, 없으면 legacy fallback
-    l1_tech = signal_data.get('nice_tech_score', min(100, int(vcp_score * 1.2)))
-    
-    # Palantir Bonus (이미 Technical Score에 반영되었을 수 있으나, AI 관점에서 추가 보정 가능)
-    is_palantir = signal_data.get('is_palantir', False)
+# L3 AI 합의 점수표 (gpt_action, gemini_action) → 점수
+# BUY/SELL 이외의 액션(HOLD, N/A 등)은 HOLD로 취급
+_SENT_TABLE = {
+    ('BUY', 'BUY'): 80,
+    ('BUY', 'HOLD'): 60, ('HOLD', 'BUY'): 60,
+    ('BUY', 'SELL'): 60, ('SELL', 'BUY'): 60,
+    ('SELL', 'HOLD'): 30, ('HOLD', 'SELL'): 30,
+    ('SELL', 'SELL'): 30,
+    ('HOLD', 'HOLD'): 50,
+}
+_SENT_ACTION_KEY = {'BUY': 'BUY', 'SELL': 'SELL'}
+
+# L4 테마 보너스 (JIT 커널 진입 전 문자열 → 정수 매핑)
+_THEME_MACRO_BONUS = {
+    '방산': 32, '조선': 32, '환율수혜': 32,          # 현재 강세 테마
+    '반도체': 35, 'AI인프라': 35, 'AI전력': 35,      # AI 인프라 투자 확대
+}
+
+
+@njit(cache=True)
+def _nice_core(foreign: float, inst: float, tech: int, is_palantir: bool,
+               sentiment: int, theme_bonus: int):
+    """NICE 5-Layer 수치 계산 커널 (primitive 입력 → (L1, L2, L3, L4, L5))"""
+    # L1: 기술적 분석 (Palantir 강제 상향)
+    l1_tech = tech
     if is_palantir:
-        l1_tech = max(l1_tech, 95) # Palantir 강제 상향
-        
-    l1_tech = int(l1_tech) # Ensure int
+        l1_tech = max(l1_tech, 95)
 
     # L2: 수급 분석 (외국인 + 기관 순매수)
-    supply_flow = foreign_5d + inst_5d
+    supply_flow = foreign + inst
     if supply_flow > 500000:
         l2_supply = 30
     elif supply_flow > 100000:
@@ -324,35 +472,44 @@ def calculate_nice_layers(signal_data: Dict, theme: str) -> Dict:
         l2_supply = 20
     else:
         l2_supply = 10
-    
-    # L3: 시장 심리 (AI 합의 기반)
-    gpt_action = signal_data.get('gpt_recommendation', {}).get('action', 'HOLD')
-    gemini_action = signal_data.get('gemini_recommendation', {}).get('action', 'HOLD')
-    if gpt_action == 'BUY' and gemini_action == 'BUY':
-        l3_sentiment = 80
-    elif gpt_action == 'BUY' or gemini_action == 'BUY':
-        l3_sentiment = 60
-    elif gpt_action == 'SELL' or gemini_action == 'SELL':
-        l3_sentiment = 30
-    else:
-        l3_sentiment = 50
-    
-    # L4: 거시경제 (테마 기반 보너스)
-    l4_macro = 20
-    if theme in ['방산', '조선', '환율수혜']:
-        l4_macro = 32  # 현재 강세 테마
-    elif theme in ['반도체', 'AI인프라', 'AI전력']:
-        l4_macro = 35  # AI 인프라 투자 확대
-    
+
     # L5: 기관/ETF 참여도
-    if inst_5d > 100000:
+    if inst > 100000:
         l5_inst = 28
-    elif inst_5d > 50000:
+    elif inst > 50000:
         l5_inst = 22
-    elif inst_5d > 0:
+    elif inst > 0:
         l5_inst = 18
     else:
         l5_inst = 12
+
+    return l1_tech, l2_supply, sentiment, theme_bonus, l5_inst
+
+
+def calculate_nice_layers(signal_data: Dict, theme: str) -> Dict:
+    """NICE 5-Layer 점수 계산 - 한국주식 맞춤형"""
+    vcp_score = signal_data.get('score', 50)
+    foreign_5d = signal_data.get('foreign_5d', 0)
+    inst_5d = signal_data.get('inst_5d', 0)
+    
+    # L1: 기술적 분석 (Tracker에서 계산된 점수 사용)
+    # 기존 VCP 점수 단순 변환이 아닌, Gates에서 검증된 Technical Score 사용
+    # signal_data에 'nice_tech_score'가 있으면 사용, 없으면 legacy fallback
+    l1_tech = int(signal_data.get('nice_tech_score', min(100, int(vcp_score * 1.2))))
+    is_palantir = bool(signal_data.get('is_palantir', False))
+    
+    # L3: 시장 심리 (AI 합의 기반, 점수표 조회)
+    gpt_action = signal_data.get('gpt_recommendation', {}).get('action', 'HOLD')
+    gemini_action = signal_data.get('gemini_recommendation', {}).get('action', 'HOLD')
+    l3_sentiment = _SENT_TABLE[(_SENT_ACTION_KEY.get(gpt_action, 'HOLD'),
+                                _SENT_ACTION_KEY.get(gemini_action, 'HOLD'))]
+    
+    # L4: 거시경제 (테마 기반 보너스, 기본 20)
+    theme_bonus = _THEME_MACRO_BONUS.get(theme, 20)
+    
+    l1_tech, l2_supply, l3_sentiment, l4_macro, l5_inst = _nice_core(
+        float(foreign_5d), float(inst_5d), l1_tech, is_palantir, l3_sentiment, theme_bonus
+    )
     
     total = l1_tech + l2_supply + l3_sentiment + l4_macro + l5_inst
     
@@ -403,6 +560,17 @@ def calculate_valuation_grade(fundamentals: Dict) -> Dict:
     }
 
 
+@njit(cache=True)
+def _final_score_core(vcp_score: float, nice_total: float, gpt_conf: float,
+                      gemini_conf: float, val_score: float) -> float:
+    """VCP(40%) + NICE(30%) + AI합의(20%) + 밸류에이션(10%) 가중합 커널"""
+    ai_score = (gpt_conf + gemini_conf) / 2
+    return (vcp_score * 0.4) + ((nice_total / 300) * 100 * 0.3) + (ai_score * 0.2) + (val_score * 0.1)
+
+
+_VAL_SCORE_MAP = {'A': 100, 'B+': 80, 'B': 60, 'B-': 45, 'C': 30}
+
+
 def calculate_final_score(signal: Dict) -> float:
     """종합 추천 점수 = VCP(40%) + NICE(30%) + AI합의(20%) + 밸류에이션(10%)"""
     vcp_score = signal.get('score', 50)
@@ -411,15 +579,14 @@ def calculate_final_score(signal: Dict) -> float:
     # AI 합의 점수
     gpt_conf = signal.get('gpt_recommendation', {}).get('confidence', 50)
     gemini_conf = signal.get('gemini_recommendation', {}).get('confidence', 50)
-    ai_score = (gpt_conf + gemini_conf) / 2
     
     # 밸류에이션 점수
     val_grade = signal.get('valuation', {}).get('grade', 'B')
-    val_score_map = {'A': 100, 'B+': 80, 'B': 60, 'B-': 45, 'C': 30}
-    val_score = val_score_map.get(val_grade, 60)
+    val_score = _VAL_SCORE_MAP.get(val_grade, 60)
     
     # 종합 점수 계산
-    final = (vcp_score * 0.4) + ((nice_total / 300) * 100 * 0.3) + (ai_score * 0.2) + (val_score * 0.1)
+    final = _final_score_core(float(vcp_score), float(nice_total), float(gpt_conf),
+                              float(gemini_conf), float(val_score))
     return round(final, 1)
 
 
@@ -497,16 +664,11 @@ from datetime import datetime, timedelta
 
 def analyze_single_stock_realtime(ticker: str, cached_signal: Dict = None) -> Dict:
     """단일 종목 실시간 AI 분석 (On-Demand) w/ Data Preservation"""
+    import yfinance as yf
     from kr_market.theme_manager import ThemeManager
     
     # 1. 기본 정보 조회
-    stock_names = {}
-    stocks_file = 'kr_market/data/stock_list.csv'
-    if os.path.exists(stocks_file):
-        stocks_df = pd.read_csv(stocks_file, encoding='utf-8-sig', dtype={'ticker': str})
-        stock_names = dict(zip(stocks_df['ticker'].astype(str).str.zfill(6), stocks_df['name']))
-    
-    name = stock_names.get(ticker, ticker)
+    name = _stock_name_map().get(ticker, ticker)
     theme = ThemeManager.get_theme(ticker)
     
     # [Data Preservation] Use cached data for heavy metrics (Foreign/Inst/Tech)
@@ -551,7 +713,7 @@ def analyze_single_stock_realtime(ticker: str, cached_signal: Dict = None) -> Di
         df = pd.DataFrame()
         
         # 1. Try FDR
-        if FDR_AVAILABLE:
+        if _is_fdr_ticker(ticker):
             try:
                 df = fdr.DataReader(ticker, start=start_dt.strftime('%Y-%m-%d'))
             except: pass
@@ -560,11 +722,12 @@ def analyze_single_stock_realtime(ticker: str, cached_signal: Dict = None) -> Di
         if df.empty:
              for suffix in ['.KS', '.KQ']:
                  try:
-                     df = yf.download(f"{ticker}{suffix}", start=start_dt, progress=False)
+                     # 단일 종목도 리스트로 요청 → 항상 (Price, Ticker) MultiIndex로 고정되어 무조건 flatten
+                     df = yf.download([f"{ticker}{suffix}"], start=start_dt, progress=False,
+                                      group_by='column', auto_adjust=False, threads=False,
+                                      session=yahoo_session())
                      if not df.empty:
-                         # YF returns columns like (Close, Ticker), need to flatten if MultiIndex
-                         if isinstance(df.columns, pd.MultiIndex):
-                             df.columns = df.columns.get_level_values(0)
+                         df.columns = df.columns.get_level_values(0)
                          break
                  except: pass
         
@@ -647,8 +810,9 @@ def analyze_market_theme(theme_name: str) -> Dict:
         return {'analysis': 'API 키 없음', 'outlook': 'N/A'}
 
     try:
-        from google import genai
-        client = genai.Client(api_key=GOOGLE_API_KEY)
+        client = _GEMINI_CLIENT
+        if client is None:
+            raise ImportError("google-genai 패키지 없음")
         model_id = 'gemini-2.5-pro'
         
         prompt = f"""당신은 한국 주식시장 전문 애널리스트입니다.
@@ -666,6 +830,11 @@ def analyze_market_theme(theme_name: str) -> Dict:
   "key_stocks": ["관련 대장주 1", "관련 대장주 2"]
 }}"""
 
+        cache_key = _llm_cache_key(model_id, f"theme:{theme_name}", datetime.now().strftime('%Y-%m-%d'), prompt)
+        cached = _llm_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         response = client.models.generate_content(
             model=model_id,
             contents=prompt,
@@ -683,8 +852,10 @@ def analyze_market_theme(theme_name: str) -> Dict:
         if start != -1 and end != -1:
             result_text = result_text[start:end+1]
             
-        import json
-        return json.loads(result_text)
+        theme_result = json.loads(result_text)
+        if 'analysis' in theme_result:
+            _llm_cache_set(cache_key, theme_result)
+        return theme_result
         
     except Exception as e:
         print(f"Theme analysis failed: {e}")
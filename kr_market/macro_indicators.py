@@ -9,40 +9,73 @@ Data Sources:
 - FRED API: US Federal Funds Rate
 - 한국은행 ECOS API: 기준금리, 외환보유액
 """
-import yfinance as yf
-import requests
-import json
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-import pandas as pd
+import sys
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if __package__ in (None, ''):
+    # `python kr_market/macro_indicators.py` 직접 실행 시에도 kr_market 패키지 import 가능하도록 프로젝트 루트 추가
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kr_market.jit import njit, prange
+from kr_market._snapshot import FETCH_ERRORS, _loads_json, snapshot, yahoo_chart
+from kr_market._util import classify, ttl_cache, FX_RATE_TTL, SECTOR_TTL, INTEREST_TTL, FX_RESERVES_TTL
+
+logger = logging.getLogger(__name__)
 
-# Cache settings
-CACHE_DIR = os.path.join(os.path.dirname(__file__), 'data', 'cache')
-os.makedirs(CACHE_DIR, exist_ok=True)
+# 위험 등급 구간표 (np.searchsorted 로 라벨 인덱스 산출)
+# '< 0' 경계는 0 바로 아래 값으로 표현해 '<= -100' 등 포함 경계와 같은 side='left' 로 처리
+_BELOW_ZERO = np.nextafter(0.0, -np.inf)
+_FX_RISK_BOUNDS = np.array([1400, 1450, 1500])                 # rate >= bound (side='right')
+_FX_RISK_LABELS = ("normal", "elevated", "warning", "critical")
+_SPREAD_RISK_BOUNDS = np.array([-150, -100, _BELOW_ZERO])     # spread_bp <= bound (side='left')
+_SPREAD_RISK_LABELS = ("high", "elevated", "moderate", "low")
+_RESERVE_RISK_BOUNDS = np.array([-20, -10, _BELOW_ZERO])      # change <= bound (side='left')
+_RESERVE_RISK_LABELS = ("critical", "warning", "elevated", "normal")
+_CRISIS_BOUNDS = np.array([30, 50, 70])                       # crisis_score >= bound (side='right')
+_CRISIS_LEVELS = (
+    ("normal", "안정: 정상 범위 내 변동"),
+    ("elevated", "관심: 지표 모니터링 강화 필요"),
+    ("warning", "주의: 거시경제 불안정성 증가"),
+    ("critical", "환율 위기 경고: 자산 헷지 전략 점검 필요"),
+)
 
 
+FRED_OBSERVATIONS_URL = "https://api.stlouisfed.org/fred/series/observations"
+
+# FRED 등 일반 HTTP 조회용 공유 세션 (keep-alive 로 TLS 핸드셰이크 재사용)
+_http_session = requests.Session()
+_http_session.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+))
+
+
+@ttl_cache(FX_RATE_TTL)
 def get_usd_krw_rate() -> Dict:
     """실시간 USD/KRW 환율 조회"""
     try:
-        ticker = yf.Ticker("USDKRW=X")
-        hist = ticker.history(period="5d")
+        quote = snapshot(["USDKRW=X"]).get("USDKRW=X", {})
         
-        if hist.empty:
+        if not quote.get("regularMarketPrice"):
             return {"error": "No data", "rate": 0, "change_pct": 0}
         
-        current_rate = float(hist['Close'].iloc[-1])
-        prev_rate = float(hist['Close'].iloc[-2]) if len(hist) > 1 else current_rate
+        current_rate = float(quote["regularMarketPrice"])
+        prev_rate = float(quote.get("regularMarketPreviousClose") or current_rate)
         change_pct = ((current_rate - prev_rate) / prev_rate) * 100
         
         # 위험 수준 판단
-        risk_level = "normal"
-        if current_rate >= 1500:
-            risk_level = "critical"
-        elif current_rate >= 1450:
-            risk_level = "warning"
-        elif current_rate >= 1400:
-            risk_level = "elevated"
+        risk_level = classify(current_rate, _FX_RISK_BOUNDS, _FX_RISK_LABELS)
         
         return {
             "rate": round(current_rate, 2),
@@ -58,10 +91,12 @@ def get_usd_krw_rate() -> Dict:
             "source_url": "https://finance.yahoo.com/quote/USDKRW=X",
             "ticker": "USDKRW=X"
         }
-    except Exception as e:
+    except FETCH_ERRORS as e:
+        logger.warning("USD/KRW fetch failed: %s", e)
         return {"error": str(e), "rate": 0, "change_pct": 0}
 
 
+@ttl_cache(INTEREST_TTL)
 def get_interest_rate_spread() -> Dict:
     """한미 금리차 조회 (한국 기준금리 - 미국 기준금리)"""
     try:
@@ -74,7 +109,6 @@ def get_interest_rate_spread() -> Dict:
         fred_api_key = os.getenv('FRED_API_KEY')
         if fred_api_key:
             try:
-                url = f"https://api.stlouisfed.org/fred/series/observations"
                 params = {
                     "series_id": "FEDFUNDS",
                     "api_key": fred_api_key,
@@ -82,26 +116,19 @@ def get_interest_rate_spread() -> Dict:
                     "limit": 1,
                     "sort_order": "desc"
                 }
-                resp = requests.get(url, params=params, timeout=5)
+                resp = _http_session.get(FRED_OBSERVATIONS_URL, params=params, timeout=5)
                 if resp.status_code == 200:
-                    data = resp.json()
+                    data = _loads_json(resp.content)
                     if data.get('observations'):
                         us_rate = float(data['observations'][0]['value'])
-            except:
-                pass
+            except FETCH_ERRORS as e:
+                logger.warning("FRED fetch failed, using assumed rate: %s", e)
         
         spread = kr_rate - us_rate  # 음수면 미국이 높음 (자본 유출 압력)
         spread_bp = spread * 100  # basis points
         
-        # 자본 유출 위험도
-        if spread_bp <= -150:
-            capital_risk = "high"  # 심각한 자본 유출 압력
-        elif spread_bp <= -100:
-            capital_risk = "elevated"
-        elif spread_bp < 0:
-            capital_risk = "moderate"
-        else:
-            capital_risk = "low"
+        # 자본 유출 위험도 (high = 심각한 자본 유출 압력)
+        capital_risk = classify(spread_bp, _SPREAD_RISK_BOUNDS, _SPREAD_RISK_LABELS, side='left')
         
         return {
             "us_rate": us_rate,
@@ -125,12 +152,13 @@ def get_interest_rate_spread() -> Dict:
                 }
             }
         }
-    except Exception as e:
+    except (KeyError, ValueError) as e:
+        logger.warning("Interest rate spread failed: %s", e)
         return {"error": str(e)}
 
 
-def get_fx_reserves() -> Dict:
-    """외환보유액 조회 (한국은행 데이터 - 월간)"""
+def _build_fx_reserves() -> Dict:
+    """외환보유액 지표 생성 (한국은행 데이터 - 월간)"""
     try:
         # 실제 한국은행 ECOS API 호출은 API 키 필요
         # 2026년 1월 시뮬레이션 데이터 사용
@@ -154,14 +182,7 @@ def get_fx_reserves() -> Dict:
         trend = "decreasing" if change < 0 else "stable" if change == 0 else "increasing"
         
         # 위험 수준
-        if change <= -20:
-            risk_level = "critical"
-        elif change <= -10:
-            risk_level = "warning"
-        elif change < 0:
-            risk_level = "elevated"
-        else:
-            risk_level = "normal"
+        risk_level = classify(change, _RESERVE_RISK_BOUNDS, _RESERVE_RISK_LABELS, side='left')
         
         return {
             "current_reserves": current["reserves"],
@@ -174,17 +195,28 @@ def get_fx_reserves() -> Dict:
             "unit": "억 달러",
             "message": f"외환보유액 {current['reserves']:,}억$ ({change:+}억$)",
             "next_announcement": "2026-02-04",  # 다음 발표일
-            "updated_at": datetime.now().isoformat(),
             # 검증 가능한 출처
             "source": "한국은행 경제통계시스템 (ECOS)",
             "source_url": "https://ecos.bok.or.kr/",
             "official_release_url": "https://www.bok.or.kr/portal/bbs/B0000232/list.do",
             "data_code": "8.1.1 외환보유액"
         }
-    except Exception as e:
+    except (KeyError, IndexError, ZeroDivisionError) as e:
+        logger.warning("FX reserves failed: %s", e)
         return {"error": str(e)}
 
 
+# 월간 시뮬레이션 데이터라 import 시 1회만 계산
+# (ECOS API 연동 시 get_fx_reserves 를 @ttl_cache(FX_RESERVES_TTL) 조회로 교체)
+_FX_RESERVES_RESULT = _build_fx_reserves()
+
+
+def get_fx_reserves() -> Dict:
+    """외환보유액 조회 (한국은행 데이터 - 월간)"""
+    return {**_FX_RESERVES_RESULT, "updated_at": datetime.now().isoformat()}
+
+
+@ttl_cache(SECTOR_TTL)
 def get_sector_performance() -> Dict:
     """주요 섹터별 성과 조회"""
     try:
@@ -212,17 +244,25 @@ def get_sector_performance() -> Dict:
             }
         }
         
+        # 4개 ETF 5일 일봉을 chart 엔드포인트로 병렬 조회 (몇 줄짜리라 DataFrame 불필요)
+        etfs = [info["etf"] for info in sectors.values()]
+        with ThreadPoolExecutor(max_workers=len(etfs)) as executor:
+            chart_futures = {etf: executor.submit(yahoo_chart, etf, "5d") for etf in etfs}
+        
         results = []
         for name, info in sectors.items():
             try:
-                ticker = yf.Ticker(info["etf"])
-                hist = ticker.history(period="5d")
+                try:
+                    hist = chart_futures[info["etf"]].result()
+                except FETCH_ERRORS as e:
+                    logger.warning("Sector ETF %s fetch failed: %s", info["etf"], e)
+                    hist = {"close": [], "volume": []}
                 
-                if not hist.empty:
-                    current = float(hist['Close'].iloc[-1])
-                    prev = float(hist['Close'].iloc[0])
+                if hist["close"]:
+                    current = float(hist["close"][-1])
+                    prev = float(hist["close"][0])
                     change_pct = ((current - prev) / prev) * 100
-                    volume = int(hist['Volume'].iloc[-1])
+                    volume = int(hist["volume"][-1])
                     
                     results.append({
                         "name": name,
@@ -243,7 +283,7 @@ def get_sector_performance() -> Dict:
                         "change_pct": 0,
                         "status": "unknown"
                     })
-            except Exception as sector_err:
+            except (KeyError, ValueError, ZeroDivisionError) as sector_err:
                 results.append({
                     "name": name,
                     "error": str(sector_err)
@@ -254,63 +294,88 @@ def get_sector_performance() -> Dict:
             "source": "KODEX ETF (Yahoo Finance)",
             "updated_at": datetime.now().isoformat()
         }
-    except Exception as e:
+    except FETCH_ERRORS as e:
+        logger.warning("Sector performance failed: %s", e)
         return {"error": str(e)}
 
 
-def get_crisis_indicators() -> Dict:
-    """위기 시나리오 모니터링 지표"""
+@njit(cache=True)
+def _crisis_score_nb(rate, spread_bp, reserve_change):
+    """위기 점수 계단식 산정 (scalar kernel)"""
+    crisis_score = 0
+    
+    # 환율 기여 (최대 40점)
+    if rate >= 1500:
+        crisis_score += 40
+    elif rate >= 1450:
+        crisis_score += 30
+    elif rate >= 1400:
+        crisis_score += 20
+    elif rate >= 1350:
+        crisis_score += 10
+    
+    # 금리차 기여 (최대 30점)
+    if spread_bp <= -150:
+        crisis_score += 30
+    elif spread_bp <= -100:
+        crisis_score += 20
+    elif spread_bp < 0:
+        crisis_score += 10
+    
+    # 외환보유액 기여 (최대 30점)
+    if reserve_change <= -20:
+        crisis_score += 30
+    elif reserve_change <= -10:
+        crisis_score += 20
+    elif reserve_change < 0:
+        crisis_score += 10
+    
+    return crisis_score
+
+
+@njit(parallel=True, cache=True)
+def crisis_scores_batch(rates, spreads_bp, reserve_changes):
+    """과거 지표 배열에 대한 위기 점수 일괄 계산 (백테스트용)"""
+    n = rates.shape[0]
+    out = np.empty(n, dtype=np.int64)
+    for i in prange(n):
+        out[i] = _crisis_score_nb(rates[i], spreads_bp[i], reserve_changes[i])
+    return out
+
+
+def get_crisis_indicators(fx_rate: Optional[Dict] = None,
+                          interest: Optional[Dict] = None,
+                          reserves: Optional[Dict] = None) -> Dict:
+    """
+    위기 시나리오 모니터링 지표
+    
+    이미 조회한 지표가 있으면 인자로 받아 재사용하고, 없는 것만 새로 조회한다.
+    """
     try:
-        # 각 지표 수집
-        fx_rate = get_usd_krw_rate()
-        interest = get_interest_rate_spread()
-        reserves = get_fx_reserves()
+        # 각 지표 수집 (미전달분만, 여러 개면 병렬 조회)
+        fetchers = {
+            name: fetch for name, value, fetch in [
+                ("fx_rate", fx_rate, get_usd_krw_rate),
+                ("interest", interest, get_interest_rate_spread),
+                ("reserves", reserves, get_fx_reserves),
+            ] if value is None
+        }
+        if fetchers:
+            with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+                futures = {name: executor.submit(fetch) for name, fetch in fetchers.items()}
+            fx_rate = futures["fx_rate"].result() if "fx_rate" in futures else fx_rate
+            interest = futures["interest"].result() if "interest" in futures else interest
+            reserves = futures["reserves"].result() if "reserves" in futures else reserves
         
         # 종합 위기 점수 계산 (0-100, 높을수록 위험)
-        crisis_score = 0
-        
-        # 환율 기여 (최대 40점)
         rate = fx_rate.get("rate", 0)
-        if rate >= 1500:
-            crisis_score += 40
-        elif rate >= 1450:
-            crisis_score += 30
-        elif rate >= 1400:
-            crisis_score += 20
-        elif rate >= 1350:
-            crisis_score += 10
-        
-        # 금리차 기여 (최대 30점)
-        spread_bp = interest.get("spread_bp", 0)
-        if spread_bp <= -150:
-            crisis_score += 30
-        elif spread_bp <= -100:
-            crisis_score += 20
-        elif spread_bp < 0:
-            crisis_score += 10
-        
-        # 외환보유액 기여 (최대 30점)
-        reserve_change = reserves.get("change", 0)
-        if reserve_change <= -20:
-            crisis_score += 30
-        elif reserve_change <= -10:
-            crisis_score += 20
-        elif reserve_change < 0:
-            crisis_score += 10
+        # 단건 계산은 순수 Python 커널로 (numba import/컴파일은 배치 경로에서만)
+        crisis_score = int(_crisis_score_nb.py_func(float(rate),
+                                                    float(interest.get("spread_bp", 0)),
+                                                    float(reserves.get("change", 0))))
         
         # 위기 등급
-        if crisis_score >= 70:
-            crisis_level = "critical"
-            message = "환율 위기 경고: 자산 헷지 전략 점검 필요"
-        elif crisis_score >= 50:
-            crisis_level = "warning"
-            message = "주의: 거시경제 불안정성 증가"
-        elif crisis_score >= 30:
-            crisis_level = "elevated"
-            message = "관심: 지표 모니터링 강화 필요"
-        else:
-            crisis_level = "normal"
-            message = "안정: 정상 범위 내 변동"
+        crisis_level, message = classify(crisis_score, _CRISIS_BOUNDS, _CRISIS_LEVELS)
         
         return {
             "crisis_score": crisis_score,
@@ -329,18 +394,30 @@ def get_crisis_indicators() -> Dict:
             "genius_question": "정부의 환율 방어 능력이 한계에 봉착했다면, 우리는 달러 자산 비중을 단순히 늘리는 것을 넘어 '원화 가치 하락'을 헷지할 수 있는 실물 자산이나 대체 투자처를 구체적으로 준비하고 있는가?",
             "updated_at": datetime.now().isoformat()
         }
-    except Exception as e:
+    except (KeyError, ValueError) as e:
+        logger.warning("Crisis indicators failed: %s", e)
         return {"error": str(e)}
 
 
 def get_all_macro_indicators() -> Dict:
-    """모든 매크로 지표 통합 조회"""
+    """모든 매크로 지표 통합 조회 (독립적인 네트워크 조회를 병렬 실행)"""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        fx_future = executor.submit(get_usd_krw_rate)
+        interest_future = executor.submit(get_interest_rate_spread)
+        reserves_future = executor.submit(get_fx_reserves)
+        sectors_future = executor.submit(get_sector_performance)
+        
+        fx_rate = fx_future.result()
+        interest = interest_future.result()
+        reserves = reserves_future.result()
+        sectors = sectors_future.result()
+    
     return {
-        "exchange_rate": get_usd_krw_rate(),
-        "interest_spread": get_interest_rate_spread(),
-        "fx_reserves": get_fx_reserves(),
-        "sectors": get_sector_performance(),
-        "crisis": get_crisis_indicators(),
+        "exchange_rate": fx_rate,
+        "interest_spread": interest,
+        "fx_reserves": reserves,
+        "sectors": sectors,
+        "crisis": get_crisis_indicators(fx_rate=fx_rate, interest=interest, reserves=reserves),
         "generated_at": datetime.now().isoformat()
     }
 
@@ -12,9 +12,20 @@ Provides market health indicators:
 - Market recommendation
 """
 
-import yfinance as yf
+import os
+import sys
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
+
+import numpy as np
+
+if __package__ in (None, ''):
+    # `python kr_market/market_gate.py` 직접 실행 시에도 kr_market 패키지 import 가능하도록 프로젝트 루트 추가
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kr_market.jit import njit, prange
+from kr_market._snapshot import FETCH_ERRORS, snapshot as quote_snapshot
+from kr_market._util import classify, ttl_cache, FX_RATE_TTL
 
 
 def get_market_status() -> Dict:
@@ -35,28 +46,20 @@ def get_market_status() -> Dict:
     """
     
     try:
+        # 0. Single batched quote request shared by every indicator below
+        snapshot = _fetch_market_snapshot()
+        
         # 1. Fetch KOSPI and KOSDAQ indices
-        indices = _fetch_indices()
+        indices = _fetch_indices(snapshot)
         
         # 2. Fetch USD/KRW exchange rate
-        usd_krw = _fetch_usd_krw()
+        usd_krw = _fetch_usd_krw(snapshot)
         
         # 3. Calculate gate score based on indicators
         gate_score = _calculate_gate_score(indices, usd_krw)
         
         # 4. Determine overall status and recommendation
-        if gate_score >= 70:
-            status = 'BULLISH'
-            recommendation = 'BUY'
-            details = '시장 상승 모멘텀 강함. 적극적인 매수 포지션 권장.'
-        elif gate_score >= 40:
-            status = 'NEUTRAL'
-            recommendation = 'HOLD'
-            details = '시장 방향성 불명확. 관망 또는 선별적 접근 권장.'
-        else:
-            status = 'BEARISH'
-            recommendation = 'SELL'
-            details = '시장 하락 압력 높음. 방어적 포지션 권장.'
+        status, recommendation, details = classify(gate_score, _GATE_BOUNDS, _GATE_OUTCOMES)
         
         return {
             'status': status,
@@ -85,7 +88,29 @@ def get_market_status() -> Dict:
         }
 
 
-def _fetch_indices() -> Dict:
+# gate_score >= bound 구간별 (status, recommendation, details)
+_GATE_BOUNDS = np.array([40, 70])
+_GATE_OUTCOMES = (
+    ('BEARISH', 'SELL', '시장 하락 압력 높음. 방어적 포지션 권장.'),
+    ('NEUTRAL', 'HOLD', '시장 방향성 불명확. 관망 또는 선별적 접근 권장.'),
+    ('BULLISH', 'BUY', '시장 상승 모멘텀 강함. 적극적인 매수 포지션 권장.'),
+)
+
+# USD/KRW 는 macro_indicators 와 같은 심볼을 써서 스냅샷 캐시를 공유
+SNAPSHOT_SYMBOLS = ['^KS11', '^KQ11', 'USDKRW=X']
+
+
+@ttl_cache(FX_RATE_TTL)
+def _fetch_market_snapshot() -> Dict[str, Dict]:
+    """Fetch KOSPI, KOSDAQ and USD/KRW quotes in one request"""
+    try:
+        return quote_snapshot(SNAPSHOT_SYMBOLS)
+    except FETCH_ERRORS as e:
+        print(f"Market snapshot fetch error: {e}")
+        return {}
+
+
+def _fetch_indices(snapshot: Optional[Dict[str, Dict]] = None) -> Dict:
     """Fetch KOSPI and KOSDAQ index values"""
     indices = {
         'kospi': {'value': 0, 'change_pct': 0},
@@ -94,35 +119,32 @@ def _fetch_indices() -> Dict:
     
     try:
         # KOSPI: ^KS11, KOSDAQ: ^KQ11
-        tickers = ['^KS11', '^KQ11']
-        data = yf.download(tickers, period='2d', progress=False)
+        quotes = snapshot if snapshot is not None else _fetch_market_snapshot()
         
-        if not data.empty and 'Close' in data.columns:
-            closes = data['Close']
-            
-            for ticker, name in [('^KS11', 'kospi'), ('^KQ11', 'kosdaq')]:
-                if ticker in closes.columns and len(closes[ticker].dropna()) >= 2:
-                    today = closes[ticker].dropna().iloc[-1]
-                    prev = closes[ticker].dropna().iloc[-2]
-                    change_pct = ((today - prev) / prev) * 100
-                    indices[name] = {
-                        'value': round(float(today), 2),
-                        'change_pct': round(change_pct, 2)
-                    }
+        for ticker, name in [('^KS11', 'kospi'), ('^KQ11', 'kosdaq')]:
+            quote = quotes.get(ticker, {})
+            today = quote.get('regularMarketPrice')
+            prev = quote.get('regularMarketPreviousClose')
+            if today and prev:
+                change_pct = ((today - prev) / prev) * 100
+                indices[name] = {
+                    'value': round(float(today), 2),
+                    'change_pct': round(change_pct, 2)
+                }
     except Exception as e:
         print(f"Indices fetch error: {e}")
     
     return indices
 
 
-def _fetch_usd_krw() -> float:
+def _fetch_usd_krw(snapshot: Optional[Dict[str, Dict]] = None) -> float:
     """Fetch USD/KRW exchange rate"""
     try:
-        # KRW=X is the Yahoo Finance ticker for USD/KRW
-        data = yf.download('KRW=X', period='1d', progress=False)
+        # USDKRW=X (alias KRW=X) is the Yahoo Finance ticker for USD/KRW
+        quotes = snapshot if snapshot is not None else _fetch_market_snapshot()
+        rate = quotes.get('USDKRW=X', {}).get('regularMarketPrice')
         
-        if not data.empty and 'Close' in data.columns:
-            rate = data['Close'].iloc[-1]
+        if rate:
             return round(float(rate), 2)
     except Exception as e:
         print(f"USD/KRW fetch error: {e}")
@@ -140,10 +162,17 @@ def _calculate_gate_score(indices: Dict, usd_krw: float) -> int:
     - Market breadth (20 points - both indices aligned)
     - Currency stability (20 points - USD/KRW within reasonable range)
     """
+    # Single score: run the plain-Python kernel (numba is only loaded for batches)
+    return int(_gate_score_nb.py_func(float(indices['kospi']['change_pct']),
+                                      float(indices['kosdaq']['change_pct'])))
+
+
+@njit(cache=True)
+def _gate_score_nb(kospi_change, kosdaq_change):
+    """Gate score staircase (scalar kernel)"""
     score = 50  # Base score
     
     # KOSPI contribution (up to +/- 20 points)
-    kospi_change = indices['kospi']['change_pct']
     if kospi_change > 1.5:
         score += 20
     elif kospi_change > 0.5:
@@ -154,7 +183,6 @@ def _calculate_gate_score(indices: Dict, usd_krw: float) -> int:
         score -= 10
     
     # KOSDAQ contribution (up to +/- 20 points)
-    kosdaq_change = indices['kosdaq']['change_pct']
     if kosdaq_change > 2.0:
         score += 20
     elif kosdaq_change > 0.5:
@@ -171,9 +199,17 @@ def _calculate_gate_score(indices: Dict, usd_krw: float) -> int:
         score -= 10  # Broad decline
     
     # Clamp score to 0-100 range
-    score = max(0, min(100, score))
-    
-    return score
+    return max(0, min(100, score))
+
+
+@njit(parallel=True, cache=True)
+def gate_scores_batch(kospi_changes, kosdaq_changes):
+    """Gate scores for arrays of historical index changes (backtest use)"""
+    n = kospi_changes.shape[0]
+    out = np.empty(n, dtype=np.int64)
+    for i in prange(n):
+        out[i] = _gate_score_nb(kospi_changes[i], kosdaq_changes[i])
+    return out
 
 
 if __name__ == '__main__':
@@ -4,13 +4,27 @@
 KR execution Logic (Order Plan)
 Handles Tick Rounding and Trade Plan Construction.
 """
-import math
+import time
+from functools import lru_cache
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional, Sequence
 from datetime import datetime, timedelta
+
+import numpy as np
+
 from .config import DEFAULT_TRADE_RULE, DEFAULT_BACKTEST_CONFIG
 
-@dataclass
+if TYPE_CHECKING:
+    import pandas as pd
+
+# SSOT config 값은 import 시 1회만 계산 (plan 생성 hot path 에서 재계산 방지)
+_CAPITAL_PER_TRADE = DEFAULT_BACKTEST_CONFIG.initial_capital * (DEFAULT_BACKTEST_CONFIG.position_size_pct / 100)
+_SL_PCT = DEFAULT_TRADE_RULE.stop_loss_pct / 100
+_TP1_PCT = DEFAULT_TRADE_RULE.tp1_pct / 100
+_TP2_PCT = DEFAULT_TRADE_RULE.tp2_pct / 100
+_TIME_STOP_DAYS = DEFAULT_TRADE_RULE.time_stop_days
+
+@dataclass(slots=True)
 class OrderPlan:
     ticker: str
     action: str # BUY, SELL, HOLD
@@ -49,19 +63,37 @@ def round_to_tick(price: float, market: str = "KOSPI") -> int:
     tick = get_tick_size(price_i, market)
     return round(price_i / tick) * tick
 
+# get_tick_size 구간표 (배치용): price < bound 인 첫 구간의 tick
+_TICK_BOUNDS = np.array([1000, 5000, 10000, 50000, 100000, 500000, np.inf])
+_TICK_SIZES = np.array([1, 5, 10, 50, 100, 500, 1000])
+
+def round_to_tick_vec(prices: np.ndarray) -> np.ndarray:
+    """Vectorized round_to_tick for an array of prices"""
+    prices_i = np.trunc(np.asarray(prices, dtype=np.float64))
+    ticks = _TICK_SIZES[np.searchsorted(_TICK_BOUNDS, prices_i, side='right')]
+    return (np.round(prices_i / ticks) * ticks).astype(np.int64)
+
+@lru_cache(maxsize=1)
+def _time_stop_date_at(minute: int) -> str:
+    return (datetime.now() + timedelta(days=_TIME_STOP_DAYS)).strftime("%Y-%m-%d")
+
+def _time_stop_date() -> str:
+    """Time-stop date shared by every plan built within the same minute"""
+    return _time_stop_date_at(int(time.time() // 60))
+
 class PlanBuilder:
     """Builds execution plan based on SSOT config"""
     
     @staticmethod
     def create_buy_plan(ticker: str, current_price: int, market: str = "KOSPI", risk_pivot: Optional[int] = None) -> OrderPlan:
-        rule = DEFAULT_TRADE_RULE
+        _rt = round_to_tick
         
         # 1. Entry is Current Price (or Breakout level if specified)
-        entry = round_to_tick(current_price, market)
+        entry = _rt(current_price, market)
         
         # 2. Stop Loss Calculation
         # If pivot is provided and strictly lower, use pivot. Else use fixed %.
-        sl_price_fixed = entry * (1 - rule.stop_loss_pct / 100)
+        sl_price_fixed = entry * (1 - _SL_PCT)
         
         final_sl = sl_price_fixed
         if risk_pivot and risk_pivot < entry:
@@ -70,19 +102,18 @@ class PlanBuilder:
              if pivot_drop_pct < 10:
                  final_sl = risk_pivot
         
-        sl_price = round_to_tick(final_sl, market)
+        sl_price = _rt(final_sl, market)
         
         # 3. Take Profit Targets
-        tp1_price = round_to_tick(entry * (1 + rule.tp1_pct / 100), market)
-        tp2_price = round_to_tick(entry * (1 + rule.tp2_pct / 100), market)
+        tp1_price = _rt(entry * (1 + _TP1_PCT), market)
+        tp2_price = _rt(entry * (1 + _TP2_PCT), market)
         
         # 4. Time Stop
-        ts_date = (datetime.now() + timedelta(days=rule.time_stop_days)).strftime("%Y-%m-%d")
+        ts_date = _time_stop_date()
         
         # 5. Position Sizing (Fixed Capital Model)
         # Based on config initial_capital * 10% usually
-        capital_per_trade = DEFAULT_BACKTEST_CONFIG.initial_capital * (DEFAULT_BACKTEST_CONFIG.position_size_pct / 100)
-        quantity = int(capital_per_trade // entry)
+        quantity = int(_CAPITAL_PER_TRADE // entry)
         
         # 6. Risk/Reward
         risk = entry - sl_price
@@ -100,3 +131,58 @@ class PlanBuilder:
             time_stop_date=ts_date,
             risk_reward_ratio=rr
         )
+
+    @staticmethod
+    def create_buy_plans_vec(tickers: Sequence[str], prices: Sequence[float],
+                             pivots: Optional[Sequence[Optional[int]]] = None) -> "pd.DataFrame":
+        """
+        Columnar batch plan builder - one array op per plan field.
+        Returns a DataFrame with the OrderPlan fields as columns.
+        """
+        import pandas as pd  # 배치 경로에서만 필요 (tick 계산 전용 호출자는 pandas 로드 안 함)
+
+        entries = round_to_tick_vec(prices)
+
+        # Stop Loss: pivot if strictly lower and within 10%, else fixed %
+        sl_fixed = entries * (1 - _SL_PCT)
+        final_sl = sl_fixed
+        if pivots is not None:
+            pivot_arr = np.array([p if p else np.nan for p in pivots], dtype=np.float64)
+            with np.errstate(invalid='ignore'):
+                pivot_ok = (pivot_arr < entries) & ((entries - pivot_arr) / entries * 100 < 10)
+            final_sl = np.where(pivot_ok, pivot_arr, sl_fixed)
+
+        sl_prices = round_to_tick_vec(final_sl)
+        tp1_prices = round_to_tick_vec(entries * (1 + _TP1_PCT))
+        tp2_prices = round_to_tick_vec(entries * (1 + _TP2_PCT))
+
+        ts_date = _time_stop_date()
+        quantities = (_CAPITAL_PER_TRADE // entries).astype(np.int64)
+
+        risk = entries - sl_prices
+        reward = tp1_prices - entries
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rr = np.where(risk > 0, np.round(reward / risk, 2), 0.0)
+
+        return pd.DataFrame({
+            'ticker': list(tickers),
+            'action': 'BUY',
+            'entry_price': entries,
+            'stop_loss': sl_prices,
+            'tp1': tp1_prices,
+            'tp2': tp2_prices,
+            'quantity': quantities,
+            'time_stop_date': ts_date,
+            'risk_reward_ratio': rr
+        })
+
+    @staticmethod
+    def create_buy_plans(tickers: Sequence[str], prices: Sequence[float], market: str = "KOSPI",
+                         risk_pivots: Optional[Sequence[Optional[int]]] = None) -> List[OrderPlan]:
+        """Batch version of create_buy_plan (OrderPlan objects built from create_buy_plans_vec)"""
+        if len(tickers) == 1:
+            pivot = risk_pivots[0] if risk_pivots is not None else None
+            return [PlanBuilder.create_buy_plan(tickers[0], prices[0], market, pivot)]
+
+        plans = PlanBuilder.create_buy_plans_vec(tickers, prices, risk_pivots)
+        return [OrderPlan(**row) for row in plans.to_dict('records')]
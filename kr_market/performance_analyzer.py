@@ -7,14 +7,108 @@ Provides detailed performance decomposition for strategy effectiveness validatio
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from enum import Enum
 import os
+import sys
+import copy
+import json
 import logging
 
+if __package__ in (None, ''):
+    # `python kr_market/performance_analyzer.py` 직접 실행 시에도 kr_market 패키지 import 가능하도록 프로젝트 루트 추가
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kr_market.jit import njit
+from kr_market._signal_log import read_signal_binlog
+
+# orjson - 빠른 JSON 직렬화 (Optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# PyArrow - 멀티스레드 CSV 파서 (Optional)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.dataset as pa_ds
+    PYARROW_AVAILABLE = True
+    
+    # 고정 컬럼 타입 (수치는 float32, mode/sector 는 dictionary 인코딩 -> pandas Categorical)
+    _SIGNAL_COLUMN_TYPES = {
+        'signal_date': pa.timestamp('ns'),
+        'return_pct': pa.float32(),
+        'score': pa.float32(),
+        'strategy_mode': pa.dictionary(pa.int32(), pa.string()),
+        'sector': pa.dictionary(pa.int32(), pa.string()),
+    }
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 분석에 쓰는 컬럼 (Parquet 에서는 이 컬럼만 읽음)
+SIGNAL_ANALYSIS_COLUMNS = ['signal_date', 'return_pct', 'score', 'sector', 'strategy_mode', 'status']
+
+# 파싱된 signals_log 캐시 {(path, mode): (mtime, DataFrame, {mode: row positions})} - 요청마다 새 Analyzer 가 생겨도 공유
+_signals_cache: Dict[tuple, tuple] = {}
+_NO_ROWS = np.empty(0, dtype=np.intp)
+# 리포트 캐시 {(signals path, mode): (CSV mtime_ns, report)} - 입력이 그대로면 재계산 생략
+_report_cache: Dict[tuple, tuple] = {}
+# 날짜 정렬 뷰 캐시 {signals path: (base DataFrame, signal_date 인덱스 뷰)} - base 가 바뀌면 재생성
+_by_date_cache: Dict[str, tuple] = {}
+
+
+@njit(cache=True, error_model='numpy')
+def _mdd_kernel(returns):
+    """One-pass MDD: cumulative product, running max and worst drawdown fused."""
+    cumulative = 1.0
+    running_max = -np.inf
+    worst = 0.0
+    for i in range(returns.shape[0]):
+        cumulative *= 1.0 + returns[i] / 100.0
+        if cumulative > running_max:
+            running_max = cumulative
+        drawdown = (cumulative - running_max) / running_max * 100.0
+        if np.isnan(drawdown):
+            return np.nan  # np.min 과 동일하게 NaN 전파
+        if drawdown < worst:
+            worst = drawdown
+    return worst
+
+
+@njit(cache=True)
+def _summary_stats(returns):
+    """One-pass sum / mean / population std / win rate (Welford for a stable variance)."""
+    n = returns.shape[0]
+    total = 0.0
+    mean = 0.0
+    m2 = 0.0
+    wins = 0
+    for i in range(n):
+        x = returns[i]
+        total += x
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x - mean)
+        if x > 0:
+            wins += 1
+    if n == 0:
+        return 0.0, 0.0, 0.0, 0.0
+    return total, mean, np.sqrt(m2 / n), wins / n * 100.0
+
+
+def _bincount_mean(codes: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    """Per-code mean via np.bincount, skipping NaN values like pandas groupby mean."""
+    finite = ~np.isnan(values)
+    sums = np.bincount(codes, weights=np.where(finite, values, 0.0), minlength=n_groups)
+    counts = np.bincount(codes, weights=finite, minlength=n_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return sums / counts
+
 
 class PerformanceAnalyzer:
     """
@@ -25,71 +119,193 @@ class PerformanceAnalyzer:
     def __init__(self, data_dir: str = None):
         self.data_dir = data_dir or os.path.dirname(os.path.abspath(__file__))
         self.signals_log_path = os.path.join(self.data_dir, 'data', 'signals_log.csv')
+        self.signals_parquet_path = os.path.join(self.data_dir, 'data', 'signals_log.parquet')
+        self.signals_bin_path = os.path.join(self.data_dir, 'data', 'signals_log.bin')
         self.trades_log_path = os.path.join(self.data_dir, 'data', 'trades_log.csv')
+        self.report_cache_path = os.path.join(self.data_dir, 'data', 'cache', 'performance_report.json')
+        
+    def _use_binlog(self) -> bool:
+        """Binary mirror is used only if it is at least as new as the CSV."""
+        return (os.path.exists(self.signals_bin_path)
+                and os.path.getmtime(self.signals_bin_path) >= os.path.getmtime(self.signals_log_path))
+    
+    def _use_parquet(self) -> bool:
+        """Parquet copy is used only if it is at least as new as the CSV."""
+        return (PYARROW_AVAILABLE and os.path.isdir(self.signals_parquet_path)
+                and os.path.getmtime(self.signals_parquet_path) >= os.path.getmtime(self.signals_log_path))
+    
+    def _load_cached_signals(self, mode: str = None) -> pd.DataFrame:
+        """
+        Parse signals log once per file mtime (signal_date/mode pre-parsed).
+        Binary log: fixed-width records memmapped (no parse), then mode rows gathered.
+        Parquet: mode filter pushed down to the partition, cached per mode.
+        CSV: whole file cached, then mode rows gathered via a precomputed position map.
+        """
+        df = None
+        if self._use_binlog():
+            path = self.signals_bin_path
+            try:
+                df = self._cached_frame(path, None, lambda: read_signal_binlog(path, SIGNAL_ANALYSIS_COLUMNS))
+                if mode and 'strategy_mode' in df.columns:
+                    df = df.take(_signals_cache[(path, None)][2].get(mode, _NO_ROWS))
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Binary signals read failed, falling back: {e}")
+                df = None
         
+        if df is None and self._use_parquet():
+            path = self.signals_parquet_path
+            try:
+                df = self._cached_frame(path, mode, lambda: self._read_signals_parquet(path, mode))
+            except (OSError, pa.ArrowException) as e:
+                logger.warning(f"Parquet signals read failed, falling back to CSV: {e}")
+        
+        if df is None:
+            path = self.signals_log_path
+            df = self._cached_frame(path, None, lambda: self._read_signals_csv(path))
+            if mode and 'strategy_mode' in df.columns:
+                # 문자열 비교 마스크 대신 모드별 행 위치로 gather
+                df = df.take(_signals_cache[(path, None)][2].get(mode, _NO_ROWS))
+        
+        return df
+    
+    @staticmethod
+    def _cached_frame(path: str, mode: Optional[str], reader) -> pd.DataFrame:
+        mtime = os.path.getmtime(path)
+        cached = _signals_cache.get((path, mode))
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        df = reader()
+        if 'signal_date' in df.columns:
+            df['signal_date'] = pd.to_datetime(df['signal_date'], errors='coerce')
+        for col in ('strategy_mode', 'sector'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        # float32 로 다운캐스트 - 집계 시 읽는 바이트 절반 (Numba 커널은 float64 로 누적)
+        for col in ('return_pct', 'score'):
+            if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = df[col].astype(np.float32)
+        
+        mode_rows = {}
+        if 'strategy_mode' in df.columns:
+            codes = df['strategy_mode'].cat.codes.to_numpy()
+            mode_rows = {m: np.flatnonzero(codes == code)
+                         for code, m in enumerate(df['strategy_mode'].cat.categories)}
+        
+        _signals_cache[(path, mode)] = (mtime, df, mode_rows)
+        return df
+    
+    @staticmethod
+    def _read_signals_parquet(path: str, mode: str = None) -> pd.DataFrame:
+        """Read only the analysis columns from the strategy_mode-partitioned Parquet dataset."""
+        dataset = pa_ds.dataset(path, format='parquet', partitioning='hive')
+        columns = [c for c in SIGNAL_ANALYSIS_COLUMNS + ['_row'] if c in dataset.schema.names]
+        row_filter = (pa_ds.field('strategy_mode') == mode) if mode else None
+        df = dataset.to_table(columns=columns, filter=row_filter).to_pandas()
+        
+        # 파티션 순으로 읽힌 행을 CSV 기록 순서로 복원
+        if '_row' in df.columns:
+            df = df.sort_values('_row', kind='stable').drop(columns='_row').reset_index(drop=True)
+        return df
+    
+    @staticmethod
+    def _read_signals_csv(path: str) -> pd.DataFrame:
+        """Read signals CSV with PyArrow (parallel C++ parser) or fall back to pandas."""
+        if not PYARROW_AVAILABLE:
+            return pd.read_csv(path)
+        
+        convert_options = pa_csv.ConvertOptions(column_types=_SIGNAL_COLUMN_TYPES)
+        try:
+            return pa_csv.read_csv(path, convert_options=convert_options).to_pandas()
+        except pa.ArrowInvalid as e:
+            logger.warning(f"PyArrow CSV parse failed, falling back to pandas: {e}")
+            return pd.read_csv(path)
+    
     def load_signals(self, mode: str = None) -> pd.DataFrame:
-        """Load signals log, optionally filtered by strategy mode."""
+        """Load signals log, optionally filtered by strategy mode. (cached - treat as read-only)"""
         if not os.path.exists(self.signals_log_path):
             logger.warning(f"Signals log not found: {self.signals_log_path}")
             return pd.DataFrame()
             
-        df = pd.read_csv(self.signals_log_path)
+        return self._load_cached_signals(mode)
+    
+    def load_signals_by_date(self) -> pd.DataFrame:
+        """All signals sorted once by signal_date with a DatetimeIndex. (cached - treat as read-only)"""
+        df = self.load_signals()
+        if 'signal_date' not in df.columns:
+            return df
         
-        if mode and 'strategy_mode' in df.columns:
-            df = df[df['strategy_mode'] == mode]
-            
-        return df
+        cached = _by_date_cache.get(self.signals_log_path)
+        if cached and cached[0] is df:
+            return cached[1]
+        
+        by_date = df.loc[df['signal_date'].notna()]
+        by_date = by_date.set_index(by_date['signal_date'].rename(None)).sort_index(kind='stable')
+        _by_date_cache[self.signals_log_path] = (df, by_date)
+        return by_date
+    
+    def get_signals_on(self, date) -> pd.DataFrame:
+        """Signals of a single day - binary-search slice on the sorted date index."""
+        by_date = self.load_signals_by_date()
+        if not isinstance(by_date.index, pd.DatetimeIndex):
+            return by_date.iloc[0:0]
+        
+        day = pd.Timestamp(date).normalize()
+        lo, hi = by_date.index.searchsorted([day, day + pd.Timedelta(days=1)])
+        return by_date.iloc[lo:hi]
     
-    def get_monthly_returns(self, mode: str = None) -> Dict[str, float]:
+    def get_monthly_returns(self, mode: str = None, _df: pd.DataFrame = None) -> Dict[str, float]:
         """
         Calculate monthly returns breakdown.
         
         Returns:
             Dict with 'YYYY-MM' keys and return percentages as values
         """
-        df = self.load_signals(mode)
+        df = self.load_signals(mode) if _df is None else _df
         if df.empty:
             return {}
             
         if 'signal_date' not in df.columns:
             return {}
             
-        df['month'] = pd.to_datetime(df['signal_date']).dt.to_period('M').astype(str)
+        # datetime64[M] 정수 키로 그룹핑, 'YYYY-MM' 문자열은 결과 키에만 변환
+        month_keys = df['signal_date'].to_numpy(dtype='datetime64[ns]').astype('datetime64[M]')
         
         # If we have return data
         if 'return_pct' in df.columns:
-            monthly = df.groupby('month')['return_pct'].mean().to_dict()
+            monthly = df['return_pct'].groupby(month_keys, sort=True).mean()
+            keys, values = monthly.index.to_numpy().astype('datetime64[M]'), monthly.tolist()
         else:
             # Placeholder if no return data yet
-            monthly = df.groupby('month').size().to_dict()
-            monthly = {k: 0 for k in monthly.keys()}
+            keys = np.unique(month_keys[~np.isnat(month_keys)])
+            values = [0] * len(keys)
             
-        return monthly
+        return dict(zip(np.datetime_as_string(keys, unit='M').tolist(), values))
     
-    def calculate_mdd(self, returns: List[float] = None) -> float:
+    def calculate_mdd(self, returns: Union[np.ndarray, List[float]] = None) -> float:
         """
         Calculate Maximum Drawdown.
         
+        Args:
+            returns: Return percentages - pass a float64 ndarray to skip conversion (lists still accepted)
+            
         Returns:
             Maximum drawdown as percentage (e.g., -15.5 for -15.5%)
         """
         if returns is None or len(returns) == 0:
             return 0.0
             
-        cumulative = np.cumprod(1 + np.array(returns) / 100)
-        rolling_max = np.maximum.accumulate(cumulative)
-        drawdowns = (cumulative - rolling_max) / rolling_max * 100
-        
-        return float(np.min(drawdowns))
+        return float(_mdd_kernel(np.asarray(returns, dtype=np.float64)))
     
-    def get_benchmark_alpha(self, mode: str = None, benchmark: str = "KOSPI") -> Dict[str, float]:
+    def get_benchmark_alpha(self, mode: str = None, benchmark: str = "KOSPI", _df: pd.DataFrame = None,
+                            _stats: Optional[tuple] = None) -> Dict[str, float]:
         """
         Calculate alpha vs benchmark index.
         
         Returns:
             Dict with 'strategy_return', 'benchmark_return', 'alpha'
         """
-        df = self.load_signals(mode)
+        df = self.load_signals(mode) if _df is None else _df
         
         result = {
             "strategy_return": 0.0,
@@ -101,8 +317,9 @@ class PerformanceAnalyzer:
         if df.empty or 'return_pct' not in df.columns:
             return result
             
-        # Calculate strategy return
-        result["strategy_return"] = float(df['return_pct'].sum())
+        # Calculate strategy return (reuse report summary stats if given)
+        total = _stats[0] if _stats is not None else df['return_pct'].sum()
+        result["strategy_return"] = float(total)
         
         # TODO: Fetch actual benchmark return from KOSPI data
         # For now, use placeholder
@@ -111,36 +328,50 @@ class PerformanceAnalyzer:
         
         return result
     
-    def get_sector_breakdown(self, mode: str = None) -> Dict[str, Dict[str, Any]]:
+    def get_sector_breakdown(self, mode: str = None, _df: pd.DataFrame = None) -> Dict[str, Dict[str, Any]]:
         """
         Analyze performance by sector.
         
         Returns:
             Dict with sector names as keys, containing count, avg_return, win_rate
         """
-        df = self.load_signals(mode)
+        df = self.load_signals(mode) if _df is None else _df
         
         if df.empty or 'sector' not in df.columns:
             return {}
             
+        # 섹터 코드(int) 위에서 np.bincount 로 그룹 합계 - 문자열 해싱 없는 groupby
+        sector = df['sector']
+        if not isinstance(sector.dtype, pd.CategoricalDtype):
+            sector = sector.astype('category')
+        codes = sector.cat.codes.to_numpy()
+        valid = codes >= 0  # NaN 섹터 제외 (groupby 와 동일)
+        codes = codes[valid]
+        n_sectors = len(sector.cat.categories)
+        
+        counts = np.bincount(codes, minlength=n_sectors)
+        has_score = 'score' in df.columns
+        has_return = 'return_pct' in df.columns
+        if has_score:
+            avg_score = _bincount_mean(codes, df['score'].to_numpy(dtype=np.float64)[valid], n_sectors)
+        if has_return:
+            returns = df['return_pct'].to_numpy(dtype=np.float64)[valid]
+            avg_return = _bincount_mean(codes, returns, n_sectors)
+            wins = np.bincount(codes, weights=returns > 0, minlength=n_sectors)
+        
+        # 처음 등장한 순서로 출력 (groupby sort=False 와 동일)
+        present, first_seen = np.unique(codes, return_index=True)
+        categories = sector.cat.categories
+        
         result = {}
-        for sector in df['sector'].unique():
-            sector_df = df[df['sector'] == sector]
-            
-            sector_result = {
-                "count": len(sector_df),
-                "avg_score": float(sector_df['score'].mean()) if 'score' in sector_df.columns else 0
+        for code in present[np.argsort(first_seen, kind='stable')]:
+            result[categories[code]] = {
+                "count": int(counts[code]),
+                "avg_score": float(avg_score[code]) if has_score else 0,
+                "avg_return": float(avg_return[code]) if has_return else 0.0,
+                "win_rate": float(wins[code] / counts[code] * 100) if has_return else 0.0
             }
             
-            if 'return_pct' in sector_df.columns:
-                sector_result["avg_return"] = float(sector_df['return_pct'].mean())
-                sector_result["win_rate"] = float((sector_df['return_pct'] > 0).mean() * 100)
-            else:
-                sector_result["avg_return"] = 0.0
-                sector_result["win_rate"] = 0.0
-                
-            result[sector] = sector_result
-            
         return result
     
     def get_strategy_comparison(self, modes: List[str]) -> Dict[str, Dict[str, Any]]:
@@ -153,21 +384,48 @@ class PerformanceAnalyzer:
         Returns:
             Dict with mode names as keys, containing performance metrics
         """
-        result = {}
+        df = self.load_signals(None)
+        has_score = 'score' in df.columns
+        has_return = 'return_pct' in df.columns
         
+        # 모드별 재로딩 대신 한 번 읽고 strategy_mode groupby 한 번으로 집계
+        agg = pd.DataFrame()
+        if not df.empty:
+            if 'strategy_mode' in df.columns:
+                df = df.loc[df['strategy_mode'].isin(modes)]
+                keys = df['strategy_mode']
+            else:
+                # 모드 컬럼이 없으면 load_signals(mode) 와 같이 모든 모드가 전체 로그를 본다
+                keys = pd.Series('_all', index=df.index)
+            
+            agg_spec = {'signal_count': ('_key', 'size')}
+            if has_score:
+                agg_spec['avg_score'] = ('score', 'mean')
+            if has_return:
+                df = df.assign(_win=df['return_pct'] > 0)
+                agg_spec.update(total_return=('return_pct', 'sum'), avg_return=('return_pct', 'mean'),
+                                win_rate=('_win', 'mean'))
+            
+            grouped = df.assign(_key=keys.to_numpy()).groupby('_key', observed=True, sort=False)
+            agg = grouped.agg(**agg_spec)
+            if has_return:
+                agg['mdd'] = grouped['return_pct'].agg(lambda r: _mdd_kernel(r.to_numpy(dtype=np.float64)))
+        
+        result = {}
         for mode in modes:
-            df = self.load_signals(mode)
+            key = mode if 'strategy_mode' in df.columns else '_all'
+            row = agg.loc[key] if key in agg.index else None
             
             mode_result = {
-                "signal_count": len(df),
-                "avg_score": float(df['score'].mean()) if len(df) > 0 and 'score' in df.columns else 0
+                "signal_count": int(row['signal_count']) if row is not None else 0,
+                "avg_score": float(row['avg_score']) if row is not None and has_score else 0
             }
             
-            if len(df) > 0 and 'return_pct' in df.columns:
-                mode_result["total_return"] = float(df['return_pct'].sum())
-                mode_result["avg_return"] = float(df['return_pct'].mean())
-                mode_result["win_rate"] = float((df['return_pct'] > 0).mean() * 100)
-                mode_result["mdd"] = self.calculate_mdd(df['return_pct'].tolist())
+            if row is not None and has_return:
+                mode_result["total_return"] = float(row['total_return'])
+                mode_result["avg_return"] = float(row['avg_return'])
+                mode_result["win_rate"] = float(row['win_rate'] * 100)
+                mode_result["mdd"] = float(row['mdd'])
             else:
                 mode_result["total_return"] = 0.0
                 mode_result["avg_return"] = 0.0
@@ -194,51 +452,112 @@ class PerformanceAnalyzer:
         if df.empty or 'return_pct' not in df.columns:
             return []
             
-        returns = df['return_pct'].values
+        returns = df['return_pct'].to_numpy(dtype=np.float64)  # float32 컬럼 -> float64 로 누적
         
         if len(returns) < window:
             return []
             
-        rolling_sharpe = []
-        for i in range(window, len(returns) + 1):
-            window_returns = returns[i-window:i]
-            mean_return = np.mean(window_returns)
-            std_return = np.std(window_returns)
-            
-            if std_return > 0:
-                sharpe = mean_return / std_return * np.sqrt(252)  # Annualized
-            else:
-                sharpe = 0
-                
-            rolling_sharpe.append(float(sharpe))
+        # O(N) 윈도우 평균/분산: 누적합(r, r^2) 차분
+        # 전체 평균을 빼고 계산해 r^2 누적합의 자리수 손실을 줄임 (분산은 이동 불변)
+        r = returns - returns.mean()
+        c1 = np.concatenate(([0.0], np.cumsum(r)))
+        c2 = np.concatenate(([0.0], np.cumsum(r * r)))
+        mean_c = (c1[window:] - c1[:-window]) / window
+        var = (c2[window:] - c2[:-window]) / window - mean_c ** 2
+        
+        # 반올림 오차 수준의 분산은 0 으로 취급 (기존 std > 0 조건과 동일하게 상수 구간 = 0)
+        tol = 1e-12 * np.maximum((c2[window:] - c2[:-window]) / window, 1.0)
+        std = np.sqrt(np.where(var > tol, var, 0.0))
+        mean_return = mean_c + returns.mean()
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sharpe = np.where(std > 0, mean_return / std * np.sqrt(252), 0.0)  # Annualized
             
-        return rolling_sharpe
+        return sharpe.tolist()
     
     def generate_comprehensive_report(self, mode: str = None) -> Dict[str, Any]:
         """
         Generate comprehensive performance report.
+        Memoized on the signals CSV mtime (in memory, seeded from the on-disk copy after restart).
+        Returns a deep copy with a fresh generated_at - callers may modify it freely.
         
         Returns:
             Complete performance analysis dictionary
         """
+        try:
+            mtime_ns = os.stat(self.signals_log_path).st_mtime_ns
+        except OSError:
+            return self._build_report(mode)
+        
+        key = (self.signals_log_path, mode or "all")
+        cached = _report_cache.get(key)
+        if cached is None:
+            cached = self._read_report_cache(key[1])
+        if cached and cached[0] == mtime_ns:
+            _report_cache[key] = cached
+            # 중첩 dict 까지 복사 (호출 측 수정이 캐시에 번지지 않도록), 생성 시각은 응답 시점으로
+            report = copy.deepcopy(cached[1])
+            report['generated_at'] = datetime.now().isoformat()
+            return report
+        
+        report = self._build_report(mode)
+        _report_cache[key] = (mtime_ns, report)
+        self._write_report_cache(key[1], mtime_ns, report)
+        return copy.deepcopy(report)
+    
+    def _read_report_cache(self, mode_key: str) -> Optional[tuple]:
+        try:
+            with open(self.report_cache_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)[mode_key]
+            return entry['mtime_ns'], entry['report']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _write_report_cache(self, mode_key: str, mtime_ns: int, report: Dict[str, Any]):
+        try:
+            with open(self.report_cache_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = {}
+        
+        entries[mode_key] = {'mtime_ns': mtime_ns, 'report': report}
+        tmp_path = f"{self.report_cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.report_cache_path), exist_ok=True)
+            if ORJSON_AVAILABLE:
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(entries, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.report_cache_path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Report cache write failed: {e}")
+    
+    def _build_report(self, mode: str = None) -> Dict[str, Any]:
         df = self.load_signals(mode)
         
+        has_returns = 'return_pct' in df.columns and len(df) > 0
+        if has_returns:
+            returns = df['return_pct'].to_numpy(dtype=np.float64)
+            stats = _summary_stats(returns)  # (total, mean, std, win_rate) in one scan
+        
         report = {
             "generated_at": datetime.now().isoformat(),
             "mode": mode or "all",
             "signal_count": len(df),
-            "monthly_returns": self.get_monthly_returns(mode),
-            "sector_breakdown": self.get_sector_breakdown(mode),
-            "benchmark_alpha": self.get_benchmark_alpha(mode)
+            "monthly_returns": self.get_monthly_returns(mode, _df=df),
+            "sector_breakdown": self.get_sector_breakdown(mode, _df=df),
+            "benchmark_alpha": self.get_benchmark_alpha(mode, _df=df, _stats=stats if has_returns else None)
         }
         
-        if 'return_pct' in df.columns and len(df) > 0:
-            returns = df['return_pct'].tolist()
+        if has_returns:
+            total, mean, std, win_rate = stats
             report["mdd"] = self.calculate_mdd(returns)
-            report["total_return"] = float(sum(returns))
-            report["avg_return"] = float(np.mean(returns))
-            report["std_return"] = float(np.std(returns))
-            report["win_rate"] = float((df['return_pct'] > 0).mean() * 100)
+            report["total_return"] = float(total)
+            report["avg_return"] = float(mean)
+            report["std_return"] = float(std)
+            report["win_rate"] = float(win_rate)
             report["sharpe_ratio"] = report["avg_return"] / report["std_return"] * np.sqrt(252) if report["std_return"] > 0 else 0
         else:
             report["mdd"] = 0.0
@@ -16,21 +16,19 @@ import os
 import sys
 import time
 import signal
+import json
 import logging
-import subprocess
-import schedule
-from datetime import datetime
-from pathlib import Path
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/scheduler.log'),
-        logging.StreamHandler()
-    ]
-)
+import multiprocessing
+import heapq
+from datetime import datetime, timedelta
+
+# orjson - 빠른 JSON 직렬화 (Optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,8 +53,6 @@ class Config:
     HISTORY_TIMEOUT = 900
     REPORT_TIMEOUT = 180
     
-    PYTHON_PATH = sys.executable
-    
     @classmethod
     def ensure_dirs(cls):
         """Ensure required directories exist"""
@@ -64,178 +60,219 @@ class Config:
         os.makedirs(cls.DATA_DIR, exist_ok=True)
 
 
-def run_command(cmd, task_name, timeout=300):
-    """Execute command with timeout and logging"""
-    logger.info(f"🚀 Starting: {task_name}")
-    start_time = time.time()
-    
+def setup_logging():
+    """Configure logging (called from main - importing the module opens no log file)"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(os.path.join(Config.LOG_DIR, 'scheduler.log')),
+            logging.StreamHandler()
+        ]
+    )
+
+
+# 작업을 같은 프로세스에서 import 해 실행 - kr_market 패키지 경로 보장
+if Config.BASE_DIR not in sys.path:
+    sys.path.insert(0, Config.BASE_DIR)
+
+
+# 작업은 자식 프로세스에서 실행 - 시간 초과 시 terminate() 로 확실히 중단
+# (같은 프로세스/스레드에서 돌리면 작업 안의 except Exception 이 타임아웃을 삼키고 계속 실행됨)
+# fork 는 이미 import 된 스케줄러 상태를 그대로 물려받아 인터프리터 cold start 없음 (Windows 는 spawn)
+_TASK_CONTEXT = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn')
+# terminate() 후 정리를 기다리는 시간, 넘기면 kill()
+TERMINATE_GRACE = 5
+
+
+def _task_entry(func, task_name):
+    """Child process body - exit code 0 on success, 1 on failure/exception"""
+    # Scheduler 의 SIGTERM 핸들러(플래그만 세움)를 물려받으면 terminate() 가 작업을 멈추지 못함
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=Config.BASE_DIR,
-            capture_output=True,
-            text=True,
-            timeout=timeout
-        )
-        
-        elapsed = time.time() - start_time
-        
-        if result.returncode == 0:
-            logger.info(f"✅ Completed: {task_name} ({elapsed:.1f}s)")
-            if result.stdout:
-                logger.debug(f"Output: {result.stdout[:500]}")
-            return True
-        else:
-            logger.error(f"❌ Failed: {task_name} (code {result.returncode})")
-            if result.stderr:
-                logger.error(f"Error: {result.stderr[:500]}")
-            return False
-            
-    except subprocess.TimeoutExpired:
-        logger.error(f"⏱️ Timeout: {task_name} (>{timeout}s)")
-        return False
+        result = func()
+    except SystemExit:
+        raise
     except Exception as e:
         logger.error(f"💥 Exception in {task_name}: {e}")
+        sys.exit(1)
+    sys.exit(1 if result is False else 0)
+
+
+def _start_task(func, task_name):
+    """Start task in a child process, returns (process, start_time)"""
+    logger.info(f"🚀 Starting: {task_name}")
+    process = _TASK_CONTEXT.Process(target=_task_entry, args=(func, task_name), name=task_name)
+    process.start()
+    return process, time.time()
+
+
+def _finish_task(process, start_time, task_name, timeout):
+    """Wait for a started task until start_time + timeout, killing it on timeout"""
+    process.join(max(0, start_time + timeout - time.time()))
+    
+    if process.is_alive():
+        process.terminate()
+        process.join(TERMINATE_GRACE)
+        if process.is_alive():
+            process.kill()
+            process.join()
+        logger.error(f"⏱️ Timeout: {task_name} (>{timeout}s)")
         return False
+    
+    if process.exitcode == 0:
+        logger.info(f"✅ Completed: {task_name} ({time.time() - start_time:.1f}s)")
+        return True
+    logger.error(f"❌ Failed: {task_name} (code {process.exitcode})")
+    return False
+
+
+def run_task(func, task_name, timeout=300):
+    """Execute task in a forked child process with timeout and logging"""
+    process, start_time = _start_task(func, task_name)
+    return _finish_task(process, start_time, task_name, timeout)
+
+
+def _fetch_daily_prices():
+    from kr_market.scripts.create_daily_prices import create_daily_prices
+    return create_daily_prices()
+
+
+def _fetch_institutional_data():
+    from kr_market.scripts.create_institutional_data import create_institutional_data
+    return create_institutional_data()
+
+
+# (작업, 이름, 타임아웃) - 단독 실행과 run_full_update 의 동시 실행이 같이 사용
+PRICE_TASK = (_fetch_daily_prices, 'Daily price update', Config.PRICE_TIMEOUT)
+INST_TASK = (_fetch_institutional_data, 'Institutional data update', Config.INST_TIMEOUT)
 
 
 def update_daily_prices():
     """Update daily price data"""
-    script = f"""
-import sys
-sys.path.insert(0, '{Config.BASE_DIR}')
-from kr_market.scripts.create_daily_prices import main
-main()
-"""
-    return run_command(
-        [Config.PYTHON_PATH, '-c', script],
-        'Daily price update',
-        timeout=Config.PRICE_TIMEOUT
-    )
+    func, task_name, timeout = PRICE_TASK
+    return run_task(func, task_name, timeout=timeout)
 
 
 def update_institutional_data():
     """Update institutional flow data"""
-    script = f"""
-import sys
-sys.path.insert(0, '{Config.BASE_DIR}')
-from kr_market.scripts.create_institutional_data import main
-main()
-"""
-    return run_command(
-        [Config.PYTHON_PATH, '-c', script],
-        'Institutional data update',
-        timeout=Config.INST_TIMEOUT
-    )
+    func, task_name, timeout = INST_TASK
+    return run_task(func, task_name, timeout=timeout)
+
+
+def _scan_vcp_signals():
+    from kr_market.signal_tracker import SignalTracker
+    
+    tracker = SignalTracker()
+    signals = tracker.scan_today_signals()
+    logger.info(f"Found {len(signals)} VCP signals")
 
 
 def run_vcp_signal_scan():
     """Run VCP signal scan"""
-    script = f"""
-import sys
-sys.path.insert(0, '{Config.BASE_DIR}')
-from kr_market.signal_tracker import SignalTracker
+    return run_task(_scan_vcp_signals, 'VCP signal scan', timeout=Config.SIGNAL_TIMEOUT)
 
-tracker = SignalTracker()
-signals = tracker.scan_today_signals()
-print(f'Found {{len(signals)}} VCP signals')
-"""
-    return run_command(
-        [Config.PYTHON_PATH, '-c', script],
-        'VCP signal scan',
-        timeout=Config.SIGNAL_TIMEOUT
-    )
+
+def _build_daily_report():
+    from kr_market.performance_analyzer import PerformanceAnalyzer
+    
+    # Read signals log (signal_date 는 한 번 파싱된 정렬 인덱스로 조회)
+    analyzer = PerformanceAnalyzer(Config.DATA_DIR)
+    if not os.path.exists(analyzer.signals_log_path):
+        logger.info('No signals log found')
+        return
+    
+    today_str = datetime.now().strftime('%Y-%m-%d')
+    today_signals = analyzer.get_signals_on(today_str)
+    status = today_signals.get('status')
+    
+    report = {
+        'date': today_str,
+        'total_signals': len(today_signals),
+        'open_signals': int((status == 'OPEN').sum()) if status is not None else 0,
+        'closed_signals': int((status == 'CLOSED').sum()) if status is not None else 0,
+        'generated_at': datetime.now().isoformat()
+    }
+    
+    # Save report
+    report_path = os.path.join(Config.DATA_DIR, 'data', 'daily_report.json')
+    if ORJSON_AVAILABLE:
+        with open(report_path, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    
+    logger.info(f"Generated daily report: {report}")
 
 
 def generate_daily_report():
     """Generate daily report JSON"""
-    script = f"""
-import sys
-import json
-import pandas as pd
-from datetime import datetime
-sys.path.insert(0, '{Config.BASE_DIR}')
-
-# Read signals log
-signals_path = '{Config.DATA_DIR}/signals_log.csv'
-if not os.path.exists(signals_path):
-    print('No signals log found')
-    sys.exit(0)
-
-df = pd.read_csv(signals_path)
-today_str = datetime.now().strftime('%Y-%m-%d')
-today_signals = df[df['signal_date'] == today_str]
-
-report = {{
-    'date': today_str,
-    'total_signals': len(today_signals),
-    'open_signals': len(today_signals[today_signals['status'] == 'OPEN']),
-    'closed_signals': len(today_signals[today_signals['status'] == 'CLOSED']),
-    'generated_at': datetime.now().isoformat()
-}}
-
-# Save report
-report_path = '{Config.DATA_DIR}/data/daily_report.json'
-with open(report_path, 'w', encoding='utf-8') as f:
-    json.dump(report, f, ensure_ascii=False, indent=2)
-
-print(f'Generated daily report: {{report}}')
-"""
-    return run_command(
-        [Config.PYTHON_PATH, '-c', script],
-        'Daily report generation',
-        timeout=Config.REPORT_TIMEOUT
-    )
+    return run_task(_build_daily_report, 'Daily report generation', timeout=Config.REPORT_TIMEOUT)
+
+
+def _collect_history():
+    from kr_market.scripts.all_institutional_trend_data import main as history_main
+    return history_main(max_stocks=100)
 
 
 def collect_historical_institutional():
     """Collect historical institutional data (Saturday only)"""
     logger.info("📚 Collecting historical institutional data...")
-    script = f"""
-import sys
-sys.path.insert(0, '{Config.BASE_DIR}')
-from kr_market.scripts.all_institutional_trend_data import main
-main(max_stocks=100)
-"""
-    return run_command(
-        [Config.PYTHON_PATH, '-c', script],
+    return run_task(
+        _collect_history,
         'Historical institutional data collection',
         timeout=Config.HISTORY_TIMEOUT
     )
 
 
 def run_full_update():
-    """Run all update tasks in sequence"""
+    """Run all update tasks (price + institutional fetches concurrently, then scan and report)"""
     logger.info("=" * 60)
     logger.info("🔄 Running FULL UPDATE sequence")
     logger.info("=" * 60)
     
-    tasks = [
-        update_daily_prices,
-        update_institutional_data,
-        run_vcp_signal_scan,
-        generate_daily_report
-    ]
+    # 가격/수급 수집은 서로 독립 (네트워크 대기) - 두 자식 프로세스를 동시에 띄우고
+    # 각자의 타임아웃(초과 시 종료)까지 기다린 뒤 스캔/리포트 순차 실행 (수집 중인 파일을 읽지 않음)
+    fetches = [(_start_task(func, task_name), task_name, timeout) for func, task_name, timeout in (PRICE_TASK, INST_TASK)]
+    results = [_finish_task(process, start_time, task_name, timeout)
+               for (process, start_time), task_name, timeout in fetches]
     
-    results = []
+    tasks = [run_vcp_signal_scan, generate_daily_report]
     for task in tasks:
-        success = task()
-        results.append(success)
-        time.sleep(5)  # Brief delay between tasks
+        results.append(task())
     
     success_count = sum(results)
     logger.info("=" * 60)
-    logger.info(f"✅ Full update complete: {success_count}/{len(tasks)} tasks succeeded")
+    logger.info(f"✅ Full update complete: {success_count}/{len(results)} tasks succeeded")
     logger.info("=" * 60)
     
     return all(results)
 
 
+WEEKDAYS = (0, 1, 2, 3, 4)
+SATURDAY = (5,)
+
+# 다음 작업까지 한 번에 자는 최대 시간 - 종료 시그널 반응성 유지
+MAX_SLEEP = 60
+
+
+def _next_fire(days, at, now):
+    """Epoch of the next `at` (HH:MM, local time) on one of `days` strictly after `now`"""
+    hour, minute = map(int, at.split(':'))
+    candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    for offset in range(8):
+        fire = candidate + timedelta(days=offset)
+        if fire.weekday() in days and fire > now:
+            return fire.timestamp()
+
+
 class Scheduler:
     """Main scheduler class"""
     
     def __init__(self):
         self.running = True
+        self._jobs = []  # heap of (next_run_epoch, seq, days, at, job)
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
         logger.info("📅 Scheduler initialized")
@@ -249,17 +286,19 @@ class Scheduler:
         """Register scheduled tasks"""
         logger.info("⏰ Setting up schedules...")
         
-        weekdays = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday']
-        
-        # Weekday schedules
-        for day in weekdays:
-            getattr(schedule.every(), day).at(Config.PRICE_UPDATE_TIME).do(update_daily_prices)
-            getattr(schedule.every(), day).at(Config.INST_UPDATE_TIME).do(update_institutional_data)
-            getattr(schedule.every(), day).at(Config.SIGNAL_SCAN_TIME).do(run_vcp_signal_scan)
-            getattr(schedule.every(), day).at(Config.REPORT_TIME).do(generate_daily_report)
+        jobs = [
+            # Weekday schedules
+            (WEEKDAYS, Config.PRICE_UPDATE_TIME, update_daily_prices),
+            (WEEKDAYS, Config.INST_UPDATE_TIME, update_institutional_data),
+            (WEEKDAYS, Config.SIGNAL_SCAN_TIME, run_vcp_signal_scan),
+            (WEEKDAYS, Config.REPORT_TIME, generate_daily_report),
+            # Saturday history collection
+            (SATURDAY, Config.HISTORY_TIME, collect_historical_institutional),
+        ]
         
-        # Saturday history collection
-        schedule.every().saturday.at(Config.HISTORY_TIME).do(collect_historical_institutional)
+        now = datetime.now()
+        self._jobs = [(_next_fire(days, at, now), seq, days, at, job) for seq, (days, at, job) in enumerate(jobs)]
+        heapq.heapify(self._jobs)
         
         logger.info(f"   📍 Prices: Weekdays at {Config.PRICE_UPDATE_TIME}")
         logger.info(f"   📍 Institutional: Weekdays at {Config.INST_UPDATE_TIME}")
@@ -270,13 +309,22 @@ class Scheduler:
     
     def run(self):
         """Run scheduler loop"""
-        logger.info("🚀 Scheduler started (checking every 30s)")
+        logger.info("🚀 Scheduler started (sleeping until next job)")
         logger.info("Press Ctrl+C to stop")
         
-        while self.running:
+        while self.running and self._jobs:
             try:
-                schedule.run_pending()
-                time.sleep(30)
+                # 가장 이른 작업 시각까지 잠들고, 도래한 작업만 꺼내 실행 후 다음 회차로 재등록
+                delay = self._jobs[0][0] - time.time()
+                if delay > 0:
+                    time.sleep(min(delay, MAX_SLEEP))
+                    continue
+                
+                _, seq, days, at, job = heapq.heappop(self._jobs)
+                try:
+                    job()
+                finally:
+                    heapq.heappush(self._jobs, (_next_fire(days, at, datetime.now()), seq, days, at, job))
             except Exception as e:
                 logger.error(f"Scheduler error: {e}")
                 time.sleep(60)
@@ -300,6 +348,9 @@ def main():
     
     # Ensure directories exist
     Config.ensure_dirs()
+    setup_logging()
+    # 수집 스크립트들이 BASE_DIR 기준 상대경로(kr_market/...)로 저장
+    os.chdir(Config.BASE_DIR)
     
     # Handle immediate tasks
     if args.now:
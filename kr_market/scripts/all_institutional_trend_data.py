@@ -10,17 +10,49 @@ Generates supply/demand index (0-100) and accumulation signals.
 Output: kr_market/data/all_institutional_trend_data.csv
 """
 
+import asyncio
 import os
+import random
+import re
+import sys
 import time
-import requests
+import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
-from dataclasses import dataclass, asdict
+from bs4 import BeautifulSoup, SoupStrainer
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import List, Optional, Tuple
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트 (kr_market 패키지 import 용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from kr_market._http import NAVER_ENCODING, get_session
+from kr_market._stock_list import load_stock_list
+from kr_market.jit import njit, prange
+
+# lxml - C 기반 HTML 파서 (Optional, 없으면 html.parser)
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# 수급 테이블(table.type2)만 트리로 만듦 (파싱 중엔 class 가 원문 문자열이라 정규식으로 매칭)
+TABLE_STRAINER = SoupStrainer('table', class_=re.compile(r'(^|\s)type2(\s|$)'))
+
+# 정수 파싱이 안 될 때(소수점, 단위 문자 등)만 쓰는 숫자 패턴
+NUMBER_PATTERN = re.compile(r'[+-]?\d+(?:\.\d+)?')
+
+# pyarrow - C++ CSV writer (Optional, 없으면 pandas.to_csv)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -58,6 +90,7 @@ class InstitutionalData:
     foreign_net_buy_5d: int = 0
     
     # Volume ratios
+    volume_20d: int = 0
     institutional_ratio_20d: float = 0.0
     foreign_ratio_20d: float = 0.0
     
@@ -73,6 +106,108 @@ class InstitutionalData:
     accumulation_intensity: str = '보통'
 
 
+# Stage / intensity 구간 (score >= bin 이면 다음 라벨)
+STAGE_BINS = np.array([15, 30, 40, 60, 70, 85])
+STAGE_LABELS = ['강한분산', '분산', '약분산', '중립', '약매집', '매집', '강한매집']
+INTENSITY_BINS = np.array([60, 70, 85])
+INTENSITY_LABELS = ['약함', '보통', '강함', '매우강함']
+# _trend_code 반환값 -> 라벨
+TREND_LABELS = ['neutral', 'buy', 'strong_buy', 'sell', 'strong_sell']
+
+# _analyze_kernel 출력 컬럼
+(SUM_INST_60D, SUM_INST_20D, SUM_INST_10D, SUM_INST_5D,
+ SUM_FOREIGN_60D, SUM_FOREIGN_20D, SUM_FOREIGN_10D, SUM_FOREIGN_5D, SUM_VOLUME_20D) = range(9)
+RATIO_INST, RATIO_FOREIGN, RATIO_SCORE = range(3)
+
+
+@njit(cache=True)
+def _trend_code(net_5d, net_10d, buy_threshold, strong_buy_threshold):
+    """Trend based on net buy amounts (index into TREND_LABELS)"""
+    if net_5d >= strong_buy_threshold and net_10d >= buy_threshold:
+        return 2
+    elif net_5d >= buy_threshold:
+        return 1
+    elif net_5d <= -strong_buy_threshold and net_10d <= -buy_threshold:
+        return 4
+    elif net_5d <= -buy_threshold:
+        return 3
+    return 0
+
+
+@njit(cache=True)
+def _period_score(net_60d, net_20d, net_5d, buy_threshold):
+    """60일 순매수 +10, 20일 +15, 5일 (buy 초과 +15 / buy/2 초과 +10) -> 0-40"""
+    score = 0
+    if net_60d > 0:
+        score += 10
+    if net_20d > 0:
+        score += 15
+    if net_5d > buy_threshold:
+        score += 15
+    elif net_5d > buy_threshold / 2:
+        score += 10
+    return score
+
+
+@njit(parallel=True, cache=True)
+def _analyze_kernel(inst, foreign, volume, days, buy_inst, strong_buy_inst, buy_foreign, strong_buy_foreign):
+    """
+    종목 전체 (N, L) 배열(최신일 먼저, days[i] 이후는 0 패딩)을 한 번에 분석
+    Returns: sums (N, 9) int64, ratios (N, 3) float64 [inst, foreign, supply_demand_index], trends (N, 2) int8
+    """
+    n = inst.shape[0]
+    sums = np.zeros((n, 9), dtype=np.int64)
+    ratios = np.zeros((n, 3), dtype=np.float64)
+    trends = np.zeros((n, 2), dtype=np.int8)
+    
+    for i in prange(n):
+        n_days = days[i]
+        inst_sum = 0
+        foreign_sum = 0
+        vol_sum = 0
+        inst_head_20 = 0
+        foreign_head_20 = 0
+        for j in range(n_days):
+            inst_sum += inst[i, j]
+            foreign_sum += foreign[i, j]
+            vol_sum += volume[i, j]
+            # N일 합계는 N일치가 있을 때만 (없으면 0)
+            if j == 4:
+                sums[i, SUM_INST_5D] = inst_sum
+                sums[i, SUM_FOREIGN_5D] = foreign_sum
+            elif j == 9:
+                sums[i, SUM_INST_10D] = inst_sum
+                sums[i, SUM_FOREIGN_10D] = foreign_sum
+            elif j == 19:
+                sums[i, SUM_INST_20D] = inst_sum
+                sums[i, SUM_FOREIGN_20D] = foreign_sum
+                sums[i, SUM_VOLUME_20D] = vol_sum
+            if j < 20:
+                inst_head_20 = inst_sum
+                foreign_head_20 = foreign_sum
+        # 60일 합계는 표 전체 합 (60일 이상일 때)
+        if n_days >= 60:
+            sums[i, SUM_INST_60D] = inst_sum
+            sums[i, SUM_FOREIGN_60D] = foreign_sum
+        
+        # Volume ratios (20일 미만이면 거래량 1 로 간주, 순매수는 있는 만큼)
+        total_vol = sums[i, SUM_VOLUME_20D] if n_days >= 20 else 1
+        if total_vol > 0:
+            ratios[i, RATIO_INST] = abs(inst_head_20) / total_vol * 100
+            ratios[i, RATIO_FOREIGN] = abs(foreign_head_20) / total_vol * 100
+        
+        # Supply/demand index (0-100)
+        score = (_period_score(sums[i, SUM_INST_60D], sums[i, SUM_INST_20D], sums[i, SUM_INST_5D], buy_inst)
+                 + _period_score(sums[i, SUM_FOREIGN_60D], sums[i, SUM_FOREIGN_20D], sums[i, SUM_FOREIGN_5D], buy_foreign))
+        volume_weight = min(total_vol / 10_000_000, 1.0)
+        ratios[i, RATIO_SCORE] = min(max(score * (0.8 + 0.2 * volume_weight), 0.0), 100.0)
+        
+        trends[i, 0] = _trend_code(sums[i, SUM_INST_5D], sums[i, SUM_INST_10D], buy_inst, strong_buy_inst)
+        trends[i, 1] = _trend_code(sums[i, SUM_FOREIGN_5D], sums[i, SUM_FOREIGN_10D], buy_foreign, strong_buy_foreign)
+    
+    return sums, ratios, trends
+
+
 class NaverFinanceScraper:
     """Naver Finance institutional data scraper"""
     
@@ -81,261 +216,179 @@ class NaverFinanceScraper:
         self.output_path = self.data_dir / 'all_institutional_trend_data.csv'
         self.base_url = "https://finance.naver.com/item/frgn.naver"
         
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        # 프로세스 공유 세션 (keep-alive 연결/쿠키 유지, requests-cache 가 있으면 디스크 캐시)
+        self.session = get_session()
         
         self.request_delay = 0.3
-        self.max_retries = 3
         self.config = TrendConfig()
         
         logger.info("✅ Naver Finance Scraper initialized")
     
     def scrape_ticker(self, ticker: str, name: str = '') -> Optional[InstitutionalData]:
         """Scrape 60-day institutional data for single ticker"""
+        series = self._fetch_series(ticker)
+        return self._analyze_batch([(ticker, name, series)])[0] if series else None
+    
+    def _fetch_series(self, ticker: str, delay: bool = True) -> Optional[Tuple[List[int], List[int], List[int]]]:
+        """
+        Fetch (inst_nets, foreign_nets, volumes), most recent day first
+        delay=False skips the pre-request sleep (the async scraper staggers requests itself)
+        """
         url = f"{self.base_url}?code={ticker}"
         
-        for attempt in range(self.max_retries):
-            try:
+        # 재시도(지수 backoff, Retry-After 준수)는 세션 어댑터가 처리
+        try:
+            if delay:
                 time.sleep(self.request_delay)
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                table = soup.select_one('table.type2')
-                
-                if not table:
-                    logger.warning(f"No data table for {ticker}")
-                    return None
-                
-                # Parse table rows
-                rows = table.select('tr')[2:]  # Skip header rows
-                data_rows = []
-                
-                for row in rows:
-                    cols = row.select('td')
-                    if len(cols) >= 10:
-                        try:
-                            date_str = cols[0].get_text(strip=True)
-                            close_price = self._parse_number(cols[1].get_text(strip=True))
-                            volume = self._parse_number(cols[5].get_text(strip=True))
-                            foreign_net = self._parse_number(cols[6].get_text(strip=True))
-                            inst_net = self._parse_number(cols[9].get_text(strip=True))
-                            
-                            data_rows.append({
-                                'date': date_str,
-                                'close': close_price,
-                                'volume': volume,
-                                'foreign_net': foreign_net,
-                                'inst_net': inst_net
-                            })
-                        except Exception:
-                            continue
-                
-                if not data_rows:
-                    return None
-                
-                # Analyze data
-                return self._analyze_data(ticker, name, data_rows)
-                
-            except Exception as e:
-                logger.error(f"Error scraping {ticker} (attempt {attempt + 1}): {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2)
-                    continue
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+
+            soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=TABLE_STRAINER, from_encoding=NAVER_ENCODING)
+            table = soup.select_one('table.type2')
+
+            if not table:
+                logger.warning(f"No data table for {ticker}")
                 return None
-        
-        return None
+
+            # Parse table rows (최신일 먼저) - 분석에 쓰는 세 컬럼만 리스트로
+            rows = table.select('tr')[2:]  # Skip header rows
+            volumes, foreign_nets, inst_nets = [], [], []
+
+            for row in rows:
+                cols = row.select('td')
+                if len(cols) >= 10:
+                    try:
+                        volume = self._parse_number(cols[5].get_text(strip=True))
+                        foreign_net = self._parse_number(cols[6].get_text(strip=True))
+                        inst_net = self._parse_number(cols[9].get_text(strip=True))
+                    except Exception:
+                        continue
+                    volumes.append(volume)
+                    foreign_nets.append(foreign_net)
+                    inst_nets.append(inst_net)
+
+            if not volumes:
+                return None
+
+            return inst_nets, foreign_nets, volumes
+
+        except Exception as e:
+            logger.error(f"Error scraping {ticker}: {e}")
+            return None
     
     def _parse_number(self, text: str) -> int:
-        """Parse number from Korean formatted string"""
-        text = text.replace(',', '').replace('-', '0')
+        """Parse number from Korean formatted string ('+1,234' / '-1,234', '-' or blank -> 0)"""
+        text = text.strip().replace(',', '')
         try:
-            return int(float(text))
-        except:
-            return 0
+            return int(text)  # fast path - 부호 포함 정수
+        except ValueError:
+            match = NUMBER_PATTERN.search(text)
+            return int(float(match.group())) if match else 0
     
-    def _analyze_data(self, ticker: str, name: str, data_rows: List[Dict]) -> InstitutionalData:
-        """Analyze institutional data and calculate metrics"""
-        df = pd.DataFrame(data_rows)
-        
-        # Calculate period sums
-        inst_60d = int(df['inst_net'].sum()) if len(df) >= 60 else 0
-        inst_20d = int(df.head(20)['inst_net'].sum()) if len(df) >= 20 else 0
-        inst_10d = int(df.head(10)['inst_net'].sum()) if len(df) >= 10 else 0
-        inst_5d = int(df.head(5)['inst_net'].sum()) if len(df) >= 5 else 0
-        
-        foreign_60d = int(df['foreign_net'].sum()) if len(df) >= 60 else 0
-        foreign_20d = int(df.head(20)['foreign_net'].sum()) if len(df) >= 20 else 0
-        foreign_10d = int(df.head(10)['foreign_net'].sum()) if len(df) >= 10 else 0
-        foreign_5d = int(df.head(5)['foreign_net'].sum()) if len(df) >= 5 else 0
-        
-        # Calculate volume ratios
-        total_vol_20d = df.head(20)['volume'].sum() if len(df) >= 20 else 1
-        inst_ratio = abs(df.head(20)['inst_net'].sum()) / total_vol_20d * 100 if total_vol_20d > 0 else 0
-        foreign_ratio = abs(df.head(20)['foreign_net'].sum()) / total_vol_20d * 100 if total_vol_20d > 0 else 0
-        
-        # Determine trends
-        inst_trend = self._determine_trend(inst_5d, inst_10d, self.config.buy_inst, self.config.strong_buy_inst)
-        foreign_trend = self._determine_trend(foreign_5d, foreign_10d, self.config.buy_foreign, self.config.strong_buy_foreign)
-        
-        # Calculate supply/demand index
-        supply_demand_index = self._calculate_supply_demand_index({
-            'inst_60d': inst_60d,
-            'inst_20d': inst_20d,
-            'inst_5d': inst_5d,
-            'foreign_60d': foreign_60d,
-            'foreign_20d': foreign_20d,
-            'foreign_5d': foreign_5d,
-            'inst_ratio': inst_ratio,
-            'foreign_ratio': foreign_ratio,
-            'total_vol': total_vol_20d
-        })
+    def _analyze_batch(self, items: List[tuple]) -> List[InstitutionalData]:
+        """Analyze (ticker, name, (inst_nets, foreign_nets, volumes)) items in one kernel call"""
+        if not items:
+            return []
         
-        # Determine stage
-        supply_demand_stage = self._get_stage_label(supply_demand_index)
+        days = np.array([len(series[0]) for _, _, series in items], dtype=np.int64)
+        shape = (len(items), int(days.max()))
+        inst, foreign, volume = (np.zeros(shape, dtype=np.int64) for _ in range(3))
+        for i, (_, _, (inst_nets, foreign_nets, volumes)) in enumerate(items):
+            inst[i, :days[i]] = inst_nets
+            foreign[i, :days[i]] = foreign_nets
+            volume[i, :days[i]] = volumes
         
-        # Accumulation signals
-        strong_acc = 1 if supply_demand_index >= 85 else 0
-        acc_signal = 1 if supply_demand_index >= 70 else 0
-        acc_intensity = self._get_accumulation_intensity(supply_demand_index)
+        cfg = self.config
+        sums, ratios, trends = _analyze_kernel(inst, foreign, volume, days, cfg.buy_inst, cfg.strong_buy_inst,
+                                               cfg.buy_foreign, cfg.strong_buy_foreign)
+        stages = np.searchsorted(STAGE_BINS, ratios[:, RATIO_SCORE], side='right')
+        intensities = np.searchsorted(INTENSITY_BINS, ratios[:, RATIO_SCORE], side='right')
         
-        return InstitutionalData(
-            ticker=ticker,
-            name=name,
-            scrape_date=datetime.now().strftime('%Y-%m-%d'),
-            total_days=len(df),
-            institutional_net_buy_60d=inst_60d,
-            institutional_net_buy_20d=inst_20d,
-            institutional_net_buy_10d=inst_10d,
-            institutional_net_buy_5d=inst_5d,
-            foreign_net_buy_60d=foreign_60d,
-            foreign_net_buy_20d=foreign_20d,
-            foreign_net_buy_10d=foreign_10d,
-            foreign_net_buy_5d=foreign_5d,
-            institutional_ratio_20d=round(inst_ratio, 2),
-            foreign_ratio_20d=round(foreign_ratio, 2),
-            institutional_trend=inst_trend,
-            foreign_trend=foreign_trend,
-            supply_demand_index=round(supply_demand_index, 1),
-            supply_demand_stage=supply_demand_stage,
-            strong_accumulation=strong_acc,
-            accumulation_signal=acc_signal,
-            accumulation_intensity=acc_intensity
-        )
-    
-    def _determine_trend(self, net_5d: int, net_10d: int, buy_threshold: int, strong_buy_threshold: int) -> str:
-        """Determine trend based on net buy amounts"""
-        if net_5d >= strong_buy_threshold and net_10d >= buy_threshold:
-            return 'strong_buy'
-        elif net_5d >= buy_threshold:
-            return 'buy'
-        elif net_5d <= -strong_buy_threshold and net_10d <= -buy_threshold:
-            return 'strong_sell'
-        elif net_5d <= -buy_threshold:
-            return 'sell'
-        else:
-            return 'neutral'
+        scrape_date = datetime.now().strftime('%Y-%m-%d')
+        results = []
+        for (ticker, name, _), n_days, s, (inst_ratio, foreign_ratio, score), (inst_trend, foreign_trend), stage, intensity in zip(
+                items, days.tolist(), sums.tolist(), ratios.tolist(), trends.tolist(), stages.tolist(), intensities.tolist()):
+            results.append(InstitutionalData(
+                ticker=ticker,
+                name=name,
+                scrape_date=scrape_date,
+                total_days=n_days,
+                institutional_net_buy_60d=s[SUM_INST_60D],
+                institutional_net_buy_20d=s[SUM_INST_20D],
+                institutional_net_buy_10d=s[SUM_INST_10D],
+                institutional_net_buy_5d=s[SUM_INST_5D],
+                foreign_net_buy_60d=s[SUM_FOREIGN_60D],
+                foreign_net_buy_20d=s[SUM_FOREIGN_20D],
+                foreign_net_buy_10d=s[SUM_FOREIGN_10D],
+                foreign_net_buy_5d=s[SUM_FOREIGN_5D],
+                volume_20d=s[SUM_VOLUME_20D],
+                institutional_ratio_20d=round(inst_ratio, 2),
+                foreign_ratio_20d=round(foreign_ratio, 2),
+                institutional_trend=TREND_LABELS[inst_trend],
+                foreign_trend=TREND_LABELS[foreign_trend],
+                supply_demand_index=round(score, 1),
+                supply_demand_stage=STAGE_LABELS[stage],
+                strong_accumulation=1 if score >= 85 else 0,
+                accumulation_signal=1 if score >= 70 else 0,
+                accumulation_intensity=INTENSITY_LABELS[intensity]
+            ))
+        return results
     
-    def _calculate_supply_demand_index(self, metrics: Dict) -> float:
-        """Calculate supply demand index (0-100)"""
-        score = 50.0  # Base score
-        
-        # Institutional score (0-50)
-        inst_score = 0
-        if metrics['inst_60d'] > 0:
-            inst_score += 10
-        if metrics['inst_20d'] > 0:
-            inst_score += 15
-        if metrics['inst_5d'] > self.config.buy_inst:
-            inst_score += 15
-        elif metrics['inst_5d'] > self.config.buy_inst / 2:
-            inst_score += 10
+    async def _scrape_all_async(self, tickers: List[tuple], max_workers: int) -> List[Optional[tuple]]:
+        """Semaphore 로 동시 요청 수 제한 + 요청 전 랜덤 지연, blocking 요청/파싱은 전용 스레드 풀에서"""
+        sem = asyncio.Semaphore(max_workers)
+        loop = asyncio.get_running_loop()
+        progress = {'done': 0, 'total': len(tickers)}
         
-        # Foreign score (0-50)
-        foreign_score = 0
-        if metrics['foreign_60d'] > 0:
-            foreign_score += 10
-        if metrics['foreign_20d'] > 0:
-            foreign_score += 15
-        if metrics['foreign_5d'] > self.config.buy_foreign:
-            foreign_score += 15
-        elif metrics['foreign_5d'] > self.config.buy_foreign / 2:
-            foreign_score += 10
-        
-        # Volume weight
-        volume_weight = min(metrics['total_vol'] / 10_000_000, 1.0)
+        async def scrape_politely(executor, ticker, name):
+            async with sem:
+                await asyncio.sleep(random.uniform(0, self.request_delay))
+                try:
+                    series = await loop.run_in_executor(executor, self._fetch_series, ticker, False)
+                    error = None
+                except Exception as e:
+                    series, error = None, e
+            
+            progress['done'] += 1
+            i, total = progress['done'], progress['total']
+            if error is not None:
+                logger.error(f"❌ [{i}/{total}] {name} ({ticker}) - Error: {error}")
+            elif series:
+                logger.info(f"✅ [{i}/{total}] {name} ({ticker}) - {len(series[0])} days")
+            else:
+                logger.warning(f"⚠️ [{i}/{total}] {name} ({ticker}) - No data")
+            return (ticker, name, series) if series else None
         
-        final_score = (inst_score + foreign_score) * (0.8 + 0.2 * volume_weight)
-        return min(max(final_score, 0), 100)
-    
-    def _get_stage_label(self, score: float) -> str:
-        """Get Korean stage label"""
-        if score >= 85:
-            return '강한매집'
-        elif score >= 70:
-            return '매집'
-        elif score >= 60:
-            return '약매집'
-        elif score >= 40:
-            return '중립'
-        elif score >= 30:
-            return '약분산'
-        elif score >= 15:
-            return '분산'
-        else:
-            return '강한분산'
-    
-    def _get_accumulation_intensity(self, score: float) -> str:
-        """Get accumulation intensity"""
-        if score >= 85:
-            return '매우강함'
-        elif score >= 70:
-            return '강함'
-        elif score >= 60:
-            return '보통'
-        else:
-            return '약함'
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return await asyncio.gather(*(scrape_politely(executor, t, n) for t, n in tickers))
     
-    def scrape_all_tickers(self, tickers: List[tuple], max_workers: int = 5):
-        """Scrape all tickers using multithreading"""
-        results = []
-        total = len(tickers)
+    def scrape_all_tickers(self, tickers: List[tuple], max_workers: int = 8):
+        """Scrape all tickers concurrently (asyncio + semaphore)"""
+        logger.info(f"📡 Starting scrape for {len(tickers)} tickers...")
         
-        logger.info(f"📡 Starting scrape for {total} tickers...")
+        items = [item for item in asyncio.run(self._scrape_all_async(tickers, max_workers)) if item]
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(self.scrape_ticker, ticker, name): (ticker, name)
-                for ticker, name in tickers
-            }
-            
-            for i, future in enumerate(as_completed(futures), 1):
-                ticker, name = futures[future]
-                try:
-                    result = future.result()
-                    if result:
-                        results.append(asdict(result))
-                        logger.info(f"✅ [{i}/{total}] {name} ({ticker}) - Index: {result.supply_demand_index}")
-                    else:
-                        logger.warning(f"⚠️ [{i}/{total}] {name} ({ticker}) - No data")
-                except Exception as e:
-                    logger.error(f"❌ [{i}/{total}] {name} ({ticker}) - Error: {e}")
-        
-        # Save to CSV
+        # Analyze (한 번의 커널 호출) & save to CSV
+        results = self._analyze_batch(items)
         if results:
-            df = pd.DataFrame(results)
-            df.to_csv(self.output_path, index=False, encoding='utf-8-sig')
+            logger.info(f"📈 Accumulation signals: {sum(r.accumulation_signal for r in results)}/{len(results)}")
+            self._save_csv(results)
             logger.info(f"💾 Saved {len(results)} records to {self.output_path}")
         else:
             logger.warning("No data to save")
 
 
-def load_stock_list(stock_list_path: str) -> List[tuple]:
-    """Load stock list from CSV"""
-    df = pd.read_csv(stock_list_path, encoding='utf-8-sig')
-    return list(zip(df['ticker'], df['name']))
+    def _save_csv(self, results: List[InstitutionalData]):
+        """Write results as utf-8-sig CSV - 컬럼 단위로 모아 한 번에 직렬화 (asdict 깊은 복사 없음)"""
+        columns = {f.name: [getattr(r, f.name) for r in results] for f in fields(InstitutionalData)}
+        
+        if not PYARROW_AVAILABLE:
+            pd.DataFrame(columns).to_csv(self.output_path, index=False, encoding='utf-8-sig')
+            return
+        
+        with open(self.output_path, 'wb') as f:
+            f.write('\ufeff'.encode('utf-8'))  # BOM (utf-8-sig 호환)
+            pa_csv.write_csv(pa.Table.from_pydict(columns), f)
 
 
 def main(max_stocks: int = None):
@@ -347,14 +400,14 @@ def main(max_stocks: int = None):
         logger.error(f"Stock list not found: {stock_list_path}")
         return
     
-    tickers = load_stock_list(stock_list_path)
+    tickers, _ = load_stock_list(stock_list_path)
     
     if max_stocks:
         tickers = tickers[:max_stocks]
         logger.info(f"Limiting to first {max_stocks} stocks")
     
     scraper = NaverFinanceScraper(data_dir='kr_market/data')
-    scraper.scrape_all_tickers(tickers, max_workers=3)
+    scraper.scrape_all_tickers(tickers)
     
     logger.info("✅ Institutional data scraping complete")
 
@@ -61,7 +61,7 @@ def main():
     print()
     print("📁 생성된 파일:")
     print("  - kr_market/data/stock_list.csv")
-    print("  - kr_market/daily_prices.csv")
+    print("  - kr_market/daily_prices.parquet")
     print("  - kr_market/all_institutional_trend_data.csv")
     print()
     print("🚀 이제 Flask 서버를 실행할 수 있습니다:")
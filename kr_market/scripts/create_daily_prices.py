@@ -9,14 +9,176 @@ from pykrx import stock
 from datetime import datetime, timedelta
 import time
 import os
+import sys
+from itertools import chain
 
+# 프로젝트 루트 (kr_market 패키지 import 용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-def create_daily_prices(lookback_days=730):
+from kr_market._stock_list import load_stock_list
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+PARQUET_PATH = 'kr_market/daily_prices.parquet'
+CSV_PATH = 'kr_market/daily_prices.csv'
+OUTPUT_COLUMNS = ['ticker', 'date', 'open', 'high', 'low', 'close', 'current_price', 'volume']
+
+if PYARROW_AVAILABLE:
+    # ticker 는 사전(dictionary) 인코딩 -> 읽을 때 category 로 복원
+    PARQUET_SCHEMA = pa.schema([
+        ('ticker', pa.dictionary(pa.int32(), pa.string())),
+        ('date', pa.timestamp('ns')),
+        ('open', pa.float64()),
+        ('high', pa.float64()),
+        ('low', pa.float64()),
+        ('close', pa.float64()),
+        ('current_price', pa.float64()),
+        ('volume', pa.int64()),
+    ])
+
+# 컬럼 이름 영문으로 변경
+COLUMN_MAP = {
+    '시가': 'open',
+    '고가': 'high',
+    '저가': 'low',
+    '종가': 'close',
+    '거래량': 'volume'
+}
+
+
+def _fetch_by_ticker(tickers, start_str, end_str):
+    """종목별 OHLCV 조회 (종목 수 만큼 호출) - 전체 기간을 새로 받을 때, 종목 단위로 yield"""
+    success_count = 0
+    
+    for i, ticker in enumerate(tickers):
+        try:
+            # OHLCV 데이터 조회
+            df = stock.get_market_ohlcv(start_str, end_str, ticker)
+            
+            if not df.empty:
+                df['ticker'] = ticker
+                df['date'] = df.index
+                df.reset_index(drop=True, inplace=True)
+                yield df.rename(columns=COLUMN_MAP)
+                success_count += 1
+            
+            # Progress
+            if (i + 1) % 100 == 0:
+                print(f"   진행률: {i+1}/{len(tickers)} ({success_count}개 성공)")
+            
+            # Rate limiting
+            time.sleep(0.1)
+            
+        except Exception as e:
+            if (i + 1) % 100 == 0:
+                print(f"   ⚠️ {ticker} 오류: {e}")
+            continue
+
+
+class IncrementalFetchError(RuntimeError):
+    """일자별 조회 실패 - 빠진 날짜가 영구 결측으로 남지 않도록 증분 갱신 전체를 중단"""
+
+
+def _fetch_by_date(tickers, days):
+    """
+    일자별 전종목 OHLCV 조회 (거래일 수 만큼 호출) - 최근 며칠만 이어 받을 때, 일자 단위로 yield
+    휴장일이 아닌 날 조회가 실패하면 IncrementalFetchError (기존 파일 유지)
+    """
+    wanted = set(tickers)
+    
+    for day in days:
+        try:
+            df = stock.get_market_ohlcv_by_ticker(day.strftime('%Y%m%d'), market='ALL')
+        except Exception as e:
+            raise IncrementalFetchError(f"{day:%Y-%m-%d} 조회 실패: {e}") from e
+        
+        # 휴장일은 전 종목 가격이 0
+        if df.empty or (df[['시가', '고가', '저가', '종가']] == 0).all(axis=None):
+            continue
+        
+        df = df[df.index.isin(wanted)]
+        yield pd.DataFrame({'ticker': df.index, 'date': day}).join(
+            df.rename(columns=COLUMN_MAP).reset_index(drop=True))
+
+
+def _load_existing(start_date):
+    """기존 가격 파일 (Parquet 우선, 없으면 CSV; lookback 범위 안의 행만), 없으면 None"""
+    try:
+        if PYARROW_AVAILABLE and os.path.exists(PARQUET_PATH):
+            existing = pd.read_parquet(PARQUET_PATH, engine='pyarrow')
+            existing['ticker'] = existing['ticker'].astype(str)
+        elif os.path.exists(CSV_PATH):
+            existing = pd.read_csv(CSV_PATH, encoding='utf-8-sig', dtype={'ticker': str}, parse_dates=['date'])
+        else:
+            return None
+    except (OSError, ValueError) as e:
+        print(f"   ⚠️ 기존 파일 읽기 실패, 전체 재수집: {e}")
+        return None
+    return existing[existing['date'] >= pd.Timestamp(start_date.date())]
+
+
+def _write_prices(frames, write_parquet, write_csv):
     """
-    일별 가격 데이터 생성
+    조각(DataFrame)을 받는 대로 파일에 이어 씀 - 전체 결합 없이 메모리 사용량 일정
+    임시 파일에 쓴 뒤 교체하므로 실패 시 기존 파일 유지
+    
+    Returns:
+        (종목 수, 레코드 수)
+    """
+    outputs = ([PARQUET_PATH] if write_parquet else []) + ([CSV_PATH] if write_csv else [])
+    tmp_paths = {path: f"{path}.tmp" for path in outputs}
+    writer = None
+    tickers = set()
+    n_rows = 0
+    
+    try:
+        for df in frames:
+            if df.empty:
+                continue
+            # 'current_price' 컬럼 (종가와 동일)
+            df = df.assign(current_price=df['close'])[OUTPUT_COLUMNS]
+            
+            if write_parquet:
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_paths[PARQUET_PATH], PARQUET_SCHEMA, compression='zstd')
+                writer.write_table(pa.Table.from_pandas(df, schema=PARQUET_SCHEMA, preserve_index=False))
+            if write_csv:
+                df.to_csv(tmp_paths[CSV_PATH], mode='a' if n_rows else 'w', header=not n_rows,
+                          index=False, encoding='utf-8-sig', date_format='%Y-%m-%d')
+            
+            tickers.update(df['ticker'].unique())
+            n_rows += len(df)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        for tmp_path in tmp_paths.values():
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        raise
+    
+    if writer is not None:
+        writer.close()
+    if n_rows:
+        for path, tmp_path in tmp_paths.items():
+            os.replace(tmp_path, path)
+    return len(tickers), n_rows
+
+
+def create_daily_prices(lookback_days=730, export_csv=False):
+    """
+    일별 가격 데이터 생성 (kr_market/daily_prices.parquet, zstd 압축)
+    기존 파일이 있으면 마지막 날짜 이후 거래일만 일자별 전종목 조회로 이어 붙임
+    (거래일 수 < 종목 수 일 때 - 호출 수가 더 적은 쪽 선택)
     
     Args:
         lookback_days: 과거 몇 일치 데이터를 수집할지 (기본: 730일 = 2년)
+        export_csv: daily_prices.csv 도 함께 저장 (pyarrow 가 없으면 항상 CSV)
     """
     print(f"📊 일별 가격 데이터 수집 중 (과거 {lookback_days}일)...")
     
@@ -35,63 +197,44 @@ def create_daily_prices(lookback_days=730):
         print("❌ 종목 리스트가 없습니다. create_stock_list.py를 먼저 실행하세요.")
         return
     
-    stocks_df = pd.read_csv(stocks_path, encoding='utf-8-sig')
-    tickers = stocks_df['ticker'].tolist()
+    stock_pairs, _ = load_stock_list(stocks_path)
+    tickers = [ticker for ticker, _ in stock_pairs]
     
     print(f"   대상 종목: {len(tickers):,}개")
     
     # 데이터 수집
-    all_data = []
-    success_count = 0
+    existing = _load_existing(start_date)
+    new_days = None
+    if existing is not None and not existing.empty:
+        # 마지막 저장일은 장중에 받은 미완성 봉일 수 있어 그 날짜부터 다시 받음 (이전 날짜들은 완결)
+        last_date = existing['date'].max()
+        new_days = pd.bdate_range(last_date, end_date.date())
     
-    for i, ticker in enumerate(tickers):
-        try:
-            # OHLCV 데이터 조회
-            df = stock.get_market_ohlcv(start_str, end_str, ticker)
-            
-            if not df.empty:
-                df['ticker'] = ticker
-                df['date'] = df.index
-                df.reset_index(drop=True, inplace=True)
-                
-                # 컬럼 이름 영문으로 변경
-                df.rename(columns={
-                    '시가': 'open',
-                    '고가': 'high',
-                    '저가': 'low',
-                    '종가': 'close',
-                    '거래량': 'volume'
-                }, inplace=True)
-                
-                # 'current_price' 컬럼 추가 (종가와 동일)
-                df['current_price'] = df['close']
-                
-                all_data.append(df)
-                success_count += 1
-            
-            # Progress
-            if (i + 1) % 100 == 0:
-                print(f"   진행률: {i+1}/{len(tickers)} ({success_count}개 성공)")
-            
-            # Rate limiting
-            time.sleep(0.1)
-            
-        except Exception as e:
-            if (i + 1) % 100 == 0:
-                print(f"   ⚠️ {ticker} 오류: {e}")
-            continue
+    if new_days is not None and len(new_days) < len(tickers):
+        existing = existing[existing['ticker'].isin(tickers)]
+        known = set(existing['ticker'].unique())
+        existing = existing[existing['date'] < last_date]
+        # stock_list 에 새로 추가된 종목은 기존 파일에 이력이 없으므로 전체 기간을 종목별로 조회
+        added = [ticker for ticker in tickers if ticker not in known]
+        print(f"   기존 데이터 이어받기: {len(new_days)}개 영업일 (신규 종목 {len(added)}개는 전체 기간 조회)")
+        frames = chain([existing.drop(columns='current_price')],
+                       _fetch_by_date(known, new_days),
+                       _fetch_by_ticker(added, start_str, end_str))
+    else:
+        frames = _fetch_by_ticker(tickers, start_str, end_str)
     
-    # 결합 및 저장
-    if all_data:
-        final_df = pd.concat(all_data, ignore_index=True)
-        final_df = final_df[['ticker', 'date', 'open', 'high', 'low', 'close', 'current_price', 'volume']]
-        
-        output_path = 'kr_market/daily_prices.csv'
-        final_df.to_csv(output_path, index=False, encoding='utf-8-sig')
-        
+    # 저장 (수집되는 대로 스트리밍)
+    try:
+        success_count, n_rows = _write_prices(frames, PYARROW_AVAILABLE, export_csv or not PYARROW_AVAILABLE)
+    except IncrementalFetchError as e:
+        print(f"❌ 증분 갱신 중단, 기존 파일 유지: {e}")
+        return False
+    
+    if n_rows:
+        output_path = PARQUET_PATH if PYARROW_AVAILABLE else CSV_PATH
         print(f"\n✅ 일별 가격 데이터 생성 완료")
         print(f"   성공: {success_count}/{len(tickers)}개 종목")
-        print(f"   총 레코드: {len(final_df):,}개")
+        print(f"   총 레코드: {n_rows:,}개")
         print(f"   저장 위치: {output_path}")
         print(f"   파일 크기: {os.path.getsize(output_path) / 1024 / 1024:.1f} MB")
     else:
@@ -99,5 +242,10 @@ def create_daily_prices(lookback_days=730):
 
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--csv', action='store_true', help='Also export kr_market/daily_prices.csv')
+    args = parser.parse_args()
+    
     # 2년치 데이터 수집 (약 5-10분 소요)
-    create_daily_prices(lookback_days=730)
+    create_daily_prices(lookback_days=730, export_csv=args.csv)
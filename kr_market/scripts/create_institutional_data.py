@@ -5,104 +5,193 @@
 네이버 금융 크롤링을 통한 수급 데이터 수집
 Based on BLUEPRINT_09_SUPPORTING_MODULES.md
 """
+import numpy as np
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
-import time
+from bs4 import BeautifulSoup, SoupStrainer
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import json
+import random
 import os
+import re
+import sys
 from datetime import datetime
 
+# 프로젝트 루트 (kr_market 패키지 import 용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-def scrape_institutional_data(ticker, max_retries=3):
+from kr_market._http import NAVER_ENCODING, get_session
+from kr_market._stock_list import load_stock_list
+
+# lxml - C 기반 HTML 파서 (Optional, 없으면 html.parser)
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# 수급 테이블(table.type2)만 트리로 만듦 (파싱 중엔 class 가 원문 문자열이라 정규식으로 매칭)
+TABLE_STRAINER = SoupStrainer('table', class_=re.compile(r'(^|\s)type2(\s|$)'))
+
+# pyarrow - C++ CSV writer (Optional, 없으면 pandas.to_csv)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+OUTPUT_COLUMNS = ['ticker', 'name', 'scrape_date',
+                  'foreign_net_buy_5d', 'foreign_net_buy_10d', 'foreign_net_buy_20d', 'foreign_net_buy_60d',
+                  'institutional_net_buy_5d', 'institutional_net_buy_10d', 'institutional_net_buy_20d', 'institutional_net_buy_60d',
+                  'supply_demand_index']
+
+# 동시 요청 수 (네이버 서버 부하 방지) 와 요청 전 지연 범위 (초)
+CONCURRENCY = 8
+REQUEST_DELAY = (0.1, 0.4)
+
+# 중단된 수집 재개용 (당일 성공 종목 결과 보관)
+CHECKPOINT_PATH = 'kr_market/data/.institutional_checkpoint.json'
+CHECKPOINT_EVERY = 50
+
+
+def scrape_institutional_data(ticker, session=None):
     """
     네이버 금융에서 외인/기관 순매매 데이터 크롤링
     
     Args:
         ticker: 6자리 종목 코드
-        max_retries: 최대 재시도 횟수
+        session: HTTP 세션 (기본: 프로세스 공유 세션 - kr_market._http.get_session)
     
     Returns:
         Dict with 5d/10d/20d/60d net buy data
     """
     url = f"https://finance.naver.com/item/frgn.naver?code={ticker}"
+    session = session or get_session()
+    
+    # 재시도(지수 backoff, Retry-After 준수)는 세션 어댑터가 처리
+    try:
+        response = session.get(url, timeout=10)
+
+        if response.status_code != 200:
+            return None
+
+        soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=TABLE_STRAINER, from_encoding=NAVER_ENCODING)
+
+        # 테이블 파싱
+        table = soup.find('table', {'class': 'type2'})
+        if not table:
+            return None
+
+        rows = table.find_all('tr')
+
+        # 데이터 추출 (최신일 먼저) - 행 dict 없이 컬럼별 리스트로
+        foreign_nets, inst_nets = [], []
+        for row in rows[2:]:  # 헤더 스킵
+            cols = row.find_all('td')
+            if len(cols) >= 7:
+                try:
+                    # 외국인 순매수, 기관 순매수 (단위: 주)
+                    foreign_net = int(cols[5].get_text().strip().replace(',', '') or 0)
+                    inst_net = int(cols[6].get_text().strip().replace(',', '') or 0)
+                except:
+                    continue
+                foreign_nets.append(foreign_net)
+                inst_nets.append(inst_net)
+
+        n_days = len(foreign_nets)
+        if n_days < 5:
+            return None
+
+        # 누적 계산 - 누적합 1회, 최근 N일 합계는 cs[min(N, n)-1]
+        foreign_cs = np.cumsum(np.asarray(foreign_nets, dtype=np.int64))
+        inst_cs = np.cumsum(np.asarray(inst_nets, dtype=np.int64))
+        foreign_5d, foreign_10d, foreign_20d, foreign_60d = (
+            int(foreign_cs[min(days, n_days) - 1]) for days in (5, 10, 20, 60))
+        inst_5d, inst_10d, inst_20d, inst_60d = (
+            int(inst_cs[min(days, n_days) - 1]) for days in (5, 10, 20, 60))
+
+        # Supply Demand Index 간단 계산 (0-100)
+        # 외인 50점 + 기관 50점
+        foreign_score = min(max((foreign_60d / 1_000_000) * 10, 0), 50)
+        inst_score = min(max((inst_60d / 500_000) * 10, 0), 50)
+        supply_demand_index = min(foreign_score + inst_score, 100)
+
+        return {
+            'ticker': ticker,
+            'scrape_date': datetime.now().strftime('%Y-%m-%d'),
+            'foreign_net_buy_5d': foreign_5d,
+            'foreign_net_buy_10d': foreign_10d,
+            'foreign_net_buy_20d': foreign_20d,
+            'foreign_net_buy_60d': foreign_60d,
+            'institutional_net_buy_5d': inst_5d,
+            'institutional_net_buy_10d': inst_10d,
+            'institutional_net_buy_20d': inst_20d,
+            'institutional_net_buy_60d': inst_60d,
+            'supply_demand_index': round(supply_demand_index, 1)
+        }
+
+    except Exception:
+        return None
+
+
+def _load_checkpoint():
+    """오늘 날짜 체크포인트의 {ticker: data} (없거나 지난 날짜면 빈 dict)"""
+    try:
+        with open(CHECKPOINT_PATH, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+        if checkpoint.get('date') == datetime.now().strftime('%Y-%m-%d'):
+            return checkpoint['results']
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+
+def _save_checkpoint(results):
+    tmp_path = f"{CHECKPOINT_PATH}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'date': datetime.now().strftime('%Y-%m-%d'), 'results': results}, f, ensure_ascii=False)
+        os.replace(tmp_path, CHECKPOINT_PATH)
+    except OSError as e:
+        print(f"   ⚠️ 체크포인트 저장 실패: {e}")
+
+
+async def _scrape_politely(sem, executor, ticker, progress, done):
+    """세마포어로 동시 요청 수 제한 + 요청 전 랜덤 지연 (blocking 요청은 워커 스레드에서 실행)"""
+    async with sem:
+        await asyncio.sleep(random.uniform(*REQUEST_DELAY))
+        data = await asyncio.get_running_loop().run_in_executor(executor, scrape_institutional_data, ticker)
     
-    for attempt in range(max_retries):
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.encoding = 'euc-kr'
-            
-            if response.status_code != 200:
-                return None
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 테이블 파싱
-            table = soup.find('table', {'class': 'type2'})
-            if not table:
-                return None
-            
-            rows = table.find_all('tr')
-            
-            # 데이터 추출
-            daily_data = []
-            for row in rows[2:]:  # 헤더 스킵
-                cols = row.find_all('td')
-                if len(cols) >= 7:
-                    try:
-                        # 외국인 순매수, 기관 순매수 (단위: 주)
-                        foreign_net = int(cols[5].get_text().strip().replace(',', '') or 0)
-                        inst_net = int(cols[6].get_text().strip().replace(',', '') or 0)
-                        
-                        daily_data.append({
-                            'foreign': foreign_net,
-                            'inst': inst_net
-                        })
-                    except:
-                        continue
-            
-            if len(daily_data) < 5:
-                return None
-            
-            # 누적 계산
-            foreign_5d = sum([d['foreign'] for d in daily_data[:5]])
-            foreign_10d = sum([d['foreign'] for d in daily_data[:10]])
-            foreign_20d = sum([d['foreign'] for d in daily_data[:20]])
-            foreign_60d = sum([d['foreign'] for d in daily_data[:min(60, len(daily_data))]])
-            
-            inst_5d = sum([d['inst'] for d in daily_data[:5]])
-            inst_10d = sum([d['inst'] for d in daily_data[:10]])
-            inst_20d = sum([d['inst'] for d in daily_data[:20]])
-            inst_60d = sum([d['inst'] for d in daily_data[:min(60, len(daily_data))]])
-            
-            # Supply Demand Index 간단 계산 (0-100)
-            # 외인 50점 + 기관 50점
-            foreign_score = min(max((foreign_60d / 1_000_000) * 10, 0), 50)
-            inst_score = min(max((inst_60d / 500_000) * 10, 0), 50)
-            supply_demand_index = min(foreign_score + inst_score, 100)
-            
-            return {
-                'ticker': ticker,
-                'scrape_date': datetime.now().strftime('%Y-%m-%d'),
-                'foreign_net_buy_5d': foreign_5d,
-                'foreign_net_buy_10d': foreign_10d,
-                'foreign_net_buy_20d': foreign_20d,
-                'foreign_net_buy_60d': foreign_60d,
-                'institutional_net_buy_5d': inst_5d,
-                'institutional_net_buy_10d': inst_10d,
-                'institutional_net_buy_20d': inst_20d,
-                'institutional_net_buy_60d': inst_60d,
-                'supply_demand_index': round(supply_demand_index, 1)
-            }
-            
-        except Exception as e:
-            if attempt == max_retries - 1:
-                return None
-            time.sleep(1)
+    progress['done'] += 1
+    if data:
+        done[str(ticker)] = data
+        progress['success'] += 1
+    if progress['done'] % CHECKPOINT_EVERY == 0:
+        _save_checkpoint(done)
+        print(f"   진행률: {progress['done']}/{progress['total']} ({progress['success']}개 성공)")
+
+
+async def _scrape_all(tickers, done):
+    """대상 종목 동시 수집 - 성공 결과는 done[str(ticker)] 에 누적"""
+    sem = asyncio.Semaphore(CONCURRENCY)
+    progress = {'done': 0, 'success': 0, 'total': len(tickers)}
+    # 요청은 GIL 을 놓는 소켓 대기 - all_institutional_trend_data 와 같은 전용 스레드 풀
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
+        await asyncio.gather(*(_scrape_politely(sem, executor, t, progress, done) for t in tickers))
+
+
+def _save_csv(results, output_path):
+    """결과 dict 리스트를 utf-8-sig CSV 로 저장 - DataFrame 을 만들지 않고 컬럼 리스트를 한 번에 직렬화"""
+    columns = {col: [r[col] for r in results] for col in OUTPUT_COLUMNS}
     
-    return None
+    if not PYARROW_AVAILABLE:
+        pd.DataFrame(columns).to_csv(output_path, index=False, encoding='utf-8-sig')
+        return
+    
+    with open(output_path, 'wb') as f:
+        f.write('\ufeff'.encode('utf-8'))  # BOM (utf-8-sig 호환)
+        pa_csv.write_csv(pa.Table.from_pydict(columns), f)
 
 
 def create_institutional_data():
@@ -115,51 +204,45 @@ def create_institutional_data():
         print("❌ 종목 리스트가 없습니다. create_stock_list.py를 먼저 실행하세요.")
         return
     
-    stocks_df = pd.read_csv(stocks_path, encoding='utf-8-sig')
-    tickers = stocks_df['ticker'].tolist()
+    stock_pairs, names = load_stock_list(stocks_path)
+    tickers = [ticker for ticker, _ in stock_pairs]
     
     print(f"   대상 종목: {len(tickers):,}개")
-    print("   ⏳ 약 10-15분 소요 예상...")
+    print(f"   ⏳ {CONCURRENCY}개 동시 요청으로 수집 중...")
     
-    # 데이터 수집
-    results = []
-    success_count = 0
+    # 데이터 수집 (동시 요청, 오늘 이미 받은 종목은 체크포인트에서 재개)
+    done = _load_checkpoint()
+    pending = [t for t in tickers if str(t) not in done]
+    if len(pending) < len(tickers):
+        print(f"   ♻️ 체크포인트에서 재개: {len(tickers) - len(pending)}개 완료됨")
+    asyncio.run(_scrape_all(pending, done))
+    _save_checkpoint(done)
     
-    for i, ticker in enumerate(tickers):
-        data = scrape_institutional_data(ticker)
-        
+    results = []
+    for ticker in tickers:
+        data = done.get(str(ticker))
         if data:
             # 종목명 추가
-            name = stocks_df[stocks_df['ticker'] == ticker]['name'].values[0]
-            data['name'] = name
+            data['name'] = names[ticker]
             results.append(data)
-            success_count += 1
-        
-        # Progress
-        if (i + 1) % 50 == 0:
-            print(f"   진행률: {i+1}/{len(tickers)} ({success_count}개 성공)")
-        
-        # Rate limiting (네이버 서버 부하 방지)
-        time.sleep(0.3)
+    success_count = len(results)
     
     # 저장
     if results:
-        df = pd.DataFrame(results)
-        df = df[['ticker', 'name', 'scrape_date',
-                 'foreign_net_buy_5d', 'foreign_net_buy_10d', 'foreign_net_buy_20d', 'foreign_net_buy_60d',
-                 'institutional_net_buy_5d', 'institutional_net_buy_10d', 'institutional_net_buy_20d', 'institutional_net_buy_60d',
-                 'supply_demand_index']]
-        
         output_path = 'kr_market/all_institutional_trend_data.csv'
-        df.to_csv(output_path, index=False, encoding='utf-8-sig')
+        _save_csv(results, output_path)
         
         print(f"\n✅ 수급 데이터 생성 완료")
         print(f"   성공: {success_count}/{len(tickers)}개 종목")
         print(f"   저장 위치: {output_path}")
         
         # 통계
-        strong_buy = len(df[df['supply_demand_index'] >= 70])
+        strong_buy = sum(1 for r in results if r['supply_demand_index'] >= 70)
         print(f"   강한 매수세 (SI≥70): {strong_buy}개")
+        
+        # 저장 완료 - 다음 실행은 처음부터
+        if os.path.exists(CHECKPOINT_PATH):
+            os.remove(CHECKPOINT_PATH)
     else:
         print("❌ 데이터 수집 실패")
 
@@ -9,14 +9,107 @@ import pandas as pd
 import numpy as np
 import os
 import FinanceDataReader as fdr
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from enum import Enum
 import logging
+import shutil
+import asyncio
 import concurrent.futures
+from itertools import repeat
+
+from kr_market._http import install_fdr_session
+from kr_market._signal_log import write_signal_binlog
+from kr_market._util import KST, MARKET_CLOSE
+from kr_market.evidence import EvidenceLedger
+from kr_market.gates import LiquidityGuard_L1, TechnicalGate_L2, FlowGate_L3, QualityGate_L4
+from kr_market.jit import njit, prange
+from kr_market.order_plan import PlanBuilder
+from kr_market.theme_manager import ThemeManager
+
+# PyArrow - signals_log Parquet 사본 / 가격 캐시 / 일별 가격 패널 읽기용 (Optional)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 가격 데이터 동시 요청 수 (FDR -> 네이버/KRX)
+FETCH_CONCURRENCY = 20
+PRICE_LOOKBACK_DAYS = 90  # 3 months
+
+# 스캔 대상 - stock_list.csv 앞 300 종목, _analyze_stock 이 읽는 컬럼만 (marcap/sector 는 없을 수 있음)
+SCAN_LIMIT = 300
+SCAN_COLUMNS = frozenset({'ticker', 'market', 'name', 'sector', 'marcap'})
+
+# daily_prices.parquet (create_daily_prices.py) 컬럼 -> FDR 컬럼
+PANEL_COLUMNS = {'open': 'Open', 'high': 'High', 'low': 'Low', 'close': 'Close', 'volume': 'Volume'}
+
+
+VCP_WINDOW = 50   # 최근 50 거래일
+VCP_HALF = 25     # 앞 25일 vs 뒤 25일 변동폭 비교
+VCP_PRICE_COLUMNS = frozenset({'Close', 'High', 'Low'})
+
+
+@njit(cache=True)
+def _vcp_kernel(close, high, low, volume):
+    """
+    최근 VCP_WINDOW 일 배열 -> (현재가, 최고가, 앞 절반 변동폭, 뒤 절반 변동폭, 뒤 절반 평균 거래량)
+    NaN 은 pandas max/min/mean 처럼 건너뜀
+    """
+    range1 = np.nanmax(high[:VCP_HALF]) - np.nanmin(low[:VCP_HALF])
+    range2 = np.nanmax(high[VCP_HALF:]) - np.nanmin(low[VCP_HALF:])
+    return close[-1], np.nanmax(high), range1, range2, np.nanmean(volume[VCP_HALF:])
+
+
+@njit(parallel=True, cache=True)
+def _vcp_batch_kernel(close, high, low, volume):
+    """(N, VCP_WINDOW) 배열 -> (N, 5) 종목별 _vcp_kernel 결과"""
+    n = close.shape[0]
+    out = np.empty((n, 5))
+    for i in prange(n):
+        price, high_max, range1, range2, avg_vol = _vcp_kernel(close[i], high[i], low[i], volume[i])
+        out[i, 0] = price
+        out[i, 1] = high_max
+        out[i, 2] = range1
+        out[i, 3] = range2
+        out[i, 4] = avg_vol
+    return out
+
+
+def _column_array(df: pd.DataFrame, col: str, n: int) -> np.ndarray:
+    """df[col] 의 마지막 n 행 as contiguous float64 (중복 컬럼이면 ValueError)"""
+    values = df[col].to_numpy()
+    if values.ndim > 1:
+        raise ValueError(f"duplicate column: {col}")
+    return np.ascontiguousarray(values[-n:], dtype=np.float64)
+
+
+def _vcp_window(df: pd.DataFrame):
+    """최근 VCP_WINDOW 일 (close, high, low, volume, has_volume) - 데이터 부족/변환 실패 시 None"""
+    # 흔한 탈락(짧은 이력, 컬럼 누락)은 예외 없이 명시적으로 걸러냄
+    if len(df) < VCP_WINDOW or not VCP_PRICE_COLUMNS.issubset(df.columns):
+        return None
+    # df.tail() 로 DataFrame 을 새로 만들지 않고 컬럼 배열을 바로 잘라 씀
+    try:
+        close, high, low = (_column_array(df, col, VCP_WINDOW) for col in ('Close', 'High', 'Low'))
+    except (TypeError, ValueError):
+        # 숫자로 변환할 수 없는 값 / 중복 컬럼
+        return None
+    # 거래량은 추정 수급용 - 없거나 변환 실패면 수급 0 (중복 컬럼이면 첫 번째)
+    if 'Volume' not in df.columns:
+        return close, high, low, np.full(VCP_WINDOW, np.nan), False
+    try:
+        volume = df['Volume']
+        if volume.ndim > 1:
+            volume = volume.iloc[:, 0]
+        return close, high, low, np.ascontiguousarray(volume.to_numpy()[-VCP_WINDOW:], dtype=np.float64), True
+    except (TypeError, ValueError):
+        return close, high, low, np.full(VCP_WINDOW, np.nan), False
+
 
 class StrategyMode(Enum):
     """Strategy modes for A/B testing effectiveness"""
@@ -26,11 +119,187 @@ class StrategyMode(Enum):
     VCP_FLOW_MACRO = "vcp_flow_macro"  # VCP + Flow + Macro gate
     FULL_AI = "full_ai"             # Full strategy with AI filter
 
+# VCP 판정을 쓰는 모드
+_VCP_MODES = frozenset({StrategyMode.VCP_ONLY, StrategyMode.VCP_FLOW,
+                        StrategyMode.VCP_FLOW_MACRO, StrategyMode.FULL_AI})
+
+# signals_log 컬럼/타입 - list-of-dicts 추론 대신 고정 스키마 (VCP 결과가 없는 신호도 같은 순서/타입)
+SIGNAL_DTYPES = {
+    'ticker': object,
+    'current_price': np.float64,
+    'entry_price': np.float64,
+    'score': np.int64,
+    'contraction_ratio': np.float64,
+    'foreign_5d': np.int64,
+    'inst_5d': np.int64,
+    'signal_date': object,
+    'name': object,
+    'market': object,
+    'sector': object,
+    'theme': object,
+    'strategy_mode': object,
+    'nice_tech_score': np.int64,
+    'is_palantir': np.bool_,
+    'is_palantir_mini': np.bool_,
+    'stop_loss': np.int64,
+    'tp1': np.int64,
+    'tp2': np.int64,
+    'time_stop': object,
+    'min_turnover': np.float64,
+}
+SIGNAL_COLUMNS = list(SIGNAL_DTYPES)
+
+
+def _signals_frame(signals: list) -> pd.DataFrame:
+    """신호 dict 목록 -> SIGNAL_COLUMNS 순서의 DataFrame (컬럼별로 한 번에 배열 변환)"""
+    return pd.DataFrame({col: np.asarray([sig[col] for sig in signals], dtype=dtype)
+                         for col, dtype in SIGNAL_DTYPES.items()})
+
+
+# L1-L4 게이트 - 스캔마다 한 번 생성 (_init_gates)
+_gates = None
+
+
+def _init_gates():
+    """_analyze_stock 이 쓰는 게이트 생성 (스캔 시작 시 호출)"""
+    global _gates
+    _gates = (LiquidityGuard_L1(), TechnicalGate_L2(), FlowGate_L3(), QualityGate_L4())
+
+
+def _analyze_stock(mode_value: str, vcp_only: bool, flow_only: bool, signal_date: str,
+                   row: dict, df: pd.DataFrame, vcp_result: dict):
+    """
+    CPU 단계 - 이미 받아 둔 가격 데이터와 일괄 계산된 VCP 결과로 게이트 분석
+    모드/신호 날짜는 스캔마다 한 번 풀어 둔 값/플래그로 받음 (종목마다 Enum 비교, 날짜 포맷 없음)
+    통과 시 (result, gate_results, plan), 아니면 None
+    """
+    liquidity_guard, technical_gate, flow_gate, quality_gate = _gates
+    try:
+        ticker = row['ticker']
+        market = row['market']
+        name = row['name']
+        
+        if df.empty: return None
+        
+        # Mode-specific filtering - 이미 계산된 값만 보는 검사라 게이트 평가보다 먼저 (VCP 미탐지가 가장 흔한 탈락)
+        if vcp_only and not vcp_result:
+            return None
+
+        # --- NICE GATE LAYER ---
+
+        # L1: Liquidity Guard (Fail Fast)
+        l1_res = liquidity_guard.evaluate(ticker, df)
+        if not l1_res.passed:
+            # In FULL_AI / VCP_FLOW mode, strict filtering
+            return None
+
+        # L2: Technical Gate (VCP + Palantir)
+        # Replaces old VCPGate
+        l2_res = technical_gate.evaluate(vcp_result, df)
+        
+        # Hard Fail if neither VCP nor Palantir detected in strict modes
+        # If mode is FLOW_ONLY, we might skip this
+        if not flow_only and not l2_res.passed:
+             return None
+        
+        # Check Palantir Bonus
+        is_palantir = l2_res.details.get('is_palantir', False)
+        is_palantir_mini = l2_res.details.get('is_palantir_mini', False)
+
+        # Check Theme
+        theme = ThemeManager.get_theme(ticker)
+
+        # Prepare Flow Data (Proxy for now, ideally real data)
+        # detect_vcp calculates proxies, reuse if available
+        if vcp_result:
+             f_flow = vcp_result.get('foreign_5d', 0)
+             i_flow = vcp_result.get('inst_5d', 0)
+        else:
+             f_flow = 0; i_flow = 0
+             
+        # L3: Flow Gate
+        l3_res = flow_gate.evaluate(f_flow, i_flow)
+        
+        # L4: Quality Gate (Market Cap check)
+        marcap = float(row.get('marcap', 100000000000)) 
+        l4_res = quality_gate.evaluate(marcap / 100000000) # Convert to billions for gate
+        
+        # --- SCORING ---
+        final_score = int(
+            (l1_res.score * 0.2) + 
+            (l2_res.score * 0.4) +  # increased weight for technical
+            (l3_res.score * 0.2) + 
+            (l4_res.score * 0.2)
+        )
+        
+        if theme: final_score += 10 # Theme Bonus
+        
+        # Filter by Score
+        if final_score < 50: return None
+        
+        # --- EXECUTION LAYER (L6) ---
+        # VCP 결과에 이미 있는 현재가 재사용 (없을 때만 배열 끝 값 - iloc 인덱서 생략)
+        current_price = vcp_result['current_price'] if vcp_result else float(df['Close'].to_numpy()[-1])
+        pivot = None # TODO: Calculate Pivot
+        plan = PlanBuilder.create_buy_plan(ticker, int(current_price), market, pivot)
+        
+        gate_results = {
+            'L1_Liquidity': l1_res,
+            'L2_Technical': l2_res,
+            'L3_Flow': l3_res,
+            'L4_Quality': l4_res
+        }
+        
+        # Build Result
+        result = vcp_result if vcp_result else {
+            'ticker': ticker,
+            'current_price': current_price,
+            'entry_price': current_price,
+            'contraction_ratio': 0,
+            'foreign_5d': 0,
+            'inst_5d': 0,
+            'signal_date': signal_date
+        }
+        
+        # Enrich with Plan & Nice Info
+        result.update({
+            'name': name,
+            'market': market,
+            'sector': row.get('sector', ''),
+            'theme': theme if theme else '',
+            'strategy_mode': mode_value,
+            'score': final_score,
+            'nice_tech_score': l2_res.score,
+            'is_palantir': is_palantir,
+            'is_palantir_mini': is_palantir_mini,
+            'stop_loss': plan.stop_loss,
+            'tp1': plan.tp1,
+            'tp2': plan.tp2,
+            'time_stop': plan.time_stop_date,
+            'min_turnover': l1_res.details.get('turnover', 0)
+        })
+        
+        return result, gate_results, plan
+        
+    except Exception as e:
+        # logger.error(f"Error processing {row.get('ticker')}: {e}")
+        return None
+
+
 class SignalTracker:
     def __init__(self, data_dir: str = None):
         self.data_dir = data_dir or os.path.dirname(os.path.abspath(__file__))
         self.signals_log_path = os.path.join(self.data_dir, 'data', 'signals_log.csv')
+        self.signals_parquet_path = os.path.join(self.data_dir, 'data', 'signals_log.parquet')
+        self.signals_bin_path = os.path.join(self.data_dir, 'data', 'signals_log.bin')
         self.stock_list_path = os.path.join(self.data_dir, 'data', 'stock_list.csv')
+        # 전종목 일별 가격 (create_daily_prices.py 가 KRX 일자별 일괄 조회로 갱신)
+        self.daily_prices_path = os.path.join(self.data_dir, 'daily_prices.parquet')
+        # 종목별 일봉 캐시 (당일 재실행 시 FDR 호출 생략 - 파일 mtime 이 오늘이면 유효)
+        self.price_cache_dir = os.path.join(self.data_dir, 'data', 'cache', 'prices')
+        
+        # FDR 요청을 keep-alive 세션으로 (동시 수집 스레드 수만큼 연결 유지)
+        install_fdr_session(pool_maxsize=FETCH_CONCURRENCY)
         
         # Strategy Parameters
         self.strategy_params = {
@@ -38,74 +307,200 @@ class SignalTracker:
             'near_high_pct': 0.85,    # Within 15% of high
         }
         
+    def _save_parquet(self, sigs_df: pd.DataFrame):
+        """
+        Mirror signals_log.csv as a zstd Parquet dataset partitioned by strategy_mode
+        (PerformanceAnalyzer reads only the columns/partition it needs, the dashboard reads it typed).
+        Written to a temp dir and swapped in, so readers never see a half-written dataset.
+        """
+        if not PYARROW_AVAILABLE or 'strategy_mode' not in sigs_df.columns:
+            return
+        
+        tmp_path = f"{self.signals_parquet_path}.tmp"
+        try:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            # _row: 파티션별로 흩어진 행을 원래 CSV 순서로 복원하기 위한 키 (MDD 등 순서 의존 지표)
+            sigs_df.assign(_row=np.arange(len(sigs_df))).to_parquet(
+                tmp_path, partition_cols=['strategy_mode'], compression='zstd', index=False)
+            shutil.rmtree(self.signals_parquet_path, ignore_errors=True)
+            os.replace(tmp_path, self.signals_parquet_path)
+        except Exception as e:
+            # Parquet 는 CSV 의 읽기 최적화 사본 - 실패해도 CSV 경로로 동작
+            logger.warning(f"Parquet signals copy failed: {e}")
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+    def _save_binlog(self, sigs_df: pd.DataFrame):
+        """Mirror the analysis columns as fixed-width binary records (PerformanceAnalyzer memmaps it)."""
+        try:
+            write_signal_binlog(sigs_df, self.signals_bin_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Binary signals copy failed: {e}")
+
+    def _price_cache_path(self, ticker: str) -> str:
+        return os.path.join(self.price_cache_dir, f'{ticker}.parquet')
+
+    def _read_price_cache(self, ticker: str):
+        """
+        오늘 받아 둔 가격 캐시가 있으면 DataFrame, 없거나(날짜 지남) 읽기 실패면 None
+        장 마감(15:30 KST) 후 스캔이면 마감 전에 쓴 캐시(장중 미완성 봉)도 None
+        """
+        if not PYARROW_AVAILABLE:
+            return None
+        cache_path = self._price_cache_path(ticker)
+        try:
+            written = datetime.fromtimestamp(os.path.getmtime(cache_path), KST)
+            now = datetime.now(KST)
+            close = datetime.combine(now.date(), MARKET_CLOSE, KST)
+            if written.date() != now.date() or (now >= close and written < close):
+                return None
+            return pd.read_parquet(cache_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Price cache read failed for {ticker}: {e}")
+            return None
+
+    def _write_price_cache(self, ticker: str, df: pd.DataFrame):
+        """가격 데이터를 캐시에 저장 (임시 파일 후 교체 - 동시 스캔이 반쯤 쓴 파일을 읽지 않도록)"""
+        if not PYARROW_AVAILABLE or df.empty:
+            return
+        cache_path = self._price_cache_path(ticker)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.price_cache_dir, exist_ok=True)
+            df.to_parquet(tmp_path, compression='zstd')
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            # 캐시는 재실행 가속용 - 실패해도 스캔은 계속
+            logger.warning(f"Price cache write failed for {ticker}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     def get_price_data(self, ticker: str, market: str) -> pd.DataFrame:
-        """Fetch ~60 days of history from FinanceDataReader"""
+        """Fetch ~60 days of history from FinanceDataReader (같은 날 재실행은 로컬 캐시에서)"""
+        cached = self._read_price_cache(ticker)
+        if cached is not None:
+            return cached
         try:
             symbol = ticker
             end_date = datetime.now()
-            start_date = end_date - timedelta(days=90) # 3 months
-            return fdr.DataReader(symbol, start_date, end_date)
+            start_date = end_date - timedelta(days=PRICE_LOOKBACK_DAYS)
+            df = fdr.DataReader(symbol, start_date, end_date)
         except Exception as e:
             logger.error(f"Error for {ticker}: {e}")
             return pd.DataFrame()
+        self._write_price_cache(ticker, df)
+        return df
 
-    def detect_vcp(self, ticker: str, df: pd.DataFrame) -> dict:
-        """Analyze DataFrame for VCP pattern (FDR based)"""
-        if df.empty or len(df) < 50:
-            return None
-            
-        recent = df.tail(50)
-        
+    def _load_price_panel(self, tickers: list) -> dict:
+        """
+        daily_prices.parquet 에서 최근 PRICE_LOOKBACK_DAYS 일을 {ticker: FDR 형식 DataFrame} 으로
+        마지막 날짜가 최근 영업일까지 채워져 있을 때만 사용 (장중/갱신 전이면 빈 dict -> 종목별 FDR 조회)
+        종목별로도 마지막 날짜가 패널과 같고 빠진 날짜 없이 VCP_WINDOW 행 이상일 때만 포함
+        """
+        if not PYARROW_AVAILABLE or not os.path.exists(self.daily_prices_path):
+            return {}
+        start = pd.Timestamp(date.today() - timedelta(days=PRICE_LOOKBACK_DAYS))
         try:
-            current_price = float(recent['Close'].values[-1])
-            recent_high = float(recent['High'].max())
-        except:
-            return None
+            panel = pq.read_table(self.daily_prices_path, columns=['ticker', 'date', *PANEL_COLUMNS],
+                                  filters=[('date', '>=', start)]).to_pandas()
+        except (OSError, pa.ArrowException) as e:
+            logger.warning(f"Daily price panel read failed, fetching per ticker: {e}")
+            return {}
         
-        if recent_high == 0: return None
+        last_date = panel['date'].max() if not panel.empty else None
+        if last_date is None or last_date < pd.bdate_range(end=date.today(), periods=1)[0]:
+            return {}
+        n_sessions = panel['date'].nunique()
         
-        # 1. Price Location (Near High)
-        from_high_pct = (recent_high - current_price) / recent_high
-        near_high_check = current_price >= (recent_high * self.strategy_params['near_high_pct'])
+        panel['ticker'] = panel['ticker'].astype(str)
+        panel = panel[panel['ticker'].isin(tickers)].sort_values(['ticker', 'date'], kind='stable')
+        frames = {}
+        for ticker, group in panel.groupby('ticker', sort=False):
+            # 거래정지/일부 날짜 누락/신규 상장(이력 부족) 종목은 패널 대신 FDR 로 조회
+            if group['date'].iat[-1] != last_date or len(group) != n_sessions or len(group) < VCP_WINDOW:
+                continue
+            frames[ticker] = group.set_index('date').rename_axis('Date')[list(PANEL_COLUMNS)].rename(columns=PANEL_COLUMNS)
+        return frames
+
+    async def _fetch_price_frames(self, rows: list) -> list:
+        """
+        대상 종목 가격 데이터 동시 수집 (I/O 단계) - rows (itertuples, 6자리 ticker) 순서대로 DataFrame 반환
+        최신 daily_prices.parquet 에 있는 종목은 그대로 쓰고, 나머지만 FDR 로 조회
+        FDR 는 blocking 이라 Semaphore 로 동시 요청 수를 제한하고 전용 스레드 풀에서 실행
+        """
+        sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+        loop = asyncio.get_running_loop()
+        panel = self._load_price_panel([row.ticker for row in rows])
+        if panel:
+            logger.info(f"Using daily_prices.parquet for {len(panel)}/{len(rows)} tickers")
         
-        # 2. Contraction (Volatillity Contraction)
-        # Compare first 25 days range vs last 25 days range
-        first_half = recent.iloc[:25]
-        last_half = recent.iloc[25:]
+        async def fetch(executor, ticker, market):
+            if ticker in panel:
+                return panel[ticker]
+            async with sem:
+                return await loop.run_in_executor(executor, self.get_price_data, ticker, market)
         
-        try:
-            range1 = float(first_half['High'].max()) - float(first_half['Low'].min())
-            range2 = float(last_half['High'].max()) - float(last_half['Low'].min())
-        except:
-            return None
+        with concurrent.futures.ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as executor:
+            return await asyncio.gather(*(
+                fetch(executor, row.ticker, row.market) for row in rows))
+
+    def detect_vcp(self, ticker: str, df: pd.DataFrame, signal_date: str = None) -> dict:
+        """Analyze DataFrame for VCP pattern (FDR based)"""
+        return self.detect_vcp_batch([(ticker, df)], signal_date)[0]
+
+    def detect_vcp_batch(self, items: list, signal_date: str = None) -> list:
+        """
+        [(ticker, df), ...] 의 VCP 판정을 한 번에 - 최근 50일을 (N, 50) 배열로 쌓아 커널 한 번 호출
+        items 순서대로 detect_vcp 결과(dict 또는 None) 반환 (signal_date 미지정 시 오늘)
+        """
+        results = [None] * len(items)
+        windows = [(i, w) for i, w in enumerate(_vcp_window(df) for _, df in items) if w is not None]
+        if not windows:
+            return results
+        
+        idx = np.array([i for i, _ in windows])
+        close, high, low, volume = (np.stack([w[k] for _, w in windows]) for k in range(4))
+        stats = _vcp_batch_kernel(close, high, low, volume)
+        current_price, recent_high, range1, range2, avg_vol = stats.T
         
-        if range1 == 0: return None
-        contraction_ratio = range2 / range1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # 1. Price Location (Near High)
+            from_high_pct = (recent_high - current_price) / recent_high
+            near_high_check = current_price >= (recent_high * self.strategy_params['near_high_pct'])
+            
+            # 2. Contraction (Volatillity Contraction)
+            # Compare first 25 days range vs last 25 days range
+            contraction_ratio = range2 / np.where(range1 == 0, np.nan, range1)
+            contraction_check = contraction_ratio <= self.strategy_params['contraction_max']
         
-        contraction_check = contraction_ratio <= self.strategy_params['contraction_max']
+        # 최고가 0 / 앞 절반 변동폭 0 은 판정 불가 (NaN 비교는 False)
+        # 거래량 컬럼이 있는데 최근 25일이 전부 NaN 이면 추정 수급을 낼 수 없어 제외
+        has_volume = np.array([w[4] for _, w in windows])
+        passed = (recent_high != 0) & near_high_check & contraction_check & ~(has_volume & np.isnan(avg_vol))
+        if signal_date is None:
+            signal_date = datetime.now().strftime('%Y-%m-%d')
         
-        if near_high_check and contraction_check:
+        for j in np.flatnonzero(passed):
+            ticker = items[idx[j]][0]
+            price = float(current_price[j])
+            ratio = float(contraction_ratio[j])
             # Estimate institutional flow proxy using Volume * Price
             # This is NOT real net buy, but indicates activity
-            try:
-                avg_vol = last_half['Volume'].mean()
-                if isinstance(avg_vol, pd.Series): avg_vol = avg_vol.iloc[0]
-                est_flow = float(avg_vol) * current_price * 0.1 # 10% assumption
-            except:
-                est_flow = 0
+            est_flow = float(avg_vol[j]) * price * 0.1 if has_volume[j] else 0 # 10% assumption
             
-            return {
+            results[idx[j]] = {
                 'ticker': ticker,
-                'current_price': current_price,
-                'entry_price': current_price, # Breakout point approx
-                'score': int(100 - (from_high_pct * 100) - (contraction_ratio * 20)), # Simple scoring
-                'contraction_ratio': round(contraction_ratio, 2),
+                'current_price': price,
+                'entry_price': price, # Breakout point approx
+                'score': int(100 - (from_high_pct[j] * 100) - (ratio * 20)), # Simple scoring
+                'contraction_ratio': round(ratio, 2),
                 'foreign_5d': int(est_flow * 0.3), # Proxy
                 'inst_5d': int(est_flow * 0.4),    # Proxy
-                'signal_date': datetime.now().strftime('%Y-%m-%d')
+                'signal_date': signal_date
             }
             
-        return None
+        return results
 
     def scan_today_signals(self, mode: StrategyMode = StrategyMode.VCP_FLOW):
         """
@@ -120,158 +515,49 @@ class SignalTracker:
             logger.error("Stock list not found. Run create_stock_list.py first.")
             return []
             
-        stocks_df = pd.read_csv(self.stock_list_path)
-        targets = stocks_df.head(300)
+        # 분석에 쓰는 컬럼, 앞 SCAN_LIMIT 행만 파싱 (나머지 컬럼/행은 읽지 않음)
+        targets = pd.read_csv(self.stock_list_path, nrows=SCAN_LIMIT, usecols=lambda col: col in SCAN_COLUMNS,
+                              dtype={'ticker': str})
+        # 6자리 코드로 한 번에 패딩 - 이후 단계(수집/VCP/분석)는 row.ticker 를 그대로 사용
+        targets['ticker'] = targets['ticker'].str.zfill(6)
         
         signals = []
         
-        # Initialize NICE Modules
-        from kr_market.gates import LiquidityGuard_L1, TechnicalGate_L2, FlowGate_L3, QualityGate_L4
-        from kr_market.order_plan import PlanBuilder
-        from kr_market.evidence import EvidenceLedger
-        
-        liquidity_guard = LiquidityGuard_L1()
-        technical_gate = TechnicalGate_L2()
-        flow_gate = FlowGate_L3()
-        quality_gate = QualityGate_L4()
         evidence_ledger = EvidenceLedger()
+        evidence_ledger.begin_batch()
         
-        def process_stock(row):
-            try:
-                ticker = str(row['ticker']).zfill(6)
-                market = row['market']
-                name = row['name']
-                
-                df = self.get_price_data(ticker, market)
-                if df.empty: return None
-                
-                # --- NICE GATE LAYER ---
-                
-                # L1: Liquidity Guard (Fail Fast)
-                l1_res = liquidity_guard.evaluate(ticker, df)
-                if not l1_res.passed:
-                    # In FULL_AI / VCP_FLOW mode, strict filtering
-                    return None 
-                
-                # Mode-specific filtering
-                vcp_result = None
-                
-                # VCP detection
-                if mode in [StrategyMode.VCP_ONLY, StrategyMode.VCP_FLOW, 
-                           StrategyMode.VCP_FLOW_MACRO, StrategyMode.FULL_AI]:
-                    vcp_result = self.detect_vcp(ticker, df)
-                    if mode == StrategyMode.VCP_ONLY and not vcp_result:
-                        return None
-                        
-                # L2: Technical Gate (VCP + Palantir)
-                # Replaces old VCPGate
-                l2_res = technical_gate.evaluate(vcp_result, df)
-                
-                # Hard Fail if neither VCP nor Palantir detected in strict modes
-                # If mode is FLOW_ONLY, we might skip this
-                if mode != StrategyMode.FLOW_ONLY and not l2_res.passed:
-                     return None
-                
-                # Check Palantir Bonus
-                is_palantir = l2_res.details.get('is_palantir', False)
-                is_palantir_mini = l2_res.details.get('is_palantir_mini', False)
-
-                # Check Theme
-                from kr_market.theme_manager import ThemeManager
-                theme = ThemeManager.get_theme(ticker)
-
-                # Prepare Flow Data (Proxy for now, ideally real data)
-                # detect_vcp calculates proxies, reuse if available
-                if vcp_result:
-                     f_flow = vcp_result.get('foreign_5d', 0)
-                     i_flow = vcp_result.get('inst_5d', 0)
-                else:
-                     f_flow = 0; i_flow = 0
-                     
-                # L3: Flow Gate
-                l3_res = flow_gate.evaluate(f_flow, i_flow)
-                
-                # L4: Quality Gate (Market Cap check)
-                marcap = float(row.get('marcap', 100000000000)) 
-                l4_res = quality_gate.evaluate(marcap / 100000000) # Convert to billions for gate
-                
-                # --- SCORING ---
-                final_score = int(
-                    (l1_res.score * 0.2) + 
-                    (l2_res.score * 0.4) +  # increased weight for technical
-                    (l3_res.score * 0.2) + 
-                    (l4_res.score * 0.2)
-                )
-                
-                if theme: final_score += 10 # Theme Bonus
-                
-                # Filter by Score
-                if final_score < 50: return None
-                
-                # --- EXECUTION LAYER (L6) ---
-                current_price = df['Close'].iloc[-1]
-                pivot = None # TODO: Calculate Pivot
-                plan = PlanBuilder.create_buy_plan(ticker, int(current_price), market, pivot)
-                
-                # --- EVIDENCE LAYER (L7) ---
-                gate_results = {
-                    'L1_Liquidity': l1_res,
-                    'L2_Technical': l2_res,
-                    'L3_Flow': l3_res,
-                    'L4_Quality': l4_res
-                }
-                evidence_ledger.log_signal(ticker, gate_results, plan, final_score)
-                
-                # Build Result
-                result = vcp_result if vcp_result else {
-                    'ticker': ticker,
-                    'current_price': float(current_price),
-                    'entry_price': float(current_price),
-                    'contraction_ratio': 0,
-                    'foreign_5d': 0,
-                    'inst_5d': 0,
-                    'signal_date': datetime.now().strftime('%Y-%m-%d')
-                }
-                
-                # Enrich with Plan & Nice Info
-                result.update({
-                    'name': name,
-                    'market': market,
-                    'sector': row.get('sector', ''),
-                    'theme': theme if theme else '',
-                    'strategy_mode': mode.value,
-                    'score': final_score,
-                    'nice_tech_score': l2_res.score,
-                    'is_palantir': is_palantir,
-                    'is_palantir_mini': is_palantir_mini,
-                    'stop_loss': plan.stop_loss,
-                    'tp1': plan.tp1,
-                    'tp2': plan.tp2,
-                    'time_stop': plan.time_stop_date,
-                    'min_turnover': l1_res.details.get('turnover', 0)
-                })
-                
-                return result
-                
-            except Exception as e:
-                # logger.error(f"Error processing {row.get('ticker')}: {e}")
-                return None
-            return None
-
-        # Parallel Execution
-        with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-            futures = [executor.submit(process_stock, row) for _, row in targets.iterrows()]
-            for future in concurrent.futures.as_completed(futures):
-                res = future.result()
-                if res:
-                    signals.append(res)
-                    theme_tag = f"[{res['theme']}] " if res['theme'] else ""
-                    # Log Evidence Created
-                    print(f"🔥 Signal Found: {theme_tag}{res['name']} ({res['ticker']}) | Score: {res['score']}")
+        # I/O: 가격 데이터 동시 수집 -> CPU: 게이트 분석 (순차, 결과는 rows 순서)
+        # 행마다 Series 를 만드는 iterrows 대신 namedtuple (row.ticker / getattr(row, 'marcap', ...))
+        rows = list(targets.itertuples(index=False, name='Stock'))
+        # 스캔 중 불변 - 신호 날짜는 한 번만 포맷
+        signal_date = datetime.now().strftime('%Y-%m-%d')
+        price_frames = asyncio.run(self._fetch_price_frames(rows))
+        
+        # VCP detection - 모드가 VCP 를 쓰면 전 종목을 한 번에 판정
+        if mode in _VCP_MODES:
+            vcp_results = self.detect_vcp_batch([(row.ticker, df) for row, df in zip(rows, price_frames)], signal_date)
+        else:
+            vcp_results = [None] * len(price_frames)
+        
+        mode_args = (repeat(mode.value), repeat(mode is StrategyMode.VCP_ONLY), repeat(mode is StrategyMode.FLOW_ONLY),
+                     repeat(signal_date))
+        _init_gates()
+        analyzed = list(map(_analyze_stock, *mode_args, [row._asdict() for row in rows], price_frames, vcp_results))
+        
+        for item in analyzed:
+            if item:
+                res, gate_results, plan = item
+                # --- EVIDENCE LAYER (L7) --- 모았다가 루프 뒤 한 번에 기록
+                evidence_ledger.log_signal(res['ticker'], gate_results, plan, res['score'])
+                signals.append(res)
+                theme_tag = f"[{res['theme']}] " if res['theme'] else ""
+                # Log Evidence Created
+                print(f"🔥 Signal Found: {theme_tag}{res['name']} ({res['ticker']}) | Score: {res['score']}")
+        evidence_ledger.flush()
 
         # Save results
         if signals:
-            sigs_df = pd.DataFrame(signals)
+            sigs_df = _signals_frame(signals)
             # Standardize columns for dashboard compatibility
             sigs_df['close'] = sigs_df['current_price']
             sigs_df['foreign_net_buy_5d'] = sigs_df['foreign_5d']
@@ -298,6 +584,8 @@ class SignalTracker:
                 sigs_df['status'] = 'OPEN'
             
             sigs_df.to_csv(self.signals_log_path, index=False, encoding='utf-8-sig')
+            self._save_parquet(sigs_df)
+            self._save_binlog(sigs_df)
             logger.info(f"✅ Saved {len(signals)} signals [Mode: {mode.value}] to {self.signals_log_path}")
         else:
             logger.info(f"No signals detected today [Mode: {mode.value}].")
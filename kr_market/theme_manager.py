@@ -86,19 +86,16 @@ class ThemeManager:
         ]
     }
 
-    @staticmethod
-    def get_theme(ticker):
+    # ticker -> theme 역색인 (여러 테마에 속하면 THEMES 에서 먼저 나오는 테마 - 기존 선형 탐색과 동일)
+    _TICKER_TO_THEME = {t: theme for theme, tickers in reversed(THEMES.items()) for t in tickers}
+    _ALL_TICKERS = frozenset(_TICKER_TO_THEME)
+
+    @classmethod
+    def get_theme(cls, ticker):
         """Returns the theme name if the ticker belongs to a tracked theme, else None."""
-        # Simple lookup
-        for theme, tickers in ThemeManager.THEMES.items():
-            if ticker in tickers:
-                return theme
-        return None
+        return cls._TICKER_TO_THEME.get(ticker)
 
-    @staticmethod
-    def get_all_target_tickers():
-        """Returns a set of all tickers monitored by ThemeManager."""
-        all_tickers = set()
-        for tickers in ThemeManager.THEMES.values():
-            all_tickers.update(tickers)
-        return all_tickers
+    @classmethod
+    def get_all_target_tickers(cls):
+        """Returns a frozenset of all tickers monitored by ThemeManager."""
+        return cls._ALL_TICKERS